@@ -0,0 +1,39 @@
+"""
+Send the same message layout with new values: build the tree anew on
+every send, or compile it once with ``styles.compile()`` and fill in the
+slots (``CompiledText.render()``, and ``bind()`` as passed to a sender).
+"""
+
+from common import best, report
+
+from telekit import styles
+from telekit.styles import *
+
+def build(name: str, age: int, items: int) -> Group:
+    return Group(
+        Quote(Bold("Profile of ", Italic(name))),
+        Stack(Group("Age: ", Code(age)), Group("Items: ", Bold(items)), Link("site", url="https://e.com")),
+        Spoiler("secret & <tag>"),
+        sep="\n",
+    )
+
+PROFILE = styles.compile(
+    Quote(Bold("Profile of ", Italic(Slot("name")))),
+    Stack(Group("Age: ", Code(Slot("age"))), Group("Items: ", Bold(Slot("items"))), Link("site", url="https://e.com")),
+    Spoiler("secret & <tag>"),
+    sep="\n",
+)
+
+VALUES = dict(name="Ann <admin>", age=30, items=12)
+
+def main() -> None:
+    for parse_mode in ("html", "markdown", None):
+        assert PROFILE.render(parse_mode, **VALUES) == build(**VALUES).render(parse_mode)
+
+    for parse_mode in ("html", "markdown"):
+        report(f"rebuild + render {parse_mode}", best(lambda: build(**VALUES).render(parse_mode), 5000))
+        report(f"compiled render {parse_mode}", best(lambda: PROFILE.render(parse_mode, **VALUES), 5000))
+        report(f"compiled bind + render {parse_mode}", best(lambda: Group(PROFILE.bind(**VALUES)).render(parse_mode), 5000))
+
+if __name__ == "__main__":
+    main()
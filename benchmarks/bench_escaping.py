@@ -0,0 +1,66 @@
+"""
+Escape ASCII and emoji-heavy text for HTML and MarkdownV2 with the
+``str.replace`` chains in ``telekit._buildtext.escaping`` and with the
+alternatives they were chosen over: ``str.translate`` tables, one
+``re.sub`` pass, and ``telebot.formatting``.
+"""
+
+import re
+
+import telebot.formatting
+
+from common import best, report
+
+from telekit._buildtext.escaping import MARKDOWN_SPECIAL, escape_html, escape_markdown_chars
+
+TEXTS = {
+    "ascii, nothing to escape": "Hello world this is a plain message " * 4,
+    "ascii, special": "Order #42 is ready. Total: 15.00 (incl. tax) - <thanks> & bye! " * 4,
+    "emoji, nothing to escape": "Привет 😀👍🏽 мир 🎉 всё готово " * 4,
+    "emoji, special": "Заказ #42 готов! 😀 (итого: 15.00) <🎉> & всё " * 4,
+}
+
+_HTML_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"})
+_MARKDOWN_TABLE = str.maketrans({char: "\\" + char for char in MARKDOWN_SPECIAL + "\\"})
+_HTML_RE = re.compile(r"[&<>\"']")
+_HTML_RE_MAP = {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"}
+_MARKDOWN_RE = re.compile(r"([_*\[\]()~`>#+\-=|.!{}\\])")
+
+def html_translate(text: str) -> str:
+    return text.translate(_HTML_TABLE)
+
+def html_re(text: str) -> str:
+    return _HTML_RE.sub(lambda m: _HTML_RE_MAP[m.group()], text)
+
+def markdown_translate(text: str) -> str:
+    return text.translate(_MARKDOWN_TABLE)
+
+def markdown_re(text: str) -> str:
+    return _MARKDOWN_RE.sub(r"\\\1", text)
+
+CANDIDATES = {
+    "html": {
+        "replace chain": escape_html,
+        "translate": html_translate,
+        "re.sub": html_re,
+        "telebot": telebot.formatting.escape_html,
+    },
+    "markdown": {
+        "replace chain": escape_markdown_chars,
+        "translate": markdown_translate,
+        "re.sub": markdown_re,
+    },
+}
+
+def main() -> None:
+    for target, candidates in CANDIDATES.items():
+        for label, text in TEXTS.items():
+            expected = {fn(text) for fn in candidates.values()}
+            assert len(expected) == 1, (target, label)
+
+            print(f"{target}: {label}")
+            for name, fn in candidates.items():
+                report(f"  {name}", best(lambda: fn(text), 20000))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Render a 4096-character message with 500 entities, the largest message
+Telegram accepts, in every parse mode.
+
+Every iteration builds the tree anew, as a handler does on each send;
+building alone is measured too, so the rendering share is visible.
+"""
+
+from common import best, report
+
+from telekit.styles import *
+
+STYLES = [
+    lambda w: Bold(w),
+    lambda w: Italic(w),
+    lambda w: Underline(w),
+    lambda w: Code(w),
+    lambda w: Strikethrough(w),
+    lambda w: Spoiler(w),
+]
+
+def build() -> Group:
+    words = [STYLES[i % len(STYLES)](f"w<{i:03d}>") for i in range(500)]
+    # 500 words of 6 characters, then padding after the last space up to 4096
+    return Group(*words, "." * (4096 - 500 * 7), sep=" ")
+
+def main() -> None:
+    assert len(build().render(None)) == 4096
+
+    report("build", best(build, 200))
+    for parse_mode in ("html", "markdown", None):
+        report(f"build + render {parse_mode}", best(lambda: build().render(parse_mode), 200))
+    if hasattr(Group, "render_entities"):
+        report("build + render entities", best(lambda: build().render_entities(), 200))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Memory held by 10 000 live handlers, one per update, as when that many
+users are in the middle of a chain at once.
+
+Three kinds of handler are measured: one that only reads the command,
+one that uses `self.user`, and one that prepares a chain message with an
+inline keyboard (nothing is sent; the bot never touches the network).
+Each kind runs in a fresh interpreter. RSS growth is measured first,
+untraced; allocations are then traced with `tracemalloc`.
+"""
+
+import gc
+import itertools
+import resource
+import subprocess
+import sys
+import tracemalloc
+
+import telebot
+from telebot import types
+
+import telekit
+
+HANDLERS = 10_000
+
+class OfflineBot(telebot.TeleBot):
+    def __init__(self):
+        super().__init__("1:offline", threaded=False)
+
+    def get_me(self):
+        return types.User(1, True, "bot", username="bot")
+
+_message_ids = itertools.count(1)
+
+def make_message(user_id: int) -> types.Message:
+    user = types.User(user_id, False, "Ann", username="ann")
+    chat = types.Chat(user_id, "private", first_name="Ann")
+    message = types.Message(next(_message_ids), user, 0, chat, "text", {}, "{}")
+    message.text = "/start"
+    message.entities = [types.MessageEntity("bot_command", 0, 6)]
+    return message
+
+class CommandOnly(telekit.Handler):
+    def handle(self):
+        return self.message.text
+
+class UsesUser(telekit.Handler):
+    def handle(self):
+        return self.user.username
+
+class PreparesChain(telekit.Handler):
+    def handle(self):
+        self.chain.sender.set_title("Menu")
+        self.chain.sender.set_message("Choose an option")
+        self.chain.set_inline_keyboard({"Next": self.handle, "Back": self.handle}, row_width=2)
+
+def rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+def live_handlers(handler: type[telekit.Handler], messages: list[types.Message]) -> list[telekit.Handler]:
+    handlers = []
+    for message in messages:
+        h = handler(message)
+        h.handle()
+        handlers.append(h)
+    return handlers
+
+def measure(handler: type[telekit.Handler]) -> None:
+    telekit.Server(OfflineBot())
+    messages = [make_message(user_id) for user_id in range(1, HANDLERS + 1)]
+
+    gc.collect()
+    before = rss_bytes()
+    handlers = live_handlers(handler, messages)
+    grown = rss_bytes() - before
+    del handlers
+    gc.collect()
+
+    tracemalloc.start()
+    handlers = live_handlers(handler, messages)
+    stats = tracemalloc.take_snapshot().statistics("filename")
+    tracemalloc.stop()
+    size = sum(stat.size for stat in stats)
+    blocks = sum(stat.count for stat in stats)
+
+    print(
+        f"{handler.__name__:<16}"
+        f" {size / len(messages):8.0f} B/update"
+        f" {blocks / len(messages):6.1f} blocks/update"
+        f" RSS +{grown / 2**20:6.1f} MB"
+    )
+
+KINDS: dict[str, type[telekit.Handler]] = {
+    handler.__name__: handler for handler in (CommandOnly, UsesUser, PreparesChain)
+}
+
+def main() -> None:
+    if len(sys.argv) > 1:
+        measure(KINDS[sys.argv[1]])
+        return
+    for name in KINDS:
+        subprocess.run([sys.executable, __file__, name], check=True)
+
+if __name__ == "__main__":
+    main()
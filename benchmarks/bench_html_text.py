@@ -0,0 +1,65 @@
+"""
+Tokenize a 1 MB HTML document with ``HTMLText`` and slice, chunk and
+stream it.
+
+The document is seeded random prose with inline tags, entities, emoji
+and paragraph breaks. Peak memory of the tokenized text is traced too.
+"""
+
+import random
+import time
+import tracemalloc
+
+from common import best, report
+
+from telekit.html_text import HTMLText
+
+SIZE = 1_000_000
+
+def document(size: int) -> str:
+    r = random.Random(5)
+    words = ["lorem", "ipsum", "dolor", "sit", "amet", "&amp;", "😀", "x &lt; y"]
+    parts: list[str] = []
+    length = 0
+    while length < size:
+        sentence = " ".join(r.choice(words) for _ in range(r.randint(3, 30)))
+        tag = r.choice(["b", "i", "u", "code", None, None])
+        part = f"<{tag}>{sentence}</{tag}>. " if tag else sentence + ". "
+        if r.random() < 0.05:
+            part += "\n\n"
+        parts.append(part)
+        length += len(part)
+    return "".join(parts)
+
+def main() -> None:
+    html = document(SIZE)
+    r = random.Random(1)
+
+    report("tokenize 1 MB", best(lambda: HTMLText(html), 1, repeat=3))
+
+    tracemalloc.start()
+    text = HTMLText(html)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{'  peak memory':<40} {peak / 2**20:10.1f} MB")
+
+    started = time.perf_counter()
+    text[5:6]
+    report("first slice (builds tag snapshots)", time.perf_counter() - started)
+
+    n = len(text)
+    report("slice 4000 chars from the middle", best(lambda: text[n // 2 : n // 2 + 4000], 20))
+    report("slice the last 4000 chars", best(lambda: text[-4000:], 20))
+    starts = [r.randrange(n - 500) for _ in range(100)]
+    report("100 random 500-char slices", best(lambda: [text[a : a + 500] for a in starts], 1))
+    report("chunk(4096), all pages", best(lambda: sum(1 for _ in text.chunk(4096)), 1, repeat=3))
+    report(
+        "chunk(4096, split_at=' '), all pages",
+        best(lambda: sum(1 for _ in text.chunk(4096, split_at=" ", window=100)), 1, repeat=3),
+    )
+
+    frames = HTMLText(html[:6000])
+    report("stream(10) over 6000 chars", best(lambda: sum(1 for _ in frames.stream(10)), 1))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Open an HTML book of about 500 pages with ``PaginatedText`` and press
+"Next" until the last page.
+
+The trait runs against a stand-in chain that keeps the page and the
+keyboard instead of sending them, so the numbers are the trait's own:
+splitting, page rendering and keyboard building. The first pass splits
+the book; the second reads it again from the page cache, as a second
+user would.
+"""
+
+import random
+import time
+
+from telekit.traits import PaginatedText
+
+PAGES = 500
+
+class _Sender:
+    _title = None
+    _additional = None
+
+    def set_message(self, message) -> None:
+        self.message = message
+
+class _Chain:
+    def __init__(self) -> None:
+        self.sender = _Sender()
+
+    def set_inline_choice(self, callback, keyboard, widths) -> None:
+        self.callback = callback
+        self.keyboard = keyboard
+
+    def edit(self) -> None:
+        pass
+
+class Reader(PaginatedText):
+    def __init__(self) -> None:
+        self.chain = _Chain()
+
+def book(pages: int) -> str:
+    r = random.Random(2)
+    words = ["the", "quick", "brown", "fox", "jumps", "over", "lazy", "dog,", "and",
+             "then.", "Tom", "&amp;", "Jerry", "said", "“hi”!", "😀"]
+    paragraphs: list[str] = []
+    length = 0
+    while length < pages * 4300:
+        sentence = " ".join(r.choice(words) for _ in range(r.randint(40, 160)))
+        if r.random() < 0.3:
+            i = sentence.find(" ", r.randrange(len(sentence)))
+            if i > 0:
+                sentence = f"{sentence[:i]} <b>{sentence[i + 1:i + 40]}</b>{sentence[i + 40:]}"
+        if r.random() < 0.1:
+            sentence = f"<i>{sentence}</i>"
+        paragraphs.append(sentence)
+        length += len(sentence) + 2
+    return "\n\n".join(paragraphs)
+
+def read_through(text: str) -> tuple[float, float, int]:
+    """Seconds to the first page, seconds for the whole book, pages read."""
+    reader = Reader()
+    next_label = reader.PAGINATED_TEXT_NEXT_LABEL
+
+    started = time.perf_counter()
+    reader.paginated_text(text)
+    first = time.perf_counter() - started
+    read = 1
+    while next_label in reader.chain.keyboard:
+        reader.chain.callback(reader.chain.keyboard[next_label])
+        read += 1
+    return first, time.perf_counter() - started, read
+
+def main() -> None:
+    text = book(PAGES)
+    for label in ("cold", "cached"):
+        first, total, read = read_through(text)
+        print(
+            f"{label:<7} {len(text) / 2**20:.1f} MB, {read} pages:"
+            f" first page {first * 1e3:8.1f} ms, all pages {total * 1e3:8.1f} ms"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Sanitize 100 KB of pathological MarkdownV2: unclosed openers, openers
+that close only at the very end, and deep quote nesting.
+
+Each input is also sanitized at half its size. A linear sanitizer takes
+about half the time there; a ratio near 4 means quadratic rescans.
+"""
+
+import random
+
+from common import best, report
+
+from telekit.utils import sanitize_markdown
+
+SIZE = 100_000
+
+def inputs(size: int) -> dict[str, str]:
+    r = random.Random(1)
+    return {
+        "'[' * n": "[" * size,
+        "'[a' * n": "[a" * (size // 2),
+        "'[a](b' * n": "[a](b" * (size // 5),
+        "'_*' * n": "_*" * (size // 2),
+        "'|`' * n, then '||' * n": "|`" * (size // 4) + "||" * (size // 4),
+        "'*' + '`' * n": "*" + "`" * size,
+        "'>' * n": ">" * size,
+        "random specials": "".join(r.choice("*_~|`[]()>\\a ") for _ in range(size)),
+        "plain markdown": ("*Bold*, _italic_, `code` and [a link](https://e.com). " * size)[:size],
+    }
+
+def main() -> None:
+    half = inputs(SIZE // 2)
+    for name, text in inputs(SIZE).items():
+        try:
+            full_time = best(lambda: sanitize_markdown(text), 1)
+            half_time = best(lambda: sanitize_markdown(half[name]), 1)
+        except RecursionError:
+            print(f"{name:<40} RecursionError")
+            continue
+        report(f"{name} (x{full_time / half_time:.1f} vs half)", full_time)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+"""
+Helpers shared by the benchmark scripts in this directory.
+
+Each script is standalone; run it from the repository root::
+
+    PYTHONPATH=. python benchmarks/bench_formatter.py
+
+Numbers are the best of several runs, so they describe the code rather
+than the noise of the machine. Run a script on two checkouts to compare
+a change against its parent commit.
+"""
+
+import timeit
+from typing import Any, Callable
+
+def best(fn: Callable[[], Any], number: int, repeat: int = 5) -> float:
+    """Best time of one ``fn()`` call, in seconds."""
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number
+
+def report(label: str, seconds: float) -> None:
+    if seconds >= 1e-3:
+        print(f"{label:<40} {seconds * 1e3:10.2f} ms")
+    else:
+        print(f"{label:<40} {seconds * 1e6:10.2f} us")
@@ -43,6 +43,7 @@ from . import utils
 from . import traits
 from . import debug
 from . import scheduler
+from . import middleware
 from . import chat
 from . import html_text
 
@@ -60,6 +61,7 @@ __all__ = [
     "inline_buttons",
     "dices",
     "scheduler",
+    "middleware",
     "chat",
     "html_text",
 
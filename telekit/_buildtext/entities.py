@@ -0,0 +1,259 @@
+# 
+# Copyright (C) 2026 Romashka
+# 
+# This file is part of Telekit.
+# 
+# Telekit is free software: you can redistribute it and/or modify it 
+# under the terms of the GNU General Public License as published by 
+# the Free Software Foundation, either version 3 of the License, or 
+# (at your option) any later version.
+# 
+# Telekit is distributed in the hope that it will be useful, 
+# but WITHOUT ANY WARRANTY; without even the implied warranty 
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See 
+# the GNU General Public License for more details.
+# 
+# You should have received a copy of the GNU General Public License 
+# along with Telekit. If not, see <https://www.gnu.org/licenses/>.
+# 
+
+"""
+The ``"entities"`` render target: plain text plus a list of ``MessageEntity``,
+sent with ``entities=`` / ``caption_entities=`` instead of a parse mode.
+
+Telegram measures entity offsets and lengths in UTF-16 code units, so every
+fragment written to the buffer adds its UTF-16 length to a running offset.
+"""
+
+import re
+from html import unescape
+from typing import Any
+
+from telebot.types import MessageEntity
+
+
+def utf16_len(text: str) -> int:
+    """Length of ``text`` in UTF-16 code units, as Telegram counts it."""
+    if text.isascii():
+        return len(text)
+    # characters outside the BMP (most emoji) take two code units
+    return len(text.encode("utf-16-le")) >> 1
+
+
+class EntityFragment(str):
+    """A rendered string that carries its entities, offsets relative to its start."""
+
+    entities: tuple[MessageEntity, ...]
+
+
+class EntityBuffer(list[str]):
+    """
+    Output list of the writer protocol in ``"entities"`` mode (see ``TextEntity._write``).
+
+    Behaves like the plain list of fragments the other modes use,
+    and additionally keeps the UTF-16 length of its text and the closed entities.
+    """
+
+    __slots__ = ("length", "entities")
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.length: int = 0
+        self.entities: list[MessageEntity] = []
+
+    def append(self, text: str) -> None:
+        offset: int = self.length
+        super().append(text)
+        self.length = offset + utf16_len(text)
+
+        if type(text) is EntityFragment:
+            self._insert(text.entities, offset)
+
+    def add(self, start: int, kind: str, **fields: Any) -> None:
+        """Closes an entity of type ``kind`` that started at UTF-16 offset ``start`` and spans up to the current end."""
+        length: int = self.length - start
+        if length > 0:
+            self.entities.append(MessageEntity(kind, start, length, **fields))
+
+    def replace_tail(self, start: int, text: str) -> None:
+        """
+        Replaces the fragments from index ``start`` on with ``text``, their joined content
+        transformed by some wrapper. Entities inside keep their place if ``text`` still
+        contains the content unchanged, otherwise they are dropped.
+        """
+        content: str = "".join(self[start:])
+        offset: int = self.length - utf16_len(content)
+        inner: list[MessageEntity] = [entity for entity in self.entities if entity.offset >= offset]
+
+        del self.entities[len(self.entities) - len(inner):]
+        del self[start:]
+        list.append(self, text)
+        self.length = offset + utf16_len(text)
+
+        position: int = text.find(content) if inner else -1
+        if position >= 0:
+            self._insert(inner, offset + utf16_len(text[:position]))
+
+    def _insert(self, entities: Any, offset: int) -> None:
+        for entity in entities:
+            self.entities.append(MessageEntity(
+                entity.type, entity.offset + offset, entity.length,
+                url=entity.url, user=entity.user, language=entity.language, custom_emoji_id=entity.custom_emoji_id
+            ))
+
+    def fragment(self) -> EntityFragment:
+        return make_fragment("".join(self), self.entities)
+
+    def result(self) -> tuple[str, list[MessageEntity]]:
+        # inner entities are closed first; Telegram expects them ordered by offset, outer first
+        self.entities.sort(key=_entity_order)
+        return "".join(self), self.entities
+
+
+def _entity_order(entity: MessageEntity) -> tuple[int, int]:
+    return entity.offset, -entity.length
+
+
+def make_fragment(text: str, entities: Any = ()) -> EntityFragment:
+    fragment = EntityFragment(text)
+    fragment.entities = tuple(entities)
+    return fragment
+
+
+def slice_fragment(fragment: EntityFragment, start: int, stop: int) -> EntityFragment:
+    """
+    The part of a rendered fragment between UTF-16 offsets ``start`` and ``stop``
+    (both on character boundaries); its entities are shifted and clipped to it.
+    """
+    text: str = str(fragment)
+
+    if start == 0 and stop >= utf16_len(text):
+        return fragment
+
+    # the offsets index the UTF-16 encoding directly
+    encoded: bytes = text.encode("utf-16-le")
+    part: str = encoded[start * 2:stop * 2].decode("utf-16-le")
+    entities: list[MessageEntity] = []
+
+    for entity in fragment.entities:
+        begin: int = max(entity.offset, start)
+        end: int = min(entity.offset + entity.length, stop)
+        if end > begin:
+            entities.append(MessageEntity(
+                entity.type, begin - start, end - begin,
+                url=entity.url, user=entity.user, language=entity.language, custom_emoji_id=entity.custom_emoji_id
+            ))
+
+    return make_fragment(part, entities)
+
+
+def strip_fragment(fragment: EntityFragment, chars: str | None = None, *, left: bool = True, right: bool = True) -> EntityFragment:
+    """``str.strip`` for a rendered fragment: its entities are shifted and clipped to the stripped text."""
+    text: str = str(fragment)
+    stripped: str = text.lstrip(chars) if left else text
+    head: int = utf16_len(text[:len(text) - len(stripped)])
+
+    if right:
+        stripped = stripped.rstrip(chars)
+
+    if stripped == text:
+        return fragment
+
+    return slice_fragment(fragment, head, head + utf16_len(stripped))
+
+
+# Telegram HTML (https://core.telegram.org/bots/api#html-style) -> entity type
+_HTML_TAGS: dict[str, str] = {
+    "b": "bold", "strong": "bold",
+    "i": "italic", "em": "italic",
+    "u": "underline", "ins": "underline",
+    "s": "strikethrough", "strike": "strikethrough", "del": "strikethrough",
+    "tg-spoiler": "spoiler",
+    "code": "code",
+    "pre": "pre",
+    "a": "text_link",
+    "blockquote": "blockquote",
+    "tg-emoji": "custom_emoji",
+}
+
+_HTML_MARKUP_RE = re.compile(r"<(/?)([a-zA-Z][\w-]*)((?:[^>\"']|\"[^\"]*\"|'[^']*')*)>")
+_HTML_ATTR_RE = re.compile(r"""([\w-]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+)))?""")
+
+
+def _html_attributes(text: str) -> dict[str, str]:
+    return {
+        match.group(1).lower(): unescape(match.group(2) or match.group(3) or match.group(4) or "")
+        for match in _HTML_ATTR_RE.finditer(text)
+    }
+
+
+def _html_entity(name: str, attributes: str, pre: dict[str, Any] | None) -> dict[str, Any] | None:
+    """``MessageEntity`` fields for an opening tag, ``None`` for tags Telegram has no entity for."""
+    kind: str | None = _HTML_TAGS.get(name)
+    attrs: dict[str, str] = _html_attributes(attributes) if attributes.strip() else {}
+
+    if name == "span" and attrs.get("class") == "tg-spoiler":
+        kind = "spoiler"
+
+    match kind:
+        case None:
+            return None
+        case "code" if pre is not None and attrs.get("class", "").startswith("language-"):
+            # <pre><code class="language-x"> is one pre entity with a language
+            pre["language"] = attrs["class"].removeprefix("language-")
+            return None
+        case "pre":
+            # `Language` writes the language as an attribute
+            return {"kind": kind, "language": attrs.get("language")}
+        case "text_link":
+            return {"kind": kind, "url": attrs.get("href", "")}
+        case "blockquote" if "expandable" in attrs:
+            return {"kind": "expandable_blockquote"}
+        case "custom_emoji":
+            return {"kind": kind, "custom_emoji_id": attrs.get("emoji-id")}
+        case _:
+            return {"kind": kind}
+
+
+def html_fragment(html: str) -> EntityFragment:
+    """
+    Reads Telegram HTML into its visible text and the entities its tags stand for,
+    as Telegram would with ``parse_mode="HTML"``. Unknown tags are dropped, their text is kept;
+    tags left open are closed at the end.
+    """
+    buffer = EntityBuffer()
+    # name, entity fields and start offset of every open tag
+    stack: list[tuple[str, dict[str, Any] | None, int]] = []
+    position: int = 0
+
+    for match in _HTML_MARKUP_RE.finditer(html):
+        if match.start() > position:
+            buffer.append(unescape(html[position:match.start()]))
+        position = match.end()
+
+        closing, name, attributes = match.groups()
+        name = name.lower()
+
+        if not closing:
+            pre: dict[str, Any] | None = next((fields for tag, fields, _ in reversed(stack) if tag == "pre"), None)
+            stack.append((name, _html_entity(name, attributes, pre), buffer.length))
+            continue
+
+        for index in range(len(stack) - 1, -1, -1):
+            if stack[index][0] == name:
+                # tags opened inside and not closed end here too
+                for _, fields, start in reversed(stack[index:]):
+                    if fields is not None:
+                        buffer.add(start, **fields)
+                del stack[index:]
+                break
+
+    if position < len(html):
+        buffer.append(unescape(html[position:]))
+
+    for _, fields, start in reversed(stack):
+        if fields is not None:
+            buffer.add(start, **fields)
+
+    text, entities = buffer.result()
+    return make_fragment(text, entities)
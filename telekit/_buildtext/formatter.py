@@ -18,12 +18,17 @@
 # 
 
 import sys
-from typing import Any, Literal, TYPE_CHECKING, Union
+from typing import Any, Iterable, Literal, Sequence, TYPE_CHECKING, Union
 
-import telebot.formatting
+from .escaping import escape_html, escape_markdown
+from .entities import EntityBuffer
 
 if TYPE_CHECKING: 
     from string.templatelib import Template, Interpolation # pyright: ignore[reportMissingImports]
+    from telebot.types import MessageEntity
+
+# the parse modes the writer works in; "entities" only through `render_entities`
+WriteMode = Literal["html", "markdown", "entities"] | None
 
 _HAS_TEMPLATE_LIB = sys.version_info >= (3, 14)
 
@@ -32,6 +37,19 @@ if _HAS_TEMPLATE_LIB:
 else:
     _Template = None
 
+# string API of `TextEntity`; subclasses overriding it are rendered through it
+_RENDER_METHODS: tuple[str, ...] = ("render", "render_markdown", "render_html", "render_none")
+
+# methods that decide what an entity renders to
+_RENDER_HOOKS: tuple[str, ...] = _RENDER_METHODS + (
+    "_render_content", "_write", "_write_entity", "_write_content",
+    "_render_markdown", "_render_html", "_render_none", "_render_any",
+    "_post_render", "_affixes", "_wrap"
+)
+
+# leaves whose rendering can not change later
+_FROZEN_LEAVES: tuple[type, ...] = (str, int, float, type(None))
+
 class TextEntity:
     def __init__(self, *content, escape: bool = True, sep: Union["TextEntity", str, "Template"] = "", enabled: bool | Any = True):
         self._content = content
@@ -42,7 +60,7 @@ class TextEntity:
     def __add__(self, other):
         if isinstance(other, (str, TextEntity)) \
         or (_HAS_TEMPLATE_LIB and isinstance(other, _Template)): # pyright: ignore[reportArgumentType]
-            return Group(self, other)
+            return Group._concat(self, other)
         raise TypeError(f"Cannot add {type(other)} to TextEntity")
 
     def __radd__(self, other):
@@ -77,13 +95,13 @@ class TextEntity:
         return self.render_none()
     
     def render_markdown(self) -> str:
-        return self._render_content("markdown")
+        return self._render("markdown")
 
     def render_html(self) -> str:
-        return self._render_content("html")
+        return self._render("html")
     
     def render_none(self) -> str:
-        return self._render_content(None)
+        return self._render(None)
     
     def render(self, parse_mode: Literal["html", "markdown"] | None) -> str:
         match parse_mode:
@@ -93,22 +111,200 @@ class TextEntity:
                 return self.render_markdown()
             case _:
                 return self.render_none()
-    
-    def _render_content(self, parse_mode: Literal["html", "markdown"] | None) -> str:
-        sep: str = self._render_item(self._separator, parse_mode)
 
-        return sep.join(
-            self._render_item(item, parse_mode) for item in self._content
-        )
+    def render_entities(self) -> tuple[str, list["MessageEntity"]]:
+        """
+        Renders the entity as plain text and the ``MessageEntity`` list that formats it,
+        to be sent with ``entities=`` / ``caption_entities=`` instead of a parse mode.
+        Offsets and lengths are in UTF-16 code units, as Telegram expects.
+
+        >>> text, entities = Bold("Hi ", Italic("there")).render_entities()
+        >>> text, [(e.type, e.offset, e.length) for e in entities]
+        ('Hi there', [('bold', 0, 8), ('italic', 3, 5)])
+        """
+        out = EntityBuffer()
+        self._write(out, "entities")
+        return out.result()
+
+    # Rendering
+    #
+    # The whole tree is written into one shared list of fragments that is joined
+    # once at the end, instead of every nested entity building its own string:
+    #
+    # - `_write(out, parse_mode)`         — writes the entity as a child of another one
+    # - `_write_entity(out, parse_mode)`  — writes the entity with its own formatting
+    # - `_write_content(out, parse_mode)` — writes only the content, joined by the separator
+    #
+    # Subclasses that still override the string API (`render*`, `_render_content`)
+    # are rendered through it, see `__init_subclass__`.
+    #
+    # While compiling a template (`styles.compile`), `out` also holds `Slot`s in place of values.
+    # With parse_mode="entities" (`render_entities`), `out` is an `EntityBuffer` that keeps
+    # the UTF-16 length of the text so far; wrappers add a `MessageEntity` instead of markup.
+
+    #
+    # Entities never change after creation, so an entity whose whole subtree is
+    # immutable (see `_is_frozen`) keeps its output per parse mode: from its first
+    # top-level render on, and once it is written a second time inside other
+    # entities (i.e. it is shared). Output kept by a top-level render is reused
+    # only after `_is_frozen` confirms it. Mutable entities (`TextBuilder`) set
+    # `_memoizable = False`.
+
+    _memoizable: bool = True
+    _frozen: bool | None = None
+    _rendered: dict[str | None, str] | None = None
+    _writes: int = 0
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+
+        attrs = vars(cls)
+
+        if "_render_content" in attrs and "_write_content" not in attrs:
+            cls._write_content = TextEntity._write_rendered_content
+
+        if "_memoizable" not in attrs \
+        and cls.__module__.partition(".")[0] != "telekit" \
+        and any(name in attrs for name in _RENDER_HOOKS):
+            # custom render code may depend on more than the entity's content
+            cls._memoizable = False
+        
+        if "_write" in attrs:
+            return
+        
+        if "_write_entity" not in attrs and any(name in attrs for name in _RENDER_METHODS):
+            cls._write = TextEntity._write_rendered
+        elif cls._memoizable:
+            cls._write = TextEntity._write
+        elif "_write_entity" in attrs or cls._write is not TextEntity._write_rendered:
+            # skip one call per node
+            cls._write = cls._write_entity
+
+    def _render(self, parse_mode: Literal["html", "markdown"] | None) -> str:
+        rendered = self._rendered
+
+        if rendered is not None:
+            text = rendered.get(parse_mode)
+            if text is not None:
+                if self._is_frozen():
+                    return text
+                self._rendered = None
+
+        out: list[str] = []
+        self._write_entity(out, parse_mode)
+        text = _joined(out)
+
+        # most trees are built, rendered once and dropped: keep the output,
+        # but check that the tree is frozen only when it is rendered again
+        if self._memoizable and self._frozen is not False:
+            self._remember(parse_mode, text)
+
+        return text
+
+    def _remember(self, parse_mode: Literal["html", "markdown"] | None, text: str) -> None:
+        if self._rendered is None:
+            self._rendered = {}
+        self._rendered[parse_mode] = text
+
+    def _is_frozen(self) -> bool:
+        """Whether the rendering of this entity can never change."""
+        frozen = self._frozen
+
+        if frozen is None:
+            frozen = self._frozen = self._memoizable and all(
+                item._is_frozen() if isinstance(item, TextEntity) else isinstance(item, _FROZEN_LEAVES)
+                for item in self._frozen_items()
+            )
+
+        return frozen
+
+    def _frozen_items(self) -> Iterable[Any]:
+        """Everything the rendering depends on besides immutable attributes."""
+        yield from self._content
+        yield self._separator
+        yield self._enabled
+
+    def _render_content(self, parse_mode: WriteMode) -> str:
+        out: list[str] = []
+
+        # closest writer that does not call an overridden `_render_content` back
+        for klass in type(self).__mro__:
+            write = vars(klass).get("_write_content")
+            if write is not None and write is not TextEntity._write_rendered_content:
+                write(self, out, parse_mode)
+                break
+
+        return _joined(out)
+
+    def _write(self, out: list[str], parse_mode: WriteMode) -> None:
+        rendered = self._rendered
+
+        if rendered is not None:
+            text = rendered.get(parse_mode)
+            if text is not None and self._is_frozen():
+                out.append(text)
+                return
+        elif not self._writes:
+            self._writes = 1
+            self._write_entity(out, parse_mode)
+            return
+
+        # written or rendered before: the entity is shared, keep its output if it can not change
+        start: int = len(out)
+        self._write_entity(out, parse_mode)
+
+        if parse_mode != "entities" and self._is_frozen():
+            text = "".join(out[start:])
+            del out[start:]
+            out.append(text)
+            self._remember(parse_mode, text)
+
+    def _write_entity(self, out: list[str], parse_mode: WriteMode) -> None:
+        self._write_content(out, parse_mode)
+
+    def _write_content(self, out: list[str], parse_mode: WriteMode) -> None:
+        self._write_items(out, self._content, parse_mode)
+
+    def _write_items(self, out: list[str], items: Sequence[Any], parse_mode: WriteMode) -> None:
+        if not items:
+            return
+
+        separator = self._separator
+        sep: str = separator if separator == "" else self._render_item(separator, parse_mode)
+        write_item = self._write_item
 
-    def _render_item(self, item: Union[str, "TextEntity", "Template"], parse_mode: Literal["html", "markdown"] | None) -> str:
-        if _HAS_TEMPLATE_LIB and isinstance(item, _Template): # pyright: ignore[reportArgumentType]
-            return self._render_template(item, parse_mode)    # pyright: ignore[reportAttributeAccessIssue]
+        for index, item in enumerate(items):
+            if index and sep:
+                out.append(sep)
+            write_item(out, item, parse_mode)
+
+    def _write_rendered(self, out: list[str], parse_mode: WriteMode) -> None:
+        # the string API has no entities: they get its plain text
+        out.append(self.render(None if parse_mode == "entities" else parse_mode))
+
+    def _write_rendered_content(self, out: list[str], parse_mode: WriteMode) -> None:
+        out.append(self._render_content(parse_mode))
+
+    def _write_item(self, out: list[str], item: Union[str, "TextEntity", "Template"], parse_mode: WriteMode) -> None:
         if isinstance(item, TextEntity):
-            return item.render(parse_mode)
-        return self._maybe_escape(item, parse_mode)
+            item._write(out, parse_mode)
+        elif _HAS_TEMPLATE_LIB and isinstance(item, _Template): # pyright: ignore[reportArgumentType]
+            self._write_template(out, item, parse_mode)          # pyright: ignore[reportArgumentType]
+        else:
+            out.append(self._maybe_escape(item, parse_mode))
+
+    def _render_item(self, item: Union[str, "TextEntity", "Template"], parse_mode: WriteMode) -> str:
+        if parse_mode == "entities":
+            # a string that carries its entities into the buffer it is appended to
+            buffer = EntityBuffer()
+            self._write_item(buffer, item, parse_mode)
+            return buffer.fragment()
+
+        out: list[str] = []
+        self._write_item(out, item, parse_mode)
+        return _joined(out)
     
-    def _render_template(self, template: "Template", parse_mode: Literal["html", "markdown"] | None) -> str:
+    def _write_template(self, out: list[str], template: "Template", parse_mode: WriteMode) -> None:
         """
         Unwraps a Template (t-string) into a Group: static text chunks
         go through normal escaping, while interpolations are either
@@ -141,22 +337,22 @@ class TextEntity:
 
                     parts.append(value)
 
-        return Group(*parts, escape=self._escape_strings).render(parse_mode)
+        Group(*parts, escape=self._escape_strings)._write(out, parse_mode)
     
-    def _maybe_escape(self, item: Any, parse_mode: Literal["html", "markdown"] | None) -> str:
+    def _maybe_escape(self, item: Any, parse_mode: WriteMode) -> str:
         if self._escape_strings:
             return self._escape(item, parse_mode)
         else:
             return str(item)
         
-    def _escape(self, text: Any, parse_mode: Literal["html", "markdown"] | None) -> str:
+    def _escape(self, text: Any, parse_mode: WriteMode) -> str:
         text = str(text)
 
         match parse_mode:
             case "html":
-                return telebot.formatting.escape_html(text)
+                return escape_html(text)
             case "markdown":
-                return telebot.formatting.escape_markdown(text)
+                return escape_markdown(text)
             case _:
                 return text
             
@@ -182,23 +378,46 @@ class TextEntity:
         debug_style(self, label=label, parse_mode=parse_mode)
             
 class EasyTextEntity(TextEntity):
-    def render_markdown(self) -> str:
-        content = self._render_content("markdown")
-        if not self._enabled:
-            return content
-        return self._render_markdown(content)
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
 
-    def render_html(self) -> str:
-        content = self._render_content("html")
-        if not self._enabled:
-            return content
-        return self._render_html(content)
-    
-    def render_none(self) -> str:
-        content = self._render_content(None)
+        # a subclass that redefines a wrapper but not its affixes is wrapped through the wrapper
+        attrs = vars(cls)
+        if "_affixes" not in attrs and any(name in attrs for name in ("_render_markdown", "_render_html", "_render_none")):
+            cls._affixes = EasyTextEntity._affixes
+
+    def _write_entity(self, out: list[str], parse_mode: WriteMode) -> None:
         if not self._enabled:
-            return content
-        return self._render_none(content)
+            self._write_content(out, parse_mode)
+            return
+        
+        if isinstance(out, EntityBuffer) and (fields := self._message_entity()) is not None:
+            start: int = out.length
+            self._write_content(out, parse_mode)
+            out.add(start, **fields)
+            return
+        
+        affixes = self._affixes(parse_mode)
+
+        if affixes is not None:
+            out.append(affixes[0])
+            self._write_content(out, parse_mode)
+            out.append(affixes[1])
+            return
+        
+        start: int = len(out)
+        self._write_content(out, parse_mode)
+        content: str = _joined(out[start:])
+        _replace_tail(out, start, self._wrap(content, parse_mode))
+
+    def _wrap(self, content: str, parse_mode: WriteMode) -> str:
+        match parse_mode:
+            case "html":
+                return self._render_html(content)
+            case "markdown":
+                return self._render_markdown(content)
+            case _:
+                return self._render_none(content)
     
     # redefine
 
@@ -211,15 +430,26 @@ class EasyTextEntity(TextEntity):
     def _render_none(self, content: str) -> str:
         return content
     
-class EasyTextEntityWithPostRender(EasyTextEntity):
-    def render_markdown(self) -> str:
-        return self._post_render(super().render_markdown())
+    def _affixes(self, parse_mode: WriteMode) -> tuple[str, str] | None:
+        """
+        ``(prefix, suffix)`` the wrapper adds around the content, or ``None``
+        if it has to see the rendered content (the content is then wrapped as a string).
+        """
+        return None
 
-    def render_html(self) -> str:
-        return self._post_render(super().render_html())
+    def _message_entity(self) -> dict[str, Any] | None:
+        """
+        ``MessageEntity`` fields (``kind`` and e.g. ``url``) for ``render_entities``, or ``None``
+        if Telegram has no such entity (the content is then wrapped like plain text).
+        """
+        return None
     
-    def render_none(self) -> str:
-        return self._post_render(super().render_none())
+class EasyTextEntityWithPostRender(EasyTextEntity):
+    def _write_entity(self, out: list[str], parse_mode: WriteMode) -> None:
+        start: int = len(out)
+        super()._write_entity(out, parse_mode)
+        rendered: str = _joined(out[start:])
+        _replace_tail(out, start, self._post_render(rendered))
     
     # redefine
 
@@ -229,35 +459,103 @@ class EasyTextEntityWithPostRender(EasyTextEntity):
     # + redefine: _render_markdown, _render_html, _render_none
     
 class StaticTextEntity(TextEntity):
-    def render_markdown(self) -> str:
-        content: str = self._render_content("markdown")
+    def _write_entity(self, out: list[str], parse_mode: WriteMode) -> None:
         if not self._enabled:
-            return content
-        return self._render_any(content)
-
-    def render_html(self) -> str:
-        content: str = self._render_content("html")
-        if not self._enabled:
-            return content
-        return self._render_any(content)
-    
-    def render_none(self) -> str:
-        content: str = self._render_content(None)
-        if not self._enabled:
-            return content
-        return self._render_any(content)
+            self._write_content(out, parse_mode)
+            return
+        
+        start: int = len(out)
+        self._write_content(out, parse_mode)
+        content: str = _joined(out[start:])
+        _replace_tail(out, start, self._render_any(content))
     
     # redefine
 
     def _render_any(self, content: str) -> str:
         return content
 
+class _SlotInsideError(Exception):
+    """
+    Raised while compiling a template (``styles.compile``) when a ``Slot`` reaches an entity
+    that has to see its whole content as text: the template can not be compiled for that parse mode.
+    """
+
+def _joined(fragments: list[str]) -> str:
+    """``"".join(fragments)`` for content an entity transforms as a whole."""
+    try:
+        return "".join(fragments)
+    except TypeError:
+        # written fragments are strings, except the `Slot`s of a template being compiled
+        if any(not isinstance(fragment, str) for fragment in fragments):
+            raise _SlotInsideError() from None
+        raise
+
+def _replace_tail(out: list[str], start: int, text: str) -> None:
+    """Replaces the fragments ``out[start:]`` with ``text``."""
+    if type(out) is EntityBuffer:
+        # entities written inside have to be moved along
+        out.replace_tail(start, text)
+    else:
+        del out[start:]
+        out.append(text)
+
 # Grouping
 
 class Group(TextEntity):
     def __init__(self, *content, escape: bool = True, sep: Union[str, "TextEntity", "Template"] = "", enabled: bool | Any = True):
         super().__init__(*content, escape=escape, sep=sep, enabled=enabled)
 
+        # `+` may append to this list in place (see `_concat`); the group only owns the first `_size` items
+        self._content: list[Any] = list(content)
+        self._size: int = len(content)
+
+    def _write_content(self, out: list[str], parse_mode: WriteMode) -> None:
+        items = self._content
+        if len(items) != self._size:
+            items = items[:self._size]
+        self._write_items(out, items, parse_mode)
+
+    def _frozen_items(self) -> Iterable[Any]:
+        yield from self._content[:self._size]
+        yield self._separator
+
+    def _flat_items(self) -> list[Any] | None:
+        """Items of a plain group (no separator, escaped strings) that can be merged into another one."""
+        if type(self) is Group and self._escape_strings is True and self._separator == "":
+            return self._content
+        return None
+
+    @staticmethod
+    def _concat(left: TextEntity, right: Any) -> "Group":
+        """
+        ``left + right`` as one flat group, so that ``message += part`` in a loop
+        does not build a left-leaning tree as deep as the number of parts.
+
+        A plain group on the left shares its item list with the result and the list
+        is extended in place while nobody else did, which makes appends amortized O(1).
+        """
+        if isinstance(right, Group) and (right_items := right._flat_items()) is not None:
+            tail: list[Any] = right_items[:right._size]
+        else:
+            tail = [right]
+
+        if not isinstance(left, Group) or (items := left._flat_items()) is None:
+            return Group(left, *tail)
+
+        size: int = left._size
+
+        if len(items) == size and tail:
+            items.extend(tail)
+            # list.extend is atomic; the check catches a concurrent `+` on the same group
+            if items[size] is tail[0]:
+                group = Group.__new__(Group)
+                TextEntity.__init__(group, enabled=left._enabled)
+                group._content = items
+                group._size = size + len(tail)
+                return group
+
+        return Group(*items[:size], *tail)
+
 # Debugger
 
 class RichPrinter():
@@ -266,7 +564,7 @@ class RichPrinter():
     def print_using_rich(cls, text: str, parse_mode: Literal["html", "markdown"] | None):
         cls._try_install_rich()
         
-        if parse_mode is not None and cls._rich_is_installed():
+        if parse_mode in ("html", "markdown") and cls._rich_is_installed():
             syntax = cls._rich_syntax(text, parse_mode, theme="material")
             cls._rich_console.print(syntax)
         else:
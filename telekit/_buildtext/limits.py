@@ -0,0 +1,347 @@
+# 
+# Copyright (C) 2026 Romashka
+# 
+# This file is part of Telekit.
+# 
+# Telekit is free software: you can redistribute it and/or modify it 
+# under the terms of the GNU General Public License as published by 
+# the Free Software Foundation, either version 3 of the License, or 
+# (at your option) any later version.
+# 
+# Telekit is distributed in the hope that it will be useful, 
+# but WITHOUT ANY WARRANTY; without even the implied warranty 
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See 
+# the GNU General Public License for more details.
+# 
+# You should have received a copy of the GNU General Public License 
+# along with Telekit. If not, see <https://www.gnu.org/licenses/>.
+# 
+
+
+"""
+Message length accounting.
+
+Telegram limits messages to 4096 and captions to 1024 characters of *visible*
+text, counted in UTF-16 code units after the markup is parsed: tags, Markdown
+markers and escapes do not count, an emoji outside the BMP counts twice.
+"""
+
+import html
+import re
+from typing import Iterator, Literal, Sequence
+
+from telebot.types import MessageEntity
+
+from ..html_text import HTMLText, _MARKUP_RE
+from .entities import utf16_len, make_fragment, slice_fragment, strip_fragment
+
+TEXT_LIMIT: int = 4096
+CAPTION_LIMIT: int = 1024
+
+type _ParseMode = Literal["html", "markdown", "entities"] | None
+
+_HTML_TAG_RE = re.compile(r"</?[a-zA-Z][a-zA-Z0-9\-]*[^>]*>")
+# whitespace Telegram strips, and the placeholder of an entity ref that may decode to it
+_STRIPPED_RE = re.compile(r"[\s\ufffc]*")
+
+# where a too long text is preferably cut, best first
+_SPLIT_AT: tuple[str, ...] = ("\n", " ")
+
+
+def visible_text(text: str, parse_mode: _ParseMode) -> str:
+    """The text Telegram displays for ``text`` sent with ``parse_mode``."""
+    match parse_mode:
+        case "html":
+            if "<" in text:
+                text = _HTML_TAG_RE.sub("", text)
+            return html.unescape(text) if "&" in text else text
+        case "markdown":
+            return _markdown_visible_text(text)
+        case _:
+            return text
+
+def visible_length(text: str, parse_mode: _ParseMode) -> int:
+    """
+    Length of ``text`` as Telegram checks it against the message limits:
+    visible characters in UTF-16 code units, without leading and trailing whitespace.
+    """
+    return utf16_len(visible_text(text, parse_mode).strip())
+
+def _markdown_visible_text(text: str) -> str:
+    visible: list[str] = []
+    index: int = 0
+    size: int = len(text)
+    code: str | None = None    # "`" or "```" while inside code
+    line_start: bool = True
+
+    while index < size:
+        char: str = text[index]
+
+        if char == "\\" and index + 1 < size:
+            visible.append(text[index + 1])
+            index += 2
+            line_start = False
+            continue
+
+        if code is not None:
+            if text.startswith(code, index):
+                index += len(code)
+                code = None
+            else:
+                visible.append(char)
+                index += 1
+                line_start = char == "\n"
+            continue
+
+        if text.startswith("```", index):
+            # the rest of the opening line is the language
+            newline: int = text.find("\n", index)
+            index = size if newline == -1 else newline + 1
+            code = "```"
+        elif char == "`":
+            code = "`"
+            index += 1
+        elif line_start and text.startswith("**>", index):
+            index += 3
+        elif line_start and char == ">":
+            index += 1
+        elif char == "]" and text.startswith("(", index + 1):
+            # link or mention URL
+            index = _markdown_url_end(text, index + 2)
+        elif char in "*_~|[\r":
+            # markers; "\r" separates italic from underline ("___a_\r__")
+            index += 1
+        else:
+            visible.append(char)
+            index += 1
+            line_start = char == "\n"
+            continue
+
+        line_start = False
+
+    return "".join(visible)
+
+def _markdown_url_end(text: str, index: int) -> int:
+    size: int = len(text)
+    while index < size:
+        char: str = text[index]
+        if char == "\\":
+            index += 2
+        elif char == ")":
+            return index + 1
+        else:
+            index += 1
+    return size
+
+
+# Splitting
+
+def split_text(text: str, parse_mode: _ParseMode, limit: int, entities: Sequence[MessageEntity] | None = None, *, first: int | None = None) -> list[tuple[str, list[MessageEntity] | None]]:
+    """
+    Splits a rendered message into parts of at most ``limit`` visible UTF-16 code units,
+    preferably at line breaks, then at spaces. Every part stays valid on its own:
+    HTML tags are closed and reopened, entities are clipped to their part.
+
+    ``first`` is a different limit for the first part (a caption followed by messages).
+
+    :returns: ``(text, entities)`` per part; ``entities`` is ``None`` unless ``parse_mode`` is ``"entities"``.
+    :raises ValueError: For Markdown, which can not be split without parsing it.
+    """
+    parts: list[tuple[str, list[MessageEntity] | None]]
+
+    match parse_mode:
+        case "html":
+            parts = [(part.strip(), None) for part in split_html(text, limit, ordered=True, first=first)]
+        case "markdown":
+            raise ValueError("MarkdownV2 text can not be split, use the 'html' or 'entities' parse mode")
+        case "entities":
+            fragment = make_fragment(text, entities or ())
+            parts = []
+            offset: int = 0
+
+            for part in _split_plain(text, limit, first):
+                size: int = utf16_len(part)
+                piece = strip_fragment(slice_fragment(fragment, offset, offset + size))
+                parts.append((str(piece), list(piece.entities)))
+                offset += size
+        case _:
+            parts = [(part.strip(), None) for part in _split_plain(text, limit, first)]
+
+    # Telegram refuses messages with nothing but whitespace
+    return [part for part in parts if visible_text(part[0], parse_mode).strip()]
+
+def cut_first(text: str, parse_mode: _ParseMode, limit: int) -> tuple[str, int]:
+    """
+    The first part ``split_text`` would cut off ``text``, unstripped, and the number
+    of characters it takes from ``text`` (visible characters as ``HTMLText`` counts them for HTML).
+
+    :raises ValueError: For Markdown, which can not be split without parsing it.
+    """
+    match parse_mode:
+        case "html":
+            part: str = next(HTMLSplitter(text, limit, ordered=True))
+            return part, len(HTMLText(part))
+        case "markdown":
+            raise ValueError("MarkdownV2 text can not be split, use the 'html' or 'entities' parse mode")
+        case _:
+            part = _split_plain(text, limit)[0]
+            return part, len(part)
+
+def split_html(text: str, limit: int, *, split_at: str | tuple[str, ...] | None = _SPLIT_AT, window: int | tuple[int, int] | None = None, ordered: bool = False, first: int | None = None) -> list[str]:
+    """
+    ``HTMLText.chunk`` with the size measured as Telegram does: a piece that is too long
+    in UTF-16 code units (emoji) is cut again, shorter. ``window`` defaults to a quarter of the size.
+
+    With ``ordered=True`` the delimiters are tried one after another, best first,
+    instead of cutting at whichever is closest to the size.
+    """
+    parts: list[str] = []
+    whole = HTMLText(text)
+    total: int = len(whole)
+    end: int = _stripped_end(whole)
+    pos: int = 0
+    limit_now: int = limit if first is None else first
+
+    while pos < total:
+        if parts:
+            limit_now = limit
+
+        part, cut = _html_part(whole, pos, end, limit_now, split_at, window, ordered)
+        parts.append(part)
+        pos += cut
+
+    return parts
+
+class HTMLSplitter:
+    """
+    The parts of ``split_html``, one at a time. The text is tokenized only as far
+    as the parts taken so far need, so the first part of a huge text costs about as
+    much as the part itself.
+    """
+
+    def __init__(self, text: str, limit: int, *, split_at: str | tuple[str, ...] | None = _SPLIT_AT, window: int | tuple[int, int] | None = None, ordered: bool = False, first: int | None = None) -> None:
+        self.text = text
+        self.limit = limit
+        self.split_at = split_at
+        self.window = window
+        self.ordered = ordered
+        self.first = first
+
+        self._taken: int = 0
+        self._read: int = 0             # text[:_read] is tokenized into _whole
+        self._whole = HTMLText("")
+        self._end: int = 0
+        self._pos: int = 0
+
+    def __iter__(self) -> Iterator[str]:
+        return self
+
+    def __next__(self) -> str:
+        limit_now: int = self.limit if self._taken or self.first is None else self.first
+        self._read_ahead(limit_now)
+
+        if self._pos >= len(self._whole):
+            raise StopIteration
+
+        part, cut = _html_part(self._whole, self._pos, self._end, limit_now, self.split_at, self.window, self.ordered)
+        self._pos += cut
+        self._taken += 1
+        return part
+
+    @property
+    def progress(self) -> float:
+        """Rough share of the text behind the parts taken, from ``0`` to ``1``."""
+        if not self.text or self.done:
+            return 1.0
+        return self._read * self._pos / max(1, len(self._whole)) / len(self.text)
+
+    @property
+    def done(self) -> bool:
+        """All the parts are taken."""
+        return self._read == len(self.text) and self._pos >= len(self._whole)
+
+    def _read_ahead(self, limit: int) -> None:
+        # a part is cut the same as in the whole text once more than `limit`
+        # characters are known past the stripped start of the rest
+        while self._read < len(self.text):
+            if self._end - _STRIPPED_RE.match(self._whole._visible_text(), self._pos).end() > limit:
+                return
+            self._read = _markup_boundary(self.text, self._read, max(2 * self._read, self._read + 4 * limit))
+            self._whole = HTMLText(self.text[:self._read])
+            self._end = _stripped_end(self._whole)
+
+def _markup_boundary(text: str, start: int, stop: int) -> int:
+    """The first index from ``stop`` on that is not inside a tag or an entity ref; ``start`` is such an index."""
+    if stop >= len(text):
+        return len(text)
+    for match in _MARKUP_RE.finditer(text, start):
+        if match.end() > stop:
+            return match.end() if match.start() < stop else stop
+    return stop
+
+def _stripped_end(whole: HTMLText) -> int:
+    """Where the trailing whitespace of ``whole`` starts."""
+    visible: str = whole._visible_text()
+    end: int = len(visible)
+    while end and _STRIPPED_RE.fullmatch(visible[end - 1]):
+        end -= 1
+    return end
+
+def _html_part(whole: HTMLText, pos: int, end: int, limit: int, split_at: str | tuple[str, ...] | None, window: int | tuple[int, int] | None, ordered: bool) -> tuple[str, int]:
+    """The ``split_html`` part of ``whole`` from ``pos``, and its length in characters."""
+    # every character left between the stripped ends takes at least one code unit
+    if end - _STRIPPED_RE.match(whole._visible_text(), pos).end() <= limit:
+        rest: str = str(whole[pos:])
+        if visible_length(rest, "html") <= limit:
+            return rest, len(whole) - pos
+
+    size: int = limit
+
+    while True:
+        cut: int = _next_html_cut(whole, pos, size, split_at, size // 4 if window is None else window, ordered)
+        piece: str = str(whole[pos:pos + cut])
+        length: int = visible_length(piece, "html")
+        if length <= limit or size == 1:
+            return piece, cut
+        # every character takes one or two code units
+        size = max(1, min(size - 1, size * limit // length))
+
+def _next_html_cut(whole: HTMLText, pos: int, size: int, split_at: str | tuple[str, ...] | None, window: int | tuple[int, int], ordered: bool) -> int:
+    """Length of the next ``HTMLText.chunk`` piece of ``whole`` from ``pos``."""
+    if ordered and isinstance(split_at, tuple):
+        for delimiter in split_at:
+            cut: int = whole._chunk_length(pos, size, (delimiter,), window)
+            # without the delimiter in the window the chunk is a hard cut at the size
+            if cut < size or whole._visible_text().endswith(delimiter, pos, pos + cut):
+                return cut
+        split_at = None
+
+    needles: tuple[str, ...] = () if split_at is None else (split_at,) if isinstance(split_at, str) else tuple(split_at)
+    return whole._chunk_length(pos, size, needles, window)
+
+def _split_plain(text: str, limit: int, first: int | None = None) -> list[str]:
+    parts: list[str] = []
+    start: int = 0
+    size: int = len(text)
+
+    while start < size:
+        limit_now: int = limit if parts or first is None else first
+        stop: int = min(size, start + limit_now)
+
+        # a character is one or two UTF-16 code units
+        while (over := utf16_len(text[start:stop]) - limit_now) > 0 and stop > start + 1:
+            stop -= (over + 1) // 2
+
+        if stop < size:
+            # cut after a delimiter in the last quarter, if there is one
+            lowest: int = start + (stop - start) * 3 // 4
+            for delimiter in _SPLIT_AT:
+                found: int = text.rfind(delimiter, lowest, stop)
+                if found != -1:
+                    stop = found + len(delimiter)
+                    break
+
+        parts.append(text[start:stop])
+        start = stop
+
+    return parts
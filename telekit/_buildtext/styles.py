@@ -16,7 +16,7 @@
 # You should have received a copy of the GNU General Public License 
 # along with Telekit. If not, see <https://www.gnu.org/licenses/>.
 # 
-from typing import Union, Literal, TYPE_CHECKING, Union, Any
+from typing import Union, Literal, TYPE_CHECKING, Union, Any, Iterable, Callable
 from urllib.parse import quote
 
 if TYPE_CHECKING: # Union[str, "TextEntity", "Template"]
@@ -26,7 +26,8 @@ import telebot.formatting
 
 import telekit.utils
 
-from .formatter import TextEntity, EasyTextEntity, StaticTextEntity, EasyTextEntityWithPostRender, Group
+from .formatter import TextEntity, EasyTextEntity, StaticTextEntity, EasyTextEntityWithPostRender, Group, WriteMode
+from .entities import EntityBuffer, html_fragment
 
 
 class Bold(EasyTextEntity):
@@ -67,6 +68,18 @@ class Bold(EasyTextEntity):
     def _render_html(self, content: str) -> str:
         return f"<b>{content}</b>"
 
+    def _affixes(self, parse_mode: WriteMode) -> tuple[str, str]:
+        match parse_mode:
+            case "html":
+                return ("<b>", "</b>")
+            case "markdown":
+                return ("*", "*")
+            case _:
+                return ("", "")
+
+    def _message_entity(self) -> dict[str, Any]:
+        return {"kind": "bold"}
+
 
 class Italic(EasyTextEntity):
     """
@@ -102,6 +115,18 @@ class Italic(EasyTextEntity):
     def _render_html(self, content: str) -> str:
         return f"<i>{content}</i>"
 
+    def _affixes(self, parse_mode: WriteMode) -> tuple[str, str]:
+        match parse_mode:
+            case "html":
+                return ("<i>", "</i>")
+            case "markdown":
+                return ("_", "_\r")
+            case _:
+                return ("", "")
+
+    def _message_entity(self) -> dict[str, Any]:
+        return {"kind": "italic"}
+
 
 class Underline(EasyTextEntity):
     """
@@ -137,6 +162,18 @@ class Underline(EasyTextEntity):
     def _render_html(self, content: str) -> str:
         return f"<u>{content}</u>"
 
+    def _affixes(self, parse_mode: WriteMode) -> tuple[str, str]:
+        match parse_mode:
+            case "html":
+                return ("<u>", "</u>")
+            case "markdown":
+                return ("__", "__")
+            case _:
+                return ("", "")
+
+    def _message_entity(self) -> dict[str, Any]:
+        return {"kind": "underline"}
+
 
 class Strikethrough(EasyTextEntity):
     """
@@ -172,6 +209,18 @@ class Strikethrough(EasyTextEntity):
     def _render_html(self, content: str) -> str:
         return f"<s>{content}</s>"
 
+    def _affixes(self, parse_mode: WriteMode) -> tuple[str, str]:
+        match parse_mode:
+            case "html":
+                return ("<s>", "</s>")
+            case "markdown":
+                return ("~", "~")
+            case _:
+                return ("", "")
+
+    def _message_entity(self) -> dict[str, Any]:
+        return {"kind": "strikethrough"}
+
 
 class Code(EasyTextEntity):
     """
@@ -209,6 +258,18 @@ class Code(EasyTextEntity):
     def _render_html(self, content: str) -> str:
         return f"<code>{content}</code>"
 
+    def _affixes(self, parse_mode: WriteMode) -> tuple[str, str]:
+        match parse_mode:
+            case "html":
+                return ("<code>", "</code>")
+            case "markdown":
+                return ("`", "`")
+            case _:
+                return ("", "")
+
+    def _message_entity(self) -> dict[str, Any]:
+        return {"kind": "code"}
+
 
 class Language(EasyTextEntity):
     """
@@ -253,6 +314,30 @@ class Language(EasyTextEntity):
     def _render_html(self, content: str) -> str:
         return f'<pre language="{self._language}">{content}\n</pre>\n'
 
+    def _affixes(self, parse_mode: WriteMode) -> tuple[str, str]:
+        match parse_mode:
+            case "html":
+                return (f'<pre language="{self._language}">', "\n</pre>\n")
+            case "markdown":
+                return (f"```{self._language}\n", "```")
+            case _:
+                return ("", "")
+
+    def _message_entity(self) -> dict[str, Any]:
+        return {"kind": "pre", "language": self._language}
+
+    def _write_entity(self, out: list[str], parse_mode: WriteMode) -> None:
+        if not isinstance(out, EntityBuffer) or not self._enabled or type(self)._message_entity is not Language._message_entity:
+            super()._write_entity(out, parse_mode)
+            return
+
+        # same text as the HTML '<pre language="...">content\n</pre>\n'
+        start: int = out.length
+        self._write_content(out, parse_mode)
+        out.append("\n")
+        out.add(start, **self._message_entity())
+        out.append("\n")
+
 
 class Python(Language):
     """
@@ -322,6 +407,22 @@ class Spoiler(EasyTextEntity):
     def _render_html(self, content: str) -> str:
         return f'<tg-spoiler>{content}</tg-spoiler>'
 
+    def _affixes(self, parse_mode: WriteMode) -> tuple[str, str]:
+        match parse_mode:
+            case "html":
+                return ("<tg-spoiler>", "</tg-spoiler>")
+            case "markdown":
+                return ("||", "||")
+            case _:
+                return ("", "")
+
+    def _message_entity(self) -> dict[str, Any]:
+        return {"kind": "spoiler"}
+
+
+def _quote_lines(text: str) -> str:
+    return text.replace("\n", "\n>")
+
 
 class Quote(EasyTextEntityWithPostRender):
     """
@@ -368,9 +469,49 @@ class Quote(EasyTextEntityWithPostRender):
     def _render_html(self, content: str) -> str:
         return telebot.formatting.hcite(content, escape=False, expandable=self._expandable)
 
+    def _affixes(self, parse_mode: WriteMode) -> tuple[str, str] | None:
+        match parse_mode:
+            case "html":
+                return ("<blockquote expandable>" if self._expandable else "<blockquote>", "</blockquote>")
+            case "markdown":
+                # every line gets a ">" prefix
+                return None
+            case _:
+                return ("", "")
+
+    def _message_entity(self) -> dict[str, Any]:
+        return {"kind": "expandable_blockquote" if self._expandable else "blockquote"}
+
     def _post_render(self, rendered: str) -> str:
         return rendered + self._end if self._end else rendered
 
+    def _write_entity(self, out: list[str], parse_mode: WriteMode) -> None:
+        if type(self)._post_render is not Quote._post_render:
+            super()._write_entity(out, parse_mode)
+            return
+        
+        # same as `_render_markdown` and `_post_render`, without joining the rendered quote first
+        if parse_mode == "markdown" and self._enabled and type(self)._render_markdown is Quote._render_markdown:
+            out.append("**>" if self._expandable else ">")
+            start: int = len(out)
+            self._write_content(out, parse_mode)
+
+            # every line of the quote starts with ">"
+            for index in range(start, len(out)):
+                fragment = out[index]
+                if type(fragment) is str:
+                    out[index] = fragment.replace("\n", "\n>")
+                else:
+                    out[index] = fragment._then(_quote_lines)
+
+            if self._expandable:
+                out.append("||")
+        else:
+            EasyTextEntity._write_entity(self, out, parse_mode)
+
+        if self._end:
+            out.append(self._end)
+
 
 class Escape(TextEntity):
     """
@@ -406,6 +547,9 @@ class Raw(TextEntity):
     the ``parse_mode`` of the ``Sender``. By default, all tags not created via
     style classes are escaped automatically; this class disables that behavior.
 
+    With the ``"entities"`` parse mode the content is read as HTML:
+    its tags become entities, as Telegram would parse them.
+
     :param content: One or more strings or ``TextEntity`` objects to pass through unescaped.
     :param sep: Separator inserted between multiple content elements.
         Defaults to ``""``.
@@ -422,6 +566,13 @@ class Raw(TextEntity):
     def __init__(self, *content, sep: Union[str, "TextEntity", "Template"] = ""):
         super().__init__(*content, escape=False, sep=sep)
 
+    def _write_entity(self, out: list[str], parse_mode: WriteMode) -> None:
+        if parse_mode != "entities":
+            super()._write_entity(out, parse_mode)
+            return
+
+        out.append(html_fragment(self._render_content("html")))
+
 
 class Link(EasyTextEntity):
     """
@@ -474,6 +625,18 @@ class Link(EasyTextEntity):
     def _render_none(self, content: str) -> str:
         return f"{content} ({self._url})"
 
+    def _affixes(self, parse_mode: WriteMode) -> tuple[str, str]:
+        match parse_mode:
+            case "html":
+                return (f'<a href="{self._url}">', "</a>")
+            case "markdown":
+                return ("[", f"]({self._url})")
+            case _:
+                return ("", f" ({self._url})")
+
+    def _message_entity(self) -> dict[str, Any]:
+        return {"kind": "text_link", "url": self._url}
+
 
 class Mention(Link):
     """
@@ -699,33 +862,81 @@ class Stack(TextEntity):
 
     def __init__(self, *content, start: str = "{{index}}. ", sep: Union[str, "TextEntity", "Template"] = "\n", end: Union[str, "TextEntity", "Template"] = "", escape: bool = True, enabled: bool | Any = True):
         self._start = start
+        # the prefix around its line numbers, split once: "{{index}}. " -> ["", ". "]
+        self._start_parts: list[str] = start.split("{{index}}")
         self._end = end
         super().__init__(*content, escape=escape, sep=sep, enabled=enabled)
 
-    def _render_content(self, parse_mode: None | Literal['html'] | Literal['markdown']) -> str:
+    def _items(self) -> Iterable[Any]:
+        return self._content
+
+    def _write_content(self, out: list[str], parse_mode: WriteMode) -> None:
+        out.append("\n")
+
         if not self._enabled:
             # render content without stack formatting
-            end: str = self._render_item(self._end, parse_mode)
-            content = super()._render_content(parse_mode)
-            return f"\n{content}{end}\n"
-        
-        stack: list[str] = []
-
-        for index, item in enumerate(self._content, start=1):
-            stack.append(
-                Group(
-                    self._start.replace("{{index}}", str(index)),
-                    item,
-                    escape=self._escape_strings
-                ).render(parse_mode)
-            )
-
-        sep: str = self._render_item(self._separator, parse_mode)
-        end: str = self._render_item(self._end, parse_mode)
-        
-        content: str = sep.join(stack)
+            self._write_items(out, self._items(), parse_mode) # pyright: ignore[reportArgumentType]
+        else:
+            sep: str = self._render_item(self._separator, parse_mode)
+            write_item = self._write_item
+
+            # escaped once per render; line numbers never need escaping
+            parts: list[str] = [self._maybe_escape(part, parse_mode) for part in self._start_parts]
+
+            if len(parts) == 1:
+                prefix: str = parts[0]
+
+                for index, item in enumerate(self._items()):
+                    if index:
+                        out.append(sep)
+                    out.append(prefix)
+                    write_item(out, item, parse_mode)
+            else:
+                for index, item in enumerate(self._items(), start=1):
+                    if index > 1:
+                        out.append(sep)
+                    out.append(str(index).join(parts))
+                    write_item(out, item, parse_mode)
+
+        self._write_item(out, self._end, parse_mode)
+        out.append("\n")
+
+    def _frozen_items(self) -> Iterable[Any]:
+        yield from super()._frozen_items()
+        yield self._end
+
+
+class LazyStack(Stack):
+    """
+    A ``Stack`` whose items are read from an iterable while it is rendered,
+    e.g. rows from a database cursor, without collecting them first.
+
+    :param items: Iterable of strings or ``TextEntity`` objects, or a function that returns one.
+        An iterator (a cursor, a generator) is used up by the first render; pass a function
+        to get fresh items every time the stack is rendered.
+
+    The other parameters are the same as for ``Stack``.
+
+    Example::
+
+        LazyStack(
+            lambda: (Group(Bold(name), " — ", score) for name, score in db.execute("SELECT name, score FROM top")),
+            start=Stack.Markers.STAR,
+        )
+
+    `Documentation <https://github.com/Romashkaa/telekit/blob/main/docs/tutorial2/6_styles.md>`_ · on GitHub
+    """
+
+    # the items are not known until it is rendered
+    _memoizable = False
+
+    def __init__(self, items: Iterable[Any] | Callable[[], Iterable[Any]], *, start: str = "{{index}}. ", sep: Union[str, "TextEntity", "Template"] = "\n", end: Union[str, "TextEntity", "Template"] = "", escape: bool = True, enabled: bool | Any = True):
+        super().__init__(start=start, sep=sep, end=end, escape=escape, enabled=enabled)
+        self._source: Iterable[Any] | Callable[[], Iterable[Any]] = items
 
-        return f"\n{content}{end}\n"
+    def _items(self) -> Iterable[Any]:
+        source = self._source
+        return source() if callable(source) else source
 
 
 class Styles:
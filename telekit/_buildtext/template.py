@@ -0,0 +1,245 @@
+# 
+# Copyright (C) 2026 Romashka
+# 
+# This file is part of Telekit.
+# 
+# Telekit is free software: you can redistribute it and/or modify it 
+# under the terms of the GNU General Public License as published by 
+# the Free Software Foundation, either version 3 of the License, or 
+# (at your option) any later version.
+# 
+# Telekit is distributed in the hope that it will be useful, 
+# but WITHOUT ANY WARRANTY; without even the implied warranty 
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See 
+# the GNU General Public License for more details.
+# 
+# You should have received a copy of the GNU General Public License 
+# along with Telekit. If not, see <https://www.gnu.org/licenses/>.
+# 
+
+from contextvars import ContextVar
+from typing import Any, Callable, Iterable, Literal, Mapping
+
+from .formatter import TextEntity, Group, _SlotInsideError, WriteMode
+
+_PARSE_MODES: tuple[Literal["html", "markdown"] | None, ...] = ("html", "markdown", None)
+
+# values of the `BoundText` being written with parse_mode="entities"
+_bound_values: ContextVar[Mapping[str, Any]] = ContextVar("telekit_bound_values")
+
+
+class Slot(TextEntity):
+    """
+    Named placeholder for a value that is filled in when a compiled template is rendered.
+
+    :param name: Name of the value passed to ``CompiledText.render()`` / ``bind()``.
+    :param escape: Whether to escape HTML/Markdown special characters in plain string values.
+        ``TextEntity`` values are never escaped. Defaults to ``True``.
+
+    Example::
+
+        greeting = styles.compile(Bold("Hello, ", Slot("name")), "!")
+
+        greeting.html(name="<Ann>")  # "<b>Hello, &lt;Ann&gt;</b>!"
+
+    `Documentation <https://github.com/Romashkaa/telekit/blob/main/docs/tutorial2/6_styles.md>`_ · on GitHub
+    """
+
+    # writes itself as a marker, never as text
+    _memoizable = False
+
+    def __init__(self, name: str, escape: bool = True):
+        super().__init__(escape=escape)
+        self.name: str = name
+        # applied to the value by entities that transform their content line by line (Markdown Quote)
+        self._transforms: tuple[Callable[[str], str], ...] = ()
+
+    def _write_entity(self, out: list[Any], parse_mode: WriteMode) -> None:
+        if parse_mode != "entities":
+            out.append(self)
+            return
+
+        # entities are not compiled: the tree is written with the values in place
+        try:
+            value = _bound_values.get()[self.name]
+        except (LookupError, KeyError):
+            raise KeyError(f"No value for Slot({self.name!r})") from None
+
+        self._write_item(out, value, parse_mode)
+
+    def _then(self, transform: Callable[[str], str]) -> "Slot":
+        slot = Slot(self.name, escape=self._escape_strings)
+        slot._transforms = self._transforms + (transform,)
+        return slot
+
+    def _names(self) -> Iterable[str]:
+        """Names of the values this marker needs."""
+        yield self.name
+
+    def _fill_from(self, values: Mapping[str, Any], parse_mode: Literal["html", "markdown"] | None) -> str:
+        try:
+            value = values[self.name]
+        except KeyError:
+            raise KeyError(f"No value for Slot({self.name!r})") from None
+
+        return self._fill(value, parse_mode)
+
+    def _fill(self, value: Any, parse_mode: Literal["html", "markdown"] | None) -> str:
+        if isinstance(value, TextEntity):
+            text = value.render(parse_mode)
+        else:
+            text = self._maybe_escape(value, parse_mode)
+
+        for transform in self._transforms:
+            text = transform(text)
+
+        return text
+
+    def __repr__(self) -> str:
+        return f"Slot({self.name!r})"
+
+
+class CompiledText:
+    """
+    A ``TextEntity`` tree pre-rendered into static fragments and ``Slot`` values,
+    one layout per parse mode. Rendering is a single join; only slot values are escaped.
+
+    Create it with ``styles.compile(...)``.
+    """
+
+    __slots__ = ("_entity", "_layouts", "_errors", "names")
+
+    def __init__(self, entity: TextEntity):
+        self._entity: TextEntity = entity
+        # parse mode -> [static fragment | Slot, ...]
+        self._layouts: dict[str | None, list[str | Slot]] = {}
+        self._errors: dict[str | None, str] = {}
+        self.names: frozenset[str] = frozenset()
+
+        names: set[str] = set()
+
+        for parse_mode in _PARSE_MODES:
+            out: list[Any] = []
+
+            try:
+                entity._write(out, parse_mode)
+            except _SlotInsideError:
+                # some wrapper has to see its whole content (e.g. Markdown Quote, EncodeURL)
+                self._errors[parse_mode] = (
+                    f"the template can not be compiled for parse_mode={parse_mode!r}: "
+                    "a Slot is inside an entity that transforms its content"
+                )
+                continue
+
+            self._layouts[parse_mode] = layout = self._merge(out)
+            names.update(name for item in layout if isinstance(item, Slot) for name in item._names())
+
+        self.names = frozenset(names)
+
+    @staticmethod
+    def _merge(out: list[Any]) -> list[str | Slot]:
+        layout: list[str | Slot] = []
+        static: list[str] = []
+
+        for item in out:
+            if isinstance(item, Slot):
+                if static:
+                    layout.append("".join(static))
+                    static.clear()
+                layout.append(item)
+            else:
+                static.append(item)
+
+        if static:
+            layout.append("".join(static))
+
+        return layout
+
+    def render(self, parse_mode: Literal["html", "markdown"] | None, /, **values: Any) -> str:
+        """
+        Renders the template, filling every ``Slot`` with the value of the same name.
+
+        :raises KeyError: If a value is missing.
+        :raises ValueError: If the template can not be compiled for this parse mode.
+        """
+        layout = self._layouts.get(parse_mode)
+
+        if layout is None:
+            raise ValueError(self._errors.get(parse_mode, f"Unknown parse_mode: {parse_mode!r}"))
+
+        parts: list[str] = []
+
+        for item in layout:
+            if type(item) is str:
+                parts.append(item)
+            else:
+                parts.append(item._fill_from(values, parse_mode)) # pyright: ignore[reportAttributeAccessIssue]
+
+        return "".join(parts)
+
+    def html(self, **values: Any) -> str:
+        return self.render("html", **values)
+
+    def markdown(self, **values: Any) -> str:
+        return self.render("markdown", **values)
+
+    def none(self, **values: Any) -> str:
+        return self.render(None, **values)
+
+    def _write_entities(self, out: list[Any], values: Mapping[str, Any]) -> None:
+        token = _bound_values.set(values)
+        try:
+            self._entity._write(out, "entities")
+        finally:
+            _bound_values.reset(token)
+
+    def bind(self, **values: Any) -> "BoundText":
+        """
+        Returns a ``TextEntity`` with the values filled in,
+        which can be passed to the sender like any other style:
+
+        >>> sender.set_text(GREETING.bind(name=self.user.first_name))
+        """
+        return BoundText(self, values)
+
+
+class BoundText(TextEntity):
+    """A ``CompiledText`` with its values, rendered for whatever parse mode the sender uses."""
+
+    def __init__(self, template: CompiledText, values: Mapping[str, Any]):
+        super().__init__()
+        self._template: CompiledText = template
+        self._values: Mapping[str, Any] = values
+
+    def _write_entity(self, out: list[Any], parse_mode: WriteMode) -> None:
+        if parse_mode == "entities":
+            self._template._write_entities(out, self._values)
+        else:
+            out.append(self._template.render(parse_mode, **self._values))
+
+    def _is_frozen(self) -> bool:
+        # values may be mutable objects
+        return False
+
+
+def compile(*content: str | TextEntity, sep: str | TextEntity = "") -> CompiledText:
+    """
+    Pre-renders a message layout with ``Slot`` placeholders, for messages that are sent
+    over and over with only a few values changing:
+
+    ```
+    PROFILE = styles.compile(
+        Bold("Profile"),
+        Group("Name: ", Italic(Slot("name"))),
+        Group("Age: ", Slot("age")),
+        sep="\\n"
+    )
+
+    sender.set_text(PROFILE.bind(name=user.name, age=user.age))
+    ```
+
+    Static parts are rendered and escaped once per parse mode; rendering only escapes the values.
+
+    `Documentation <https://github.com/Romashkaa/telekit/blob/main/docs/tutorial2/6_styles.md>`_ · on GitHub
+    """
+    return CompiledText(Group(*content, sep=sep))
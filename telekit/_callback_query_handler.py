@@ -17,6 +17,9 @@
 # along with Telekit. If not, see <https://www.gnu.org/licenses/>.
 # 
 
+import threading
+import time
+from collections import OrderedDict
 from typing import Any, Callable
 
 import telebot
@@ -30,6 +33,10 @@ from .debug import Debug
 from ._logger import _library
 
 
+# (chat_id or inline_message_id, message_id, callback_data)
+type _PressKey = tuple[int | str | None, int | None, str | None]
+
+
 class CallbackQueryHandler:
 
     bot: telebot.TeleBot
@@ -45,6 +52,11 @@ class CallbackQueryHandler:
         cls.bot = bot
         cls.user_button_callbacks: dict[int, dict[str, Callable[[CallbackQuery], None]]] = {}
 
+        cls._presses_lock = threading.Lock()
+        cls._presses_in_progress: dict[_PressKey, int] = {}
+        cls._recent_presses: OrderedDict[_PressKey, float] = OrderedDict()
+        cls._current_press = threading.local()
+
         @bot.callback_query_handler(func=lambda call: True)
         def handle(call: CallbackQuery) -> None:
             if Debug.callback_query_tracing:
@@ -60,7 +72,7 @@ class CallbackQueryHandler:
                 return
 
             if call.data.startswith(cls.INLINE_BUTTON):
-                cls._handle_inline_button(call)
+                cls._handle_inline_press(call)
             elif call.data.startswith(cls.STATIC_BUTTON):
                 cls._handle_static_button(call)
             elif call.data.startswith(cls.SUGGEST):
@@ -73,27 +85,156 @@ class CallbackQueryHandler:
     # –––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––
 
     @classmethod
-    def _handle_inline_button(cls, call: CallbackQuery):
+    def _handle_inline_press(cls, call: CallbackQuery):
+        key: _PressKey = cls._press_key(call)
+
+        with cls._presses_lock:
+            # a re-rendered keyboard may reuse the data of a button pressed just now
+            duplicate: bool = key in cls._presses_in_progress \
+                or (cls._is_recent_press(key) and not cls._is_live_button(call))
+            if not duplicate:
+                cls._presses_in_progress[key] = 1
+
+        if duplicate:
+            # double tap on a button that is being (or was just) handled
+            if Debug.callback_query_tracing:
+                _library.info(f"Duplicate press acknowledged: {key!r}")
+            cls.bot.answer_callback_query(call.id)
+            return
+
+        cls._current_press.key = key
+
+        try:
+            consumed = cls._handle_inline_button(call)
+        finally:
+            cls._current_press.key = None
+            cls._release_press(key, remember=False)
+
+        if consumed:
+            with cls._presses_lock:
+                cls._remember_press(key)
+
+    @classmethod
+    def _handle_inline_button(cls, call: CallbackQuery) -> bool:
+        """
+        Calls the button callback; returns whether the keyboard was consumed by the press.
+        """
         if not call.data:
             cls.bot.answer_callback_query(call.id, text=cls._invalid_data_answer[0], show_alert=cls._invalid_data_answer[1])
-            return
+            return False
         
         button_callbacks: dict[str, Callable] | None = cls.user_button_callbacks.get(call.from_user.id)
 
         if not button_callbacks:
             cls.bot.answer_callback_query(call.id, text=cls._button_is_no_active_answer[0], show_alert=cls._button_is_no_active_answer[1])
-            return
+            return False
         
         callback: Callable | None = button_callbacks.get(call.data)
 
         if callback is None:
             cls.bot.answer_callback_query(call.id, text=cls._button_is_no_active_answer[0], show_alert=cls._button_is_no_active_answer[1])
-            return
+            return False
+
+        persistent: bool = getattr(callback, "_persistent", False)
 
-        if not getattr(callback, "_persistent", False):
+        if not persistent:
             cls.remove_user_button_callbacks(call.from_user.id)
         
         callback(call)
+        return not persistent
+
+    # –––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––
+    # Duplicate Presses
+    # –––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––
+
+    _duplicate_press_window: float = 2.0
+
+    @classmethod
+    def _press_key(cls, call: CallbackQuery) -> _PressKey:
+        message = call.message
+        if message is None:
+            return (call.inline_message_id, None, call.data)
+        return (message.chat.id, message.message_id, call.data)
+
+    @classmethod
+    def _is_live_button(cls, call: CallbackQuery) -> bool:
+        button_callbacks = cls.user_button_callbacks.get(call.from_user.id)
+        return button_callbacks is not None and call.data in button_callbacks
+
+    @classmethod
+    def _is_recent_press(cls, key: _PressKey) -> bool:
+        # deadlines are mostly in increasing order, so expired presses are usually at the front
+        recent = cls._recent_presses
+        now = time.monotonic()
+
+        while recent:
+            oldest = next(iter(recent))
+            if recent[oldest] > now:
+                break
+            del recent[oldest]
+
+        # the window may have changed: an expired press can still be behind a later deadline
+        deadline: float | None = recent.get(key)
+        return deadline is not None and deadline > now
+
+    @classmethod
+    def _remember_press(cls, key: _PressKey) -> None:
+        # re-inserted at the end, where the latest deadline belongs
+        cls._recent_presses.pop(key, None)
+        cls._recent_presses[key] = time.monotonic() + cls._duplicate_press_window
+
+    @classmethod
+    def _release_press(cls, key: _PressKey, remember: bool) -> None:
+        with cls._presses_lock:
+            holds = cls._presses_in_progress.get(key, 0) - 1
+            if holds > 0:
+                cls._presses_in_progress[key] = holds
+            else:
+                cls._presses_in_progress.pop(key, None)
+            if remember:
+                cls._remember_press(key)
+
+    @classmethod
+    def hold_press(cls) -> Callable[[], None]:
+        """
+        Keeps the button press being handled "in progress" after its callback returns,
+        so repeated presses of the same button are silently acknowledged until released.
+
+        Must be called from a button callback. Returns a function that releases the press.
+
+        ```
+        release = CallbackQueryHandler.hold_press()
+        threading.Thread(target=lambda: (long_task(), release())).start()
+        ```
+        """
+        key: _PressKey | None = getattr(cls._current_press, "key", None)
+
+        if key is None:
+            raise RuntimeError("hold_press() must be called while a button press is being handled")
+
+        with cls._presses_lock:
+            cls._presses_in_progress[key] = cls._presses_in_progress.get(key, 0) + 1
+
+        released: bool = False
+
+        def release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                cls._release_press(key, remember=True)
+
+        return release
+
+    @classmethod
+    def set_duplicate_press_window(cls, seconds: float=2.0):
+        """
+        Sets how long after a button press repeated presses of the same button
+        are silently acknowledged instead of answered with "Button is no longer active".
+
+        :param seconds: Length of the window; `0` disables it.
+        :type seconds: `float`
+        """
+        cls._duplicate_press_window = seconds
 
     # –––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––––
     # Static Buttons Handling
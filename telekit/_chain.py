@@ -18,7 +18,8 @@
 # 
 
 # Standard library
-from typing import Callable
+import time
+from typing import Callable, Iterable
 
 # Third-party packages
 import telebot
@@ -28,6 +29,8 @@ from telebot.types import Message
 from . import senders
 from .debug import Debug
 from .styles import TextEntity
+from .html_text import HTMLText
+from ._buildtext.limits import TEXT_LIMIT, cut_first, visible_length
 
 # Chain modules
 from ._chain_base import _library
@@ -144,6 +147,43 @@ class Chain(ChainInlineKeyboardLogic, ChainEntryLogic):
     
     def __call__(self, *args):
         self.send()
+
+    def stream_edit(self, source: Iterable[str | HTMLText], *, fps: float | None = 1.0, min_delta: int = 1) -> Message | None:
+        """
+        Shows a text that is still being produced (LLM output, a typing effect)
+        by editing one message as the text grows.
+
+        Every item of `source` is the whole text so far: a string in the sender's
+        parse mode, or an `HTMLText` (sent as HTML). The source is consumed as fast
+        as it yields, and the message is edited at most `fps` times per second,
+        only when the text grew by at least `min_delta` characters. Unchanged frames
+        are skipped; the last frame is always shown.
+
+        A text longer than 4096 characters continues in a new message
+        (not for `markdown`, which can not be split).
+        The last message is sent with `chain.edit()`, so the inline keyboard,
+        entry handlers and timeout of the chain apply to it:
+
+        >>> self.chain.set_inline_keyboard({"Again": self.handle})
+        >>> self.chain.stream_edit(HTMLText(answer).stream(step=20), fps=2)
+
+        For a source that yields new pieces instead of the whole text,
+        pass `itertools.accumulate(pieces)`.
+
+        Args:
+            source (Iterable[str | HTMLText]): Growing versions of the text.
+            fps (float | None, optional): Maximum edits per second; `None` for no limit. Defaults to 1.
+            min_delta (int, optional): Characters the text has to grow by between edits. Defaults to 1.
+
+        Returns:
+            Message | None: The last message, or None if `source` was empty.
+        """
+        editor = _StreamEditor(self, fps, min_delta)
+
+        for frame in source:
+            editor.push(frame)
+
+        return editor.finish()
     
     def _send(self)  -> Message | None:
         _timeout = self._start_timeout()
@@ -209,4 +249,118 @@ class Chain(ChainInlineKeyboardLogic, ChainEntryLogic):
     def create_sender(self, chat_id: int | None=None) -> senders.Sender:
         if not chat_id:
             chat_id = self.chat_id
-        return senders.Sender(chat_id)
\ No newline at end of file
+        return senders.Sender(chat_id)
+
+
+class _StreamEditor:
+    """Shows the frames of one `Chain.stream_edit()` call, throttled."""
+
+    def __init__(self, chain: Chain, fps: float | None, min_delta: int):
+        if fps is not None and fps <= 0:
+            raise ValueError(f"fps must be greater than 0, got {fps}")
+
+        self.chain: Chain = chain
+        self.interval: float = 1 / fps if fps else 0.0
+        self.min_delta: int = min_delta
+
+        # the message being edited; None until the first frame after a rollover is sent
+        self.message: Message | None = chain.get_previous_message()
+        # characters of the text already shown in the earlier messages
+        self.offset: int = 0
+        # text in `message` and its length
+        self.shown: str | None = None
+        self.shown_length: int = 0
+        # the message filled up last, with its text
+        self.full: tuple[Message | None, str] | None = None
+
+        self.frame: str | HTMLText | None = None
+        self.edited_at: float = float("-inf")
+
+    def push(self, frame: str | HTMLText) -> None:
+        self.frame = frame
+
+        # frames coming too fast are dropped before anything is rendered
+        if time.monotonic() - self.edited_at < self.interval:
+            return
+
+        text, length, parse_mode = self._tail(frame)
+
+        if length - self.shown_length < self.min_delta or text == self.shown:
+            return
+
+        self._show(text, parse_mode)
+        self.shown_length = length
+        self.edited_at = time.monotonic()
+
+    def finish(self) -> Message | None:
+        if self.frame is None:
+            return None
+
+        text, _, parse_mode = self._tail(self.frame)
+
+        if not text.strip() and self.full:
+            # the text ended right where a message filled up: finish that one
+            self.message, text = self.full
+
+        # the last frame goes out with the chain's keyboard and settings,
+        # but its parse mode is only for this message
+        sender = self.chain.sender
+        previous_parse_mode = sender.parse_mode
+        sender.set_parse_mode(parse_mode) # pyright: ignore[reportArgumentType]
+        sender.set_text(text, escape=False)
+
+        self.chain._set_previous_message(self.message)
+        try:
+            return self.chain.edit()
+        finally:
+            sender.set_parse_mode(previous_parse_mode) # pyright: ignore[reportArgumentType]
+
+    def _tail(self, frame: str | HTMLText) -> tuple[str, int, str | None]:
+        """The part of `frame` for the current message, its length and parse mode; fills up messages on the way."""
+        if isinstance(frame, HTMLText):
+            parse_mode = "html"
+        else:
+            parse_mode = self.chain.sender.parse_mode
+            if parse_mode == "html":
+                # `offset` counts visible characters, which are not string indexes in HTML
+                frame = HTMLText(frame)
+
+        if isinstance(frame, HTMLText):
+            rest = frame[self.offset:]
+            text, length = str(rest), len(rest)
+        else:
+            text = frame[self.offset:]
+            length = len(text)
+
+        while parse_mode != "markdown" and visible_length(text, parse_mode) > TEXT_LIMIT:
+            part, size = cut_first(text, parse_mode, TEXT_LIMIT)
+
+            if part != self.shown:
+                self._show(part, parse_mode)
+            self.full = (self.message, part)
+
+            self.message = None
+            self.shown = None
+            self.shown_length = 0
+            self.offset += size
+
+            if isinstance(frame, HTMLText):
+                rest = rest[size:]
+                text, length = str(rest), len(rest)
+            else:
+                text = text[size:]
+                length = len(text)
+
+        return text, length, parse_mode
+
+    def _show(self, text: str, parse_mode: str | None) -> None:
+        sender = self.chain.create_sender()
+        sender.set_parse_mode(parse_mode) # pyright: ignore[reportArgumentType]
+        sender.set_text(text, escape=False)
+        sender.set_edit_message(self.message)
+
+        message, _ = sender.try_send()
+
+        if message:
+            self.message = message
+        self.shown = text
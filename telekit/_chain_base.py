@@ -49,16 +49,39 @@ class ChainBase:
 
     def __init__(self, chat_id: int, *, previous_message: Message | None = None):
         self.chat_id = chat_id
-        self.sender = senders.Sender(chat_id)
         self.received = None
         
-        self._handler = _input_handler.InputHandler(chat_id)
         self._previous_message = previous_message
-        self._timeout_handler = _timeout.TimeoutHandler()
+
+        self._sender_instance: senders.Sender | None = None
+        self._handler_instance: _input_handler.InputHandler | None = None
+        self._timeout_instance: _timeout.TimeoutHandler | None = None
 
         self._do_remove_timeout = True
         self._do_remove_entry_handler = True
         self._do_remove_inline_keyboard = True
+
+    # -------------------------------------------
+    # Lazy members: created on first access
+    # -------------------------------------------
+
+    @property
+    def sender(self) -> senders.Sender:
+        if self._sender_instance is None:
+            self._sender_instance = senders.Sender(self.chat_id)
+        return self._sender_instance
+
+    @property
+    def _handler(self) -> _input_handler.InputHandler:
+        if self._handler_instance is None:
+            self._handler_instance = _input_handler.InputHandler(self.chat_id)
+        return self._handler_instance
+
+    @property
+    def _timeout_handler(self) -> _timeout.TimeoutHandler:
+        if self._timeout_instance is None:
+            self._timeout_instance = _timeout.TimeoutHandler()
+        return self._timeout_instance
     
     # -------------------------------------------
     # Cleanup Logic: manages clearing input handlers, inline keyboards, and timeout after each step
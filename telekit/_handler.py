@@ -17,7 +17,7 @@
 # along with Telekit. If not, see <https://www.gnu.org/licenses/>.
 # 
 
-from typing import Any, overload
+from typing import Any, Callable, overload
 
 import telebot
 from telebot.types import Message
@@ -30,6 +30,7 @@ from ._user import User
 from .chat import Chat
 from ._on import On
 from .debug import Debug
+from . import middleware
 
 class Handler:
     
@@ -40,9 +41,6 @@ class Handler:
     on:  On
 
     # Instance Attributes
-    user: User
-    chat: Chat
-    chain: Chain
     message: Message
 
     # -----------------------------------------------------
@@ -106,9 +104,53 @@ class Handler:
 
     def __init__(self, message: Message):
         self.message: Message = message
-        self.user = User(self.message)
-        self.chat = Chat(self.message.chat.id, self.message.message_thread_id, self.message)
-        self.new_chain()
+
+        # `user`, `chat` and `chain` are built on first access:
+        # many handlers answer a command without touching some of them.
+        self._user: User | None = None
+        self._chat: Chat | None = None
+        self._chain: Chain | None = None
+
+    @property
+    def user(self) -> User:
+        """The `User` who sent `self.message`."""
+        if self._user is None:
+            self._user = User(self.message)
+        return self._user
+
+    @user.setter
+    def user(self, value: User) -> None:
+        self._user = value
+
+    @property
+    def chat(self) -> Chat:
+        """The `Chat` (or forum thread) `self.message` was sent in."""
+        if self._chat is None:
+            self._chat = Chat(self.message.chat.id, self.message.message_thread_id, self.message)
+        return self._chat
+
+    @chat.setter
+    def chat(self, value: Chat) -> None:
+        self._chat = value
+
+    @property
+    def chain(self) -> Chain:
+        """The handler's main `Chain`. Replace it with `new_chain()`."""
+        if self._chain is None:
+            self._chain = Chain(self.message.chat.id)
+        return self._chain
+
+    @chain.setter
+    def chain(self, value: Chain) -> None:
+        self._chain = value
+
+    @property
+    def update_data(self) -> dict[str, Any]:
+        """
+        Data attached to `self.message` by middlewares (see `Server.middleware`).
+        Empty if no middleware annotated the update.
+        """
+        return middleware.get_data(self.message)
 
     def handle(self) -> Any:
         """
@@ -150,7 +192,19 @@ class Handler:
         >>> self.chain.sender.delete_message(self.message)
         """
         self.chain.sender.delete_message(self.message)
-    
+
+    def hold_button_press(self) -> Callable[[], None]:
+        """
+        Marks the inline button press being handled as "in progress" until the returned
+        function is called. Repeated presses of the same button are silently acknowledged meanwhile.
+
+        Call it from a button callback that starts background work:
+
+        >>> release = self.hold_button_press()
+        >>> threading.Thread(target=lambda: (self.long_task(), release())).start()
+        """
+        return CallbackQueryHandler.hold_press()
+
     def new_chain(self):
         """
         Creates a new `Chain` instance and assigns it to the handler.
@@ -164,10 +218,7 @@ class Handler:
 
         >>> self.new_chain()
         """
-        if hasattr(self, "chain"):
-            del self.chain
-
-        self.chain = Chain(self.message.chat.id)
+        self._chain = Chain(self.message.chat.id)
 
     def get_local_chain(self) -> Chain:
         """
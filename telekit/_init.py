@@ -26,6 +26,7 @@ from ._user import User
 from .senders import BaseSender
 from ._state import TelekitState
 from .chat import Chat
+from .middleware import _Pipeline
 
 import telebot
 
@@ -41,3 +42,4 @@ def init(bot: telebot.TeleBot) -> None:
     CallbackQueryHandler._init(bot)
     InlineButton._init(bot)
     User._init(bot)
+    _Pipeline._init(bot)
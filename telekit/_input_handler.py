@@ -33,8 +33,14 @@ class InputHandler:
     bot: telebot.TeleBot
 
     # instance attributes
-    break_only_on_match: bool
-    break_on_commands: bool
+    __slots__ = (
+        "chat_id",
+        "button_callbacks",
+        "entry_callback",
+        "cancel_timeout_callback",
+        "break_only_on_match",
+        "break_on_commands",
+    )
     
     @classmethod
     def _init(cls, bot: telebot.TeleBot):
@@ -65,7 +71,7 @@ class InputHandler:
         self.bot.clear_step_handler_by_chat_id(self.chat_id)
 
     def cancel_timeout(self):
-        cancel_timeout_callback = self.__dict__["cancel_timeout_callback"]
+        cancel_timeout_callback = self.cancel_timeout_callback
         if cancel_timeout_callback:
             cancel_timeout_callback()
 
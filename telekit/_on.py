@@ -19,13 +19,13 @@
 
 from typing import Callable
 import typing
-import shlex
 import re
 
 import telebot
 import telebot.types
 
 from . import parameters
+from .debug import Debug
 from ._logger import logger
 library = logger.library
 
@@ -313,6 +313,7 @@ class On:
         Args:
             *commands (str): List of command strings (e.g., ['start', 'help']) that trigger the handler.
             params (list[Parameter] | None): Optional list of parameter types to parse from the command arguments.
+                Supports `Variadic` (remaining arguments) and `Keyword` (`name=value`) parameters.
             chat_types (list[str] | None): List of chat types, e.g., ['private', 'group'].
             whitelist (list[int] | None): List of chat IDs allowed to trigger the handler.
             **kwargs: Any other keyword arguments supported by `telebot.TeleBot.message_handler`.
@@ -320,6 +321,8 @@ class On:
         Returns:
             Invoker: An invoker object allowing `.invoke()` or decorator-style usage.
         """
+        signature = parameters.Signature(params) if params else None
+
         def register(handler: Callable[..., typing.Any]):
             @self.bot.message_handler(
                 commands=[c.lstrip("/") for c in commands],
@@ -329,26 +332,19 @@ class On:
             def trigger(message):
                 if whitelist is not None and message.chat.id not in whitelist:
                     return
-                if params:
-                    return handler(message, *self._analyze_params(message.text, params))
+                if signature:
+                    args, named_args, errors = signature.parse(message.text)
+
+                    if errors and Debug.command_params_warnings:
+                        library.warning(f"Command parameters of {message.text[:64]!r}: {'; '.join(errors)}")
+
+                    return handler(message, *args, **named_args)
                 
                 return handler(message)
 
             return trigger
 
         return Invoker(register, self.handler)
-    
-    def _analyze_params(self, text: str, types: list[parameters.Parameter]) -> list:
-        values: list[str] = shlex.split(text)[1:] # skip the command name
-        args: list = []
-
-        for i, ptype in enumerate(types):
-            if len(values) <= i:
-                break
-            
-            args.append(ptype(values[i]))
-
-        return args
        
     def regexp(
         self,
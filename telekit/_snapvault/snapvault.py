@@ -206,6 +206,21 @@ class Vault(BaseDB):
                 for key, serialized_value in rows
         }
     
+    def page(self, offset: int, limit: int) -> dict:
+        '''At most ``limit`` items of ``all()``, skipping the first ``offset``.'''
+        cursor = self._execute(f"""
+            SELECT {self.key_field_name}, {self.value_field_name} FROM {self.table_name}
+            ORDER BY rowid DESC
+            LIMIT ? OFFSET ?
+        """, (limit, offset))
+
+        rows = cursor.fetchall()
+
+        return {
+            snapcode.unpack(key): snapcode.unpack(serialized_value)
+                for key, serialized_value in rows
+        }
+    
     def keys(self, value=Status.ALL) -> tuple:
         if value is Status.ALL:
             return tuple(self.all())
@@ -32,67 +32,115 @@ library = logger.library
 
 MAGIC_SCENES = parser.MAGIC_SCENES
 
-class ScriptData:
+class _Script:
+    """
+    The parts of an analyzed script that do not change while it runs.
+    Built once per script and shared, read-only, by every session of it.
+    """
+
+    __slots__ = (
+        "config", "scenes", "scene_order", "next_order", "timeout_time", "static_vars",
+        "_button_ref_count", "_scene_ref_count",
+    )
+
     def __init__(self, config: dict, scenes: dict[str, dict], scene_order: list[str], next_order: list[str], timeout_time: int | Any):
         self.config      = config
         self.scenes      = scenes
         self.scene_order = scene_order
         self.next_order  = next_order
-        self.entry: str | None = None
 
         if timeout_time and isinstance(timeout_time, int):
             self.timeout_time = timeout_time
         else:
             self.timeout_time = None
 
-        self._button_ref_count: dict[str, int] = {}
-        self._scene_ref_count:  dict[str, int] = {}
-
-        self.history: list[str] = []
-
-        # keep track of which *_once hooks have already been executed
-        self.executed_once_hooks: set[str] = set()
-
         self.static_vars = self._filter_configs("vars_")
 
+        # counted for all scenes at once, on first use
+        self._button_ref_count: dict[str, int] | None = None
+        self._scene_ref_count:  dict[str, int] | None = None
+
     def _filter_configs(self, key_prefix: str):
         prefix_len = len(key_prefix)
         filtered_items = filter(lambda kv: kv[0].startswith(key_prefix), self.config.items())
         return {k[prefix_len:]: v for k, v in filtered_items}
-        
-    def get_button_ref_count(self, name: str) -> int:
-        if name in self._button_ref_count:
-            return self._button_ref_count[name]
 
-        ref_count = 0
+    def _count_refs(self) -> None:
+        button_ref_count: dict[str, int] = {}
+        scene_ref_count:  dict[str, int] = {}
 
         for scene in self.scenes.values():
+            targets: set[str] = set()
+
             for button in scene["buttons"].values():
-                if button.get("type") == "scene" and button.get("target") == name:
-                    ref_count += 1
+                if button.get("type") == "scene":
+                    target = button.get("target")
+                    button_ref_count[target] = button_ref_count.get(target, 0) + 1
+                    targets.add(target)
+
+            for target in targets:
+                scene_ref_count[target] = scene_ref_count.get(target, 0) + 1
+
+        self._scene_ref_count  = scene_ref_count
+        self._button_ref_count = button_ref_count
+
+    def get_button_ref_count(self, name: str) -> int:
+        if self._button_ref_count is None:
+            self._count_refs()
+        return self._button_ref_count.get(name, 0) # pyright: ignore[reportOptionalMemberAccess]
 
-        self._button_ref_count[name] = ref_count
-        return ref_count
-    
     def get_scene_ref_count(self, name: str) -> int:
-        if name in self._scene_ref_count:
-            return self._scene_ref_count[name]
+        if self._scene_ref_count is None:
+            self._count_refs()
+        return self._scene_ref_count.get(name, 0) # pyright: ignore[reportOptionalMemberAccess]
 
-        ref_count = 0
+class ScriptData:
+    """
+    One session of a script: the shared :class:`_Script` and where the user is in it.
+    """
 
-        for scene in self.scenes.values():
-            has_ref = False
+    __slots__ = ("script", "entry", "history", "executed_once_hooks")
 
-            for button in scene["buttons"].values():
-                if button.get("type") == "scene" and button.get("target") == name:
-                    has_ref = True
-                    break
+    def __init__(self, script: _Script):
+        self.script = script
+        self.entry: str | None = None
+
+        self.history: list[str] = []
+
+        # keep track of which *_once hooks have already been executed
+        self.executed_once_hooks: set[str] = set()
+
+    # read-only, shared with the other sessions
+
+    @property
+    def config(self) -> dict:
+        return self.script.config
+
+    @property
+    def scenes(self) -> dict[str, dict]:
+        return self.script.scenes
+
+    @property
+    def scene_order(self) -> list[str]:
+        return self.script.scene_order
 
-            if has_ref:
-                ref_count += 1
+    @property
+    def next_order(self) -> list[str]:
+        return self.script.next_order
 
-        self._scene_ref_count[name] = ref_count
-        return ref_count
+    @property
+    def timeout_time(self) -> int | None:
+        return self.script.timeout_time
+
+    @property
+    def static_vars(self) -> dict[str, Any]:
+        return self.script.static_vars
+
+    def get_button_ref_count(self, name: str) -> int:
+        return self.script.get_button_ref_count(name)
+
+    def get_scene_ref_count(self, name: str) -> int:
+        return self.script.get_scene_ref_count(name)
     
     def get_current_scene_name(self) -> str:
         if self.history:
@@ -149,10 +197,10 @@ class ScriptData:
 
     @classmethod
     def _script_data_factory(cls, executable_model: dict[str, Any]):
-        script_data = cls._extract_script_data(executable_model)
+        script = _Script(*cls._extract_script_data(executable_model))
 
         def create(*_) -> ScriptData:
-            return cls(*script_data)
+            return cls(script)
         
         return create
     
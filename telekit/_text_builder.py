@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, Literal, Union, TYPE_CHECKING
+from typing import Any, Iterator, Literal, Mapping, Sequence, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from string.templatelib import Template  # pyright: ignore[reportMissingImports]
@@ -9,8 +9,10 @@ from .styles import (
     Bold, Italic, Underline, Strikethrough,
     Code, Language, Python, Spoiler, Quote,
     Escape, Raw, Link, Mention, UserLink, BotLink,
-    Stack,
+    Stack, Slot, CompiledText,
 )
+from ._buildtext.formatter import WriteMode
+from ._buildtext.template import _bound_values
 
 
 _SepType = Union[str, "TextEntity", "Template"]
@@ -20,6 +22,25 @@ _SepType = Union[str, "TextEntity", "Template"]
 class _CondFrame:
     active: bool
     type: Literal["if", "else"]
+    # set for a condition on a value filled in by `freeze().bind()`; `active` is then the truthiness it needs
+    slot: Slot | None = None
+
+
+class _Grid:
+    """One ``grid(width)`` call; items added under it share the counter."""
+
+    __slots__ = ("width",)
+
+    def __init__(self, width: int):
+        self.width = width
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    item: TextEntity
+    grid: _Grid | None = None
+    # (slot, needed truthiness) of the `Slot` conditions it was added under
+    conditions: tuple[tuple[Slot, bool], ...] = ()
 
 
 class TextBuilder(TextEntity):
@@ -52,6 +73,24 @@ class TextBuilder(TextEntity):
     ``else_()`` flips the innermost condition (else-branch).
     ``endif()`` closes the block.
 
+    Frozen layouts
+    --------------
+    ``freeze()`` pre-renders the builder into a ``CompiledText``, like ``styles.compile``.
+    Values marked with ``Slot`` are filled in by ``.bind(**values)``; a ``Slot`` passed to
+    ``if_()`` or ``when=`` picks the sections to render at bind time. Build it once::
+
+        PROFILE = (
+            TextBuilder(sep="\n")
+                .add_bold(Slot("name"))
+                .if_(Slot("is_admin"))
+                    .add_italic("Administrator")
+                .endif()
+                .add("Last seen: ", Slot("seen"))
+                .freeze()
+        )
+
+        sender.set_message(PROFILE.bind(name=user.name, is_admin=user.is_admin, seen=seen))
+
     Examples::
 
         TextBuilder(sep="\\n")
@@ -85,66 +124,111 @@ class TextBuilder(TextEntity):
     `Documentation <https://github.com/Romashkaa/telekit/blob/main/docs/tutorial2/6_styles.md>`_ · on GitHub
     """
 
+    # items are added after creation
+    _memoizable = False
+
     def __init__(self, sep: _SepType = ""):
         super().__init__(escape=True, sep=sep)
 
-        self._items: list[TextEntity | str] = []
+        self._items: list[_Entry] = []
         self._builder_sep: _SepType = sep
-        self._grid_width: int = 0
-        self._grid_counter: int = 0
+        self._grid: _Grid | None = None
+        self._grid_break: _GridBreak = _GridBreak(sep)
         self._when_stack: list[_CondFrame] = []
+        # whether some item depends on a `Slot` condition
+        self._deferred: bool = False
 
     # ------------------------------------------------------------------
     # TextEntity integration — override rendering to use _items
     # ------------------------------------------------------------------
 
-    def _render_content(self, parse_mode: Literal["html", "markdown"] | None) -> str:
-        sep: str = self._render_item(self._builder_sep, parse_mode)
-        parts: list[str] = []
+    def _write_entity(self, out: list[str], parse_mode: WriteMode) -> None:
+        self._check_closed("render")
+        self._write_content(out, parse_mode)
 
-        for item in self._items:
-            if isinstance(item, TextEntity):
-                rendered = item.render(parse_mode)
-            else:
-                # raw separator/newline strings injected by newln()/spacer()
-                rendered = str(item)
+    def _write_content(self, out: list[str], parse_mode: WriteMode) -> None:
+        values = _bound_values.get(None) if self._deferred else None
 
-            parts.append(rendered)
+        if self._deferred and values is None:
+            raise RuntimeError(
+                "TextBuilder has if_()/when= conditions on a Slot — "
+                "render it with freeze().bind(...)."
+            )
+
+        sep: str = self._render_item(self._builder_sep, parse_mode)
 
-        return sep.join(parts)
+        for index, item in enumerate(_select(self._items, self._grid_break, values)):
+            if index and sep:
+                out.append(sep)
+            item._write(out, parse_mode)
 
-    def render(self, parse_mode: Literal["html", "markdown"] | None) -> str:
+    def _check_closed(self, action: str) -> None:
         if self._when_stack:
             depth = len(self._when_stack)
             raise RuntimeError(
-                f"{depth} unclosed if_() block(s) detected at render time — "
+                f"{depth} unclosed if_() block(s) detected at {action} time — "
                 f"each if_() must be closed with a matching endif()."
             )
-        return super().render(parse_mode)
+
+    # ------------------------------------------------------------------
+    # Frozen layouts
+    # ------------------------------------------------------------------
+
+    def freeze(self) -> CompiledText:
+        """
+        Pre-renders the builder into an immutable layout, so a message that is
+        re-rendered often (dashboards, profiles) is not rebuilt every time.
+
+        Fill it with ``.bind(**values)`` (or ``.html(**values)`` etc.): every ``Slot``
+        in the content gets its value, every ``if_(Slot(...))`` / ``when=Slot(...)``
+        section is rendered if the value is truthy, grid rows are counted afterwards.
+
+        Later changes to the builder do not affect the frozen layout.
+
+        Example::
+
+            STATUS = (
+                TextBuilder(sep="\n")
+                    .add_bold("Server status")
+                    .add("CPU: ", Slot("cpu"), "%")
+                    .add_italic("High load!", when=Slot("overloaded"))
+                    .freeze()
+            )
+
+            sender.set_message(STATUS.bind(cpu=cpu, overloaded=cpu > 90))
+
+        :raises RuntimeError: If an ``if_()`` block is not closed.
+        """
+        self._check_closed("freeze")
+        return CompiledText(_FrozenBuilder(tuple(self._items), self._builder_sep, self._grid_break, self._deferred))
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
     def _active(self) -> bool:
-        """Return True when every _CondFrame on the stack is active."""
-        return all(frame.active for frame in self._when_stack)
+        """Return True when every _CondFrame on the stack is active (``Slot`` conditions are decided at bind time)."""
+        return all(frame.active for frame in self._when_stack if frame.slot is None)
 
-    def _push(self, entity: TextEntity, when: Any) -> "TextBuilder":
+    def _append(self, entity: TextEntity, when: Any, grid: _Grid | None) -> "TextBuilder":
         """Append *entity* respecting both the local *when* and the when-stack."""
-        if not when or not self._active():
+        if not isinstance(when, Slot) and not when or not self._active():
             return self
 
-        self._items.append(entity)
+        conditions = tuple((frame.slot, frame.active) for frame in self._when_stack if frame.slot is not None)
 
-        if self._grid_width:
-            self._grid_counter += 1
-            if self._grid_counter >= self._grid_width:
-                self._grid_counter = 0
-                self._items.append(_GridBreak(self._builder_sep))
+        if isinstance(when, Slot):
+            conditions += ((when, True),)
 
+        if conditions:
+            self._deferred = True
+
+        self._items.append(_Entry(entity, grid, conditions))
         return self
 
+    def _push(self, entity: TextEntity, when: Any) -> "TextBuilder":
+        return self._append(entity, when, self._grid)
+
     # ------------------------------------------------------------------
     # Grid / stack control
     # ------------------------------------------------------------------
@@ -158,14 +242,13 @@ class TextBuilder(TextEntity):
         """
         if width < 0:
             raise ValueError("width must be >= 0")
-        self._grid_width = width
-        self._grid_counter = 0
+        # the separators are inserted at render time, when the items are known
+        self._grid = _Grid(width) if width else None
         return self
 
     def end_grid(self) -> "TextBuilder":
         """Disable grid mode."""
-        self._grid_width = 0
-        self._grid_counter = 0
+        self._grid = None
         return self
 
     def stack(self) -> "TextBuilder":
@@ -195,7 +278,8 @@ class TextBuilder(TextEntity):
         Close the block with :meth:`endif`.  Switch to the else-branch
         with :meth:`else_` (which flips the innermost condition).
 
-        :param condition: Any truthy/falsy value.
+        :param condition: Any truthy/falsy value, or a ``Slot`` whose value is
+            checked when a frozen layout is bound (see :meth:`freeze`).
 
         Example::
 
@@ -209,7 +293,10 @@ class TextBuilder(TextEntity):
                     .add("Guest view")
                 .endif()
         """
-        self._when_stack.append(_CondFrame(active=bool(condition), type="if"))
+        if isinstance(condition, Slot):
+            self._when_stack.append(_CondFrame(active=True, type="if", slot=condition))
+        else:
+            self._when_stack.append(_CondFrame(active=bool(condition), type="if"))
         return self
 
     def else_(self) -> "TextBuilder":
@@ -264,9 +351,7 @@ class TextBuilder(TextEntity):
 
         Defaults to a single ``\\n``.
         """
-        if when and self._active():
-            self._items.append(_RawStr("\n" * n))
-        return self
+        return self._append(_RawStr("\n" * n), when, None)
 
     def spacer(self, n: int = 2, when: bool | Any = True) -> "TextBuilder":
         """
@@ -498,6 +583,116 @@ class TextBuilder(TextEntity):
         )
 
 
+# ---------------------------------------------------------------------------
+# Rendering of the items
+# ---------------------------------------------------------------------------
+
+def _select(entries: Sequence[_Entry], grid_break: TextEntity, values: Mapping[str, Any] | None) -> Iterator[TextEntity]:
+    """Yield the items to render, in order, with grid separators after every full row."""
+    grid: _Grid | None = None
+    counter: int = 0
+
+    for entry in entries:
+        if entry.conditions and not _holds(entry.conditions, values): # pyright: ignore[reportArgumentType]
+            continue
+
+        yield entry.item
+
+        if entry.grid is not None:
+            if entry.grid is not grid:
+                grid = entry.grid
+                counter = 0
+
+            counter += 1
+            if counter >= grid.width:
+                counter = 0
+                yield grid_break
+
+
+def _holds(conditions: tuple[tuple[Slot, bool], ...], values: Mapping[str, Any]) -> bool:
+    for slot, needed in conditions:
+        try:
+            value = values[slot.name]
+        except KeyError:
+            raise KeyError(f"No value for Slot({slot.name!r})") from None
+
+        if bool(value) is not needed:
+            return False
+
+    return True
+
+
+class _FrozenBuilder(TextEntity):
+    """The items of a ``TextBuilder`` at ``freeze()`` time, compiled by ``CompiledText``."""
+
+    # may hold `Slot`s, which render as markers
+    _memoizable = False
+
+    def __init__(self, entries: tuple[_Entry, ...], sep: _SepType, grid_break: TextEntity, deferred: bool):
+        super().__init__(escape=True, sep=sep)
+        self._entries = entries
+        self._grid_break = grid_break
+        self._deferred = deferred
+        # pre-rendered once for all parse modes; `None` until a layout with sections is compiled
+        self._compiled: dict[int, CompiledText] | None = None
+
+    def _write_entity(self, out: list[str], parse_mode: WriteMode) -> None:
+        sep: str = self._render_item(self._separator, parse_mode)
+
+        if parse_mode == "entities" or not self._deferred:
+            values = _bound_values.get(None) if self._deferred else None
+
+            for index, item in enumerate(_select(self._entries, self._grid_break, values)):
+                if index and sep:
+                    out.append(sep)
+                item._write(out, parse_mode)
+            return
+
+        # the sections are only known at bind time: one marker renders them all
+        out.append(_Sections(self, sep)) # pyright: ignore[reportArgumentType]
+
+    def _compile(self) -> dict[int, CompiledText]:
+        compiled = self._compiled
+
+        if compiled is None:
+            compiled = {id(entry.item): CompiledText(entry.item) for entry in self._entries}
+            compiled[id(self._grid_break)] = CompiledText(self._grid_break)
+            self._compiled = compiled
+
+        return compiled
+
+
+class _Sections(Slot):
+    """Marker for the items of a frozen ``TextBuilder`` that depend on ``Slot`` conditions."""
+
+    def __init__(self, builder: _FrozenBuilder, sep: str):
+        super().__init__("")
+        self._builder = builder
+        self._sep = sep
+        self._items = builder._compile()
+
+    def _names(self) -> Iterator[str]:
+        for entry in self._builder._entries:
+            yield from self._items[id(entry.item)].names
+            for slot, _ in entry.conditions:
+                yield slot.name
+
+    def _fill_from(self, values: Mapping[str, Any], parse_mode: Literal["html", "markdown"] | None) -> str:
+        sep = self._sep
+        items = self._items
+        parts: list[str] = []
+
+        for index, item in enumerate(_select(self._builder._entries, self._builder._grid_break, values)):
+            if index and sep:
+                parts.append(sep)
+            parts.append(items[id(item)].render(parse_mode, **values))
+
+        return "".join(parts)
+
+    def __repr__(self) -> str:
+        return "Sections()"
+
+
 # ---------------------------------------------------------------------------
 # Internal sentinel types — not part of public API
 # ---------------------------------------------------------------------------
@@ -509,8 +704,8 @@ class _RawStr(TextEntity):
         super().__init__(escape=False)
         self._value = value
 
-    def _render_content(self, parse_mode: Any) -> str:  # type: ignore[override]
-        return self._value
+    def _write_content(self, out: list[str], parse_mode: Any) -> None:  # type: ignore[override]
+        out.append(self._value)
 
 
 class _GridBreak(_RawStr):
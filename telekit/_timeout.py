@@ -21,6 +21,8 @@ from typing import Callable
 import threading
 
 class Timeout:
+    __slots__ = ("total_seconds", "callback", "_timer", "_cancelled")
+
     def __init__(self, callback: Callable, total_seconds: int):
         self.total_seconds = total_seconds
         self.callback = callback
@@ -43,6 +45,8 @@ class Timeout:
             self._timer.cancel()
 
 class TimeoutHandler:
+    __slots__ = ("total_seconds", "callback", "timeout")
+
     def __init__(self):
         self.total_seconds: int = 0
         self.callback: Callable | None = None
@@ -16,19 +16,20 @@
 # You should have received a copy of the GNU General Public License 
 # along with Telekit. If not, see <https://www.gnu.org/licenses/>.
 # 
-from functools import cached_property
 from typing import Literal
 
 import telebot
 import telebot.types
 
-from ._logger import logger
+from ._logger import logger, _UserLogger
 
 __all__ = ["User"]
 
 
 class User:
 
+    __slots__ = ("_message", "_chat_id", "_logger")
+
     bot: telebot.TeleBot
 
     @classmethod
@@ -38,17 +39,28 @@ class User:
     def __init__(self, message: telebot.types.Message) -> None:
         self._message: telebot.types.Message = message
         self._chat_id: int = message.chat.id
-        self.logger = logger.users(self._chat_id)
+        self._logger: _UserLogger | None = None
 
     # ── Internal ──────────────────────────────────────────────────
 
-    @cached_property
+    @property
     def _sender(self) -> telebot.types.User | telebot.types.Chat:
         """Resolves to `from_user` if available, otherwise falls back to `chat`."""
         return self._message.from_user or self._message.chat
 
     # ── Logging ───────────────────────────────────────────────────
 
+    @property
+    def logger(self) -> _UserLogger:
+        """Per-user logger, created on first access."""
+        if self._logger is None:
+            self._logger = logger.users(self._chat_id)
+        return self._logger
+
+    @logger.setter
+    def logger(self, value: _UserLogger) -> None:
+        self._logger = value
+
     def enable_logging(self, *user_ids: int | str) -> None:
         """
         Enable logging for this user or for additional user IDs.
@@ -68,7 +80,7 @@ class User:
         """Telegram username without the leading `@`, or `None` if not set."""
         return self._sender.username
 
-    @cached_property
+    @property
     def first_name(self) -> str | None:
         """First name of the user, or the group/channel title as a fallback."""
         if isinstance(self._sender, telebot.types.User):
@@ -80,14 +92,14 @@ class User:
         """Last name of the user, or `None` for chats and users without one."""
         return self._sender.last_name
 
-    @cached_property
+    @property
     def is_bot(self) -> bool:
         """Whether the sender is a bot. Always `False` for chats."""
         if isinstance(self._sender, telebot.types.User):
             return self._sender.is_bot
         return False
 
-    @cached_property
+    @property
     def language_code(self) -> str | None:
         """
         IETF language code of the user's Telegram client (e.g. `"en"`, `"uk"`).
@@ -97,7 +109,7 @@ class User:
             return self._sender.language_code
         return None
 
-    @cached_property
+    @property
     def is_premium(self) -> bool:
         """Whether the user has an active Telegram Premium subscription.
         Always `False` for chats and bots.
@@ -106,7 +118,7 @@ class User:
             return bool(self._sender.is_premium)
         return False
 
-    @cached_property
+    @property
     def added_to_attachment_menu(self) -> bool:
         """Whether this bot has been added to the user's attachment menu.
         Always `False` for chats.
@@ -137,7 +149,7 @@ class User:
 
     # ── Computed helpers ──────────────────────────────────────────
 
-    @cached_property
+    @property
     def full_name(self) -> str | None:
         """Full name of the user (`first_name + last_name`), or the chat title.
         Returns `None` if neither is available.
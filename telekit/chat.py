@@ -8,6 +8,8 @@ __all__ = ['Chat']
 
 
 class Chat:
+    __slots__ = ("id", "thread_id", "initial_user_message")
+
     bot: TeleBot
 
     @classmethod
@@ -3,6 +3,7 @@ class Debug:
     deletion_warnings: bool = False
     callback_query_tracing: bool = False
     duplicate_handler_warnings: bool = True
+    command_params_warnings: bool = False
 
     @classmethod
     def set_all(cls, value: bool) -> None:
@@ -58,7 +58,10 @@ Quick start
 from __future__ import annotations
 
 import re
-from typing import Generator, Iterator, Union
+from bisect import bisect_left, bisect_right
+from html import unescape
+from itertools import accumulate
+from typing import Any, Generator, Iterator, Union
 
 
 # ---------------------------------------------------------------------------
@@ -147,22 +150,45 @@ def _resolve_window(window: Window, size: int) -> tuple[int, int]:
 class _Token:
     """Atomic unit produced by :func:`_tokenize`.
 
-    Each token is either an HTML tag (``is_tag=True``) or a single visible
-    character / HTML character reference (``is_tag=False``).
+    Each token is either an HTML tag (``is_tag=True``), one HTML character
+    reference, or a run of plain characters between tags and references
+    (``is_tag=False``).  *size* is the number of visible characters the token
+    spans: ``0`` for a tag, ``1`` for a character reference and ``len(text)``
+    for a run.
     """
 
-    __slots__ = ("is_tag", "text")
+    __slots__ = ("is_tag", "text", "size", "name", "closing")
 
-    def __init__(self, is_tag: bool, text: str) -> None:
-        self.is_tag: bool = is_tag
-        self.text:   str  = text
+    def __init__(self, is_tag: bool, text: str, size: int = 0, name: str = "", closing: bool = False) -> None:
+        self.is_tag:  bool = is_tag
+        self.text:    str  = text
+        self.size:    int  = size
+        #: Lower-cased tag name; empty for visible tokens.
+        self.name:    str  = name
+        self.closing: bool = closing
+
+
+def _run(text: str) -> _Token:
+    """Return a visible token for the plain characters *text*."""
+    return _Token(False, text, len(text))
+
+
+def _closing_tag(name: str) -> _Token:
+    """Return a closing-tag token for the tag *name*."""
+    return _Token(True, f"</{name}>", 0, name, True)
 
 
 # ---------------------------------------------------------------------------
 # Tokeniser
 # ---------------------------------------------------------------------------
 
-def _tokenize(html: str) -> list[_Token]:
+#: A tag or a character reference; the tag wins where both could start.
+_MARKUP_RE: re.Pattern[str] = re.compile(
+    f"(?P<tag>{_TAG_RE.pattern})|{_ENTITY_RE.pattern}"
+)
+
+
+def _tokenize(html: str) -> tuple[list[_Token], list[int]]:
     """Split *html* into a flat list of :class:`_Token` objects.
 
     The function scans left-to-right, greedily consuming — in priority order:
@@ -170,78 +196,104 @@ def _tokenize(html: str) -> list[_Token]:
     1. An HTML tag (``_TAG_RE``).
     2. An HTML character reference (``_ENTITY_RE``), treated as one visible
        character.
-    3. A single Unicode code point.
+    3. Any other characters, up to the next tag or reference, as one run.
+
+    The token count is proportional to the markup, not to the text length.
 
     :param html: Raw Telegram HTML string.
-    :returns: Ordered list of tokens.
+    :returns: ``(tokens, offsets)`` — the ordered tokens and, for every
+              token, the number of visible characters before it; ``offsets``
+              has one more item holding the total visible length.
     """
-    tokens: list[_Token] = []
-    pos = 0
-    n   = len(html)
+    tokens:  list[_Token] = []
+    offsets: list[int]    = [0]
+    count = 0
+    pos   = 0
+
+    for m in _MARKUP_RE.finditer(html):
+        begin = m.start()
+        if begin > pos:
+            count += begin - pos
+            tokens.append(_run(html[pos:begin]))
+            offsets.append(count)
+
+        if m.group("tag") is not None:
+            tokens.append(_Token(True, m.group(0), 0, m.group("name").lower(), m.group("close") is not None))
+        else:
+            count += 1
+            tokens.append(_Token(False, m.group(0), 1))
+        offsets.append(count)
+        pos = m.end()
 
-    while pos < n:
-        m = _TAG_RE.match(html, pos)
-        if m:
-            tokens.append(_Token(True, m.group(0)))
-            pos = m.end()
-            continue
+    if pos < len(html):
+        count += len(html) - pos
+        tokens.append(_run(html[pos:]))
+        offsets.append(count)
 
-        m = _ENTITY_RE.match(html, pos)
-        if m:
-            tokens.append(_Token(False, m.group(0)))
-            pos = m.end()
-            continue
+    return tokens, offsets
 
-        tokens.append(_Token(False, html[pos]))
-        pos += 1
 
-    return tokens
+# ---------------------------------------------------------------------------
+# Core slicing logic
+# ---------------------------------------------------------------------------
 
+def _pop_by_name(stack: list[_Token], name: str) -> bool:
+    """Remove the last tag named *name* from *stack*; return whether there was one."""
+    for i in range(len(stack) - 1, -1, -1):
+        if stack[i].name == name:
+            stack.pop(i)
+            return True
+    return False
 
-def _visible_len(tokens: list[_Token]) -> int:
-    """Return the number of visible-character tokens in *tokens*.
 
-    :param tokens: Token list as produced by :func:`_tokenize`.
-    :returns: Count of non-tag tokens.
-    """
-    return sum(1 for t in tokens if not t.is_tag)
+def _open_tags(tokens: list[_Token], stack: list[_Token], begin: int, end: int) -> list[_Token]:
+    """Apply the tags of ``tokens[begin:end]`` to the open-tag *stack* and return it."""
+    for token in tokens[begin:end]:
+        if token.is_tag:
+            if not token.closing:
+                stack.append(token)
+            else:
+                _pop_by_name(stack, token.name)
+    return stack
 
 
-# ---------------------------------------------------------------------------
-# Core slicing logic
-# ---------------------------------------------------------------------------
+#: Number of tokens between two snapshots of the open-tag stack.
+_SNAPSHOT_EVERY = 64
 
-def _tag_name(token: _Token) -> str:
-    """Extract the lower-cased tag name from a tag token."""
-    m = _TAG_RE.match(token.text)
-    return m.group("name").lower() if m else ""
 
+def _stack_snapshots(tokens: list[_Token]) -> list[tuple[_Token, ...]]:
+    """Return the open-tag stack before every :data:`_SNAPSHOT_EVERY`-th token.
 
-def _is_closing(token: _Token) -> bool:
-    """Return ``True`` if *token* represents a closing tag (``</...>``)."""
-    m = _TAG_RE.match(token.text)
-    return bool(m and m.group("close"))
+    Item ``i`` is the stack in effect before ``tokens[i * _SNAPSHOT_EVERY]``.
+    """
+    snapshots: list[tuple[_Token, ...]] = []
+    stack:     list[_Token]             = []
 
+    for begin in range(0, len(tokens), _SNAPSHOT_EVERY):
+        snapshots.append(tuple(stack))
+        _open_tags(tokens, stack, begin, begin + _SNAPSHOT_EVERY)
 
-def _pop_by_name(stack: list, name: str) -> None:
-    """Remove the last element from *stack* whose tag name equals *name*."""
-    for i in range(len(stack) - 1, -1, -1):
-        item = stack[i]
-        item_name = item if isinstance(item, str) else _tag_name(item)
-        if item_name == name:
-            stack.pop(i)
-            return
+    return snapshots
 
 
-def _slice_tokens(tokens: list[_Token], start: int, stop: int) -> list[_Token]:
+def _slice_tokens(
+    tokens: list[_Token],
+    offsets: list[int],
+    snapshots: list[tuple[_Token, ...]],
+    start: int,
+    stop: int,
+) -> list[_Token]:
     """Return tokens corresponding to visible characters ``[start, stop)``.
 
     The returned token list is *self-contained*: every tag opened before
     *start* and still active at *start* is prepended as an opening tag;
     every tag that remains open at *stop* receives a matching closing tag
-    at the end.
+    at the end.  Tags right before the first character belong to the
+    range, tags right after the last one do not.
 
     :param tokens: Full token list as produced by :func:`_tokenize`.
+    :param offsets: Visible offsets of *tokens*, as produced by :func:`_tokenize`.
+    :param snapshots: Open-tag stacks of *tokens*, as produced by :func:`_stack_snapshots`.
     :param start: First visible-character index to include (inclusive).
     :param stop: First visible-character index to exclude (exclusive).
     :returns: Minimal, well-formed token list for the requested range.
@@ -249,60 +301,97 @@ def _slice_tokens(tokens: list[_Token], start: int, stop: int) -> list[_Token]:
     if start >= stop:
         return []
 
-    outer_stack: list[_Token] = []
-    suffix_outer: list[_Token] | None = None
-    inner_stack: list[str] = []
-    body:       list[_Token] = []
-    char_count = 0
-
-    for token in tokens:
-        if not token.is_tag:
-            if char_count < start:
-                char_count += 1
-            elif char_count < stop:
-                if suffix_outer is None:
-                    suffix_outer = list(outer_stack)
-                body.append(token)
-                char_count += 1
-            else:
-                break
-        else:
-            closing = _is_closing(token)
-            name    = _tag_name(token)
-
-            if char_count < start:
-                if not closing:
-                    outer_stack.append(token)
-                else:
-                    _pop_by_name(outer_stack, name)
-
-            elif char_count < stop:
-                if suffix_outer is None:
-                    suffix_outer = list(outer_stack)
-                body.append(token)
-                if not closing:
-                    inner_stack.append(name)
-                else:
-                    if any(
-                        (s if isinstance(s, str) else _tag_name(s)) == name
-                        for s in inner_stack
-                    ):
-                        _pop_by_name(inner_stack, name)
-                    else:
-                        _pop_by_name(suffix_outer, name)
-
-    if suffix_outer is None:
-        suffix_outer = list(outer_stack)
-
-    prefix = list(outer_stack)
-    suffix: list[_Token] = [
-        _Token(True, f"</{name}>") for name in reversed(inner_stack)
-    ]
-    suffix += [
-        _Token(True, f"</{_tag_name(t)}>") for t in reversed(suffix_outer)
-    ]
-
-    return prefix + body + suffix
+    n = len(tokens)
+    # tokens[first:last] start inside the range
+    first = bisect_left(offsets, start, 0, n)
+    last  = bisect_left(offsets, stop, first, n)
+
+    # a run may begin before *start*
+    if first and offsets[first - 1] + tokens[first - 1].size > start:
+        first -= 1
+
+    # replay the tags since the nearest snapshot
+    nearest     = first // _SNAPSHOT_EVERY
+    outer_stack = _open_tags(tokens, list(snapshots[nearest]), nearest * _SNAPSHOT_EVERY, first)
+
+    return _cut(tokens, offsets, outer_stack, first, last, start, stop)[0]
+
+
+def _cut(
+    tokens: list[_Token],
+    offsets: list[int],
+    outer_stack: list[_Token],
+    first: int,
+    last: int,
+    start: int,
+    stop: int,
+) -> tuple[list[_Token], list[_Token]]:
+    """Return the self-contained token list for ``tokens[first:last]``.
+
+    *outer_stack* holds the tags open before ``tokens[first]``; it is not
+    modified.  Runs sticking out of ``[start, stop)`` are cut to it.
+    The second item is the open-tag stack after ``tokens[last - 1]``.
+    """
+    suffix_outer = list(outer_stack)
+    inner_stack: list[_Token] = []
+    body:        list[_Token] = tokens[first:last]
+
+    # only runs are longer than one character, and only the outer ones can stick out
+    for i, k in ((0, first), (-1, last - 1)):
+        offset = offsets[k]
+        if offset < start or offset + tokens[k].size > stop:
+            body[i] = _run(tokens[k].text[max(start - offset, 0) : stop - offset])
+
+    for token in body:
+        if token.is_tag:
+            if not token.closing:
+                inner_stack.append(token)
+            elif not _pop_by_name(inner_stack, token.name):
+                _pop_by_name(suffix_outer, token.name)
+
+    # tags opened inside the range are closed before the outer ones
+    still_open = suffix_outer + inner_stack
+    suffix: list[_Token] = [_closing_tag(t.name) for t in reversed(still_open)]
+
+    return outer_stack + body + suffix, still_open
+
+
+class _Cursor:
+    """Cuts consecutive ranges ``[pos, stop)`` off a token list, left to right.
+
+    The open-tag stack is carried from one range to the next, so cutting a
+    whole text into pieces takes a single pass over its tokens.
+    """
+
+    __slots__ = ("tokens", "offsets", "pos", "index", "stack")
+
+    def __init__(self, tokens: list[_Token], offsets: list[int]) -> None:
+        self.tokens:  list[_Token] = tokens
+        self.offsets: list[int]    = offsets
+        #: Visible position the next range starts at.
+        self.pos:     int          = 0
+        #: First token of the next range; the tags before it are in ``stack``.
+        self.index:   int          = 0
+        self.stack:   list[_Token] = []
+
+    def take(self, stop: int) -> list[_Token]:
+        """Return the tokens for ``[pos, stop)`` (see :func:`_slice_tokens`) and move to *stop*."""
+        start = self.pos
+        if start >= stop:
+            return []
+
+        tokens, offsets = self.tokens, self.offsets
+        first = self.index
+        last  = bisect_left(offsets, stop, first, len(tokens))
+        cut, self.stack = _cut(tokens, offsets, self.stack, first, last, start, stop)
+
+        # a run sticking out of the range starts the next one
+        if offsets[last - 1] + tokens[last - 1].size > stop:
+            last -= 1
+
+        self.pos   = stop
+        self.index = last
+        return cut
 
 
 def _tokens_to_html(tokens: list[_Token]) -> str:
@@ -310,6 +399,33 @@ def _tokens_to_html(tokens: list[_Token]) -> str:
     return "".join(t.text for t in tokens)
 
 
+def _decoded(token: _Token) -> str:
+    """Visible text of a non-tag token, one character per visible character."""
+    if token.size == len(token.text):
+        return token.text
+    # a character reference; the rare ones that do not decode to one character keep a placeholder
+    char = unescape(token.text)
+    return char if len(char) == 1 else "\ufffc"
+
+
+def _delimiter_index(text: str, needles: tuple[str, ...]) -> tuple[list[int], list[int]]:
+    """Every occurrence of *needles* in *text*, overlapping ones included.
+
+    :returns: ``(ends, starts)`` sorted by end position.
+    """
+    found: list[tuple[int, int]] = []
+
+    for needle in needles:
+        size = len(needle)
+        idx  = text.find(needle)
+        while idx != -1:
+            found.append((idx + size, idx))
+            idx = text.find(needle, idx + 1)
+
+    found.sort()
+    return [end for end, _ in found], [start for _, start in found]
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -360,12 +476,81 @@ class HTMLText:
         :exc:`ValueError`.
     """
 
-    __slots__ = ("_html", "_tokens", "_length")
+    __slots__ = ("_html", "_tokens", "_offsets", "_snapshots", "_length", "_plain", "_text", "_delimiters", "_frame")
 
     def __init__(self, html: str) -> None:
-        self._html:   str          = html
-        self._tokens: list[_Token] = _tokenize(html)
-        self._length: int          = _visible_len(self._tokens)
+        self._html: str = html
+        # tags, character references and the text runs between them
+        self._tokens:  list[_Token]
+        self._offsets: list[int]
+        self._tokens, self._offsets = _tokenize(html)
+        self._length: int = self._offsets[-1]
+        # built on the first slice, see `_stack_snapshots`
+        self._snapshots: list[tuple[_Token, ...]] | None = None
+        # built on first use, see `plain`, `_visible_text` and `_chunk_length`
+        self._plain:      str | None = None
+        self._text:       str | None = None
+        self._delimiters: dict[tuple[str, ...], tuple[list[int], list[int]]] | None = None
+        # source, tokens done, HTML length done and the tail of a `stream` frame not built yet
+        self._frame: tuple["HTMLText", int, int, list[_Token]] | None = None
+
+    @classmethod
+    def _from_tokens(cls, tokens: list[_Token]) -> "HTMLText":
+        """Build an :class:`HTMLText` from already tokenised markup, without re-parsing it."""
+        return cls._assemble(
+            _tokens_to_html(tokens), tokens, list(accumulate((t.size for t in tokens), initial=0))
+        )
+
+    @classmethod
+    def _assemble(cls, html: str, tokens: list[_Token], offsets: list[int]) -> "HTMLText":
+        """Build an :class:`HTMLText` from its HTML, tokens and offsets, all consistent."""
+        self = cls.__new__(cls)
+        self._html       = html
+        self._tokens     = tokens
+        self._offsets    = offsets
+        self._length     = offsets[-1]
+        self._snapshots  = None
+        self._plain      = None
+        self._text       = None
+        self._delimiters = None
+        self._frame      = None
+        return self
+
+    @classmethod
+    def _stream_frame(cls, source: "HTMLText", index: int, pos: int, tail: list[_Token], length: int) -> "HTMLText":
+        """A prefix of *source*: its first *index* tokens (*pos* characters of HTML) and *tail*.
+
+        Only the length is set; the HTML and tokens are built on first use (see ``__getattr__``),
+        so frames that are skipped cost nothing.
+        """
+        self = cls.__new__(cls)
+        self._length     = length
+        self._snapshots  = None
+        self._plain      = None
+        self._text       = None
+        self._delimiters = None
+        self._frame      = (source, index, pos, tail)
+        return self
+
+    def __getattr__(self, name: str) -> Any:
+        # only the markup of a `stream` frame is left unset
+        if name not in ("_html", "_tokens", "_offsets") or self._frame is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+        source, index, pos, tail = self._frame
+        self._frame   = None
+        self._html    = source._html[:pos] + _tokens_to_html(tail)
+        self._tokens  = source._tokens[:index] + tail
+        self._offsets = source._offsets[:index + 1] + [self._length] * len(tail)
+        return getattr(self, name)
+
+    def _slice(self, start: int, stop: int) -> "HTMLText":
+        """Return visible characters ``[start, stop)``, sharing this text's tokens."""
+        if self._snapshots is None:
+            self._snapshots = _stack_snapshots(self._tokens)
+        return HTMLText._from_tokens(
+            _slice_tokens(self._tokens, self._offsets, self._snapshots, start, stop)
+        )
 
     # ------------------------------------------------------------------
     # Sequence protocol
@@ -389,8 +574,7 @@ class HTMLText:
             idx = key if key >= 0 else total + key
             if idx < 0 or idx >= total:
                 raise IndexError("HTMLText index out of range")
-            sliced = _slice_tokens(self._tokens, idx, idx + 1)
-            return HTMLText(_tokens_to_html(sliced))
+            return self._slice(idx, idx + 1)
 
         if isinstance(key, slice):
             start, stop, step = key.indices(total)
@@ -399,8 +583,7 @@ class HTMLText:
                     "HTMLText slices do not support step != 1; "
                     f"got step={step}"
                 )
-            sliced = _slice_tokens(self._tokens, start, stop)
-            return HTMLText(_tokens_to_html(sliced))
+            return self._slice(start, stop)
 
         raise TypeError(
             f"indices must be integers or slices, not {type(key).__name__}"
@@ -408,8 +591,9 @@ class HTMLText:
 
     def __iter__(self) -> Iterator["HTMLText"]:
         """Iterate over visible characters, each wrapped in its markup context."""
-        for i in range(self._length):
-            yield self[i]
+        cursor = _Cursor(self._tokens, self._offsets)
+        for i in range(1, self._length + 1):
+            yield HTMLText._from_tokens(cursor.take(i))
 
     def __contains__(self, item: Union[str, "HTMLText"]) -> bool:
         """Return ``True`` if *item* appears in the visible plain text."""
@@ -472,7 +656,15 @@ class HTMLText:
         HTML character references are returned in their original encoded form
         (e.g. ``&amp;``, not ``&``).
         """
-        return "".join(t.text for t in self._tokens if not t.is_tag)
+        if self._plain is None:
+            self._plain = "".join(t.text for t in self._tokens if not t.is_tag)
+        return self._plain
+
+    def _visible_text(self) -> str:
+        """Visible text with character references decoded, one character per visible-character index."""
+        if self._text is None:
+            self._text = "".join(_decoded(t) for t in self._tokens if not t.is_tag)
+        return self._text
 
     # ------------------------------------------------------------------
     # Streaming
@@ -481,6 +673,10 @@ class HTMLText:
     def stream(self, step: int = 1) -> Generator["HTMLText", None, None]:
         """Yield progressively longer HTMLText objects.
 
+        Each frame shares this text's markup and is built when it is first used,
+        so producing a frame costs ``step`` characters and the open tags; frames that
+        are skipped (e.g. by ``Chain.stream_edit`` throttling) are never built.
+
         Args:
             step: Number of visible characters added between updates.
 
@@ -494,11 +690,32 @@ class HTMLText:
         if step <= 0:
             raise ValueError("step must be greater than 0")
 
-        for i in range(step, self._length + 1, step):
-            yield self[:i]
+        tokens, offsets = self._tokens, self._offsets
+        total = self._length
+        stops = range(step, total + 1, step) if total % step == 0 else (*range(step, total + 1, step), total)
+
+        # every frame is the tokens done + the part of the run being typed + closing tags;
+        # it shares the tokens done with this text, so a frame costs its step and open tags
+        opened: list[_Token] = []
+        index  = 0
+        pos    = 0
+
+        for stop in stops:
+            last = bisect_left(offsets, stop, index, len(tokens))
+            # the run being typed is not done yet
+            if offsets[last - 1] + tokens[last - 1].size > stop:
+                last -= 1
 
-        if self._length % step:
-            yield self[:self._length]
+            pos += sum(len(t.text) for t in tokens[index:last])
+            _open_tags(tokens, opened, index, last)
+            index = last
+
+            tail: list[_Token] = []
+            if offsets[index] < stop:
+                tail.append(_run(tokens[index].text[: stop - offsets[index]]))
+            tail += [_closing_tag(t.name) for t in reversed(opened)]
+
+            yield HTMLText._stream_frame(self, index, pos, tail, stop)
 
     # ------------------------------------------------------------------
     # Splitting and chunking
@@ -606,22 +823,17 @@ class HTMLText:
         if size < 1:
             raise ValueError(f"chunk size must be >= 1, got {size}")
 
+        # pieces are cut in one pass over the tokens
+        cursor = _Cursor(self._tokens, self._offsets)
+
         # ── fast path: no smart options ──────────────────────────────────
         if split_at is None and window is None:
             for i in range(0, self._length, size):
-                yield self[i : i + size]
+                yield HTMLText._from_tokens(cursor.take(min(i + size, self._length)))
             return
 
-        # ── resolve window ────────────────────────────────────────────────
-        win_min, win_max = _resolve_window(window, size)
-        _greedy = (window is None)
-
-        # Special case: window=0 → always hard cut, ignore delimiters.
-        _hard_cut_only = (
-            isinstance(window, int) and window == 0
-        ) or (
-            isinstance(window, tuple) and window == (0, 0)
-        )
+        # raises on an invalid window before anything is yielded
+        _resolve_window(window, size)
 
         # ── normalise split_at ────────────────────────────────────────────
         needles: tuple[str, ...] = (
@@ -630,50 +842,59 @@ class HTMLText:
             tuple(split_at)
         )
 
-        plain = self.plain
-        pos   = 0
-        total = self._length
-
-        while pos < total:
-            remaining = total - pos
-
-            # Remainder fits inside the max window — emit it whole.
-            if remaining <= win_max:
-                yield self[pos:]
-                break
-
-            # ── hard-cut path ─────────────────────────────────────────────
-            if _hard_cut_only or not needles:
-                cut = min(size, remaining)
-                yield self[pos : pos + cut]
-                pos += cut
-                continue
-
-            # ── locate split candidates ───────────────────────────────────
-            segment    = plain[pos : pos + win_max]
-            candidates: list[int] = []
-
-            for needle in needles:
-                nlen = len(needle)
-                idx  = segment.find(needle)
-                while idx != -1:
-                    end_pos = idx + nlen
-                    if win_min <= end_pos <= win_max:
-                        candidates.append(end_pos)
-                    idx = segment.find(needle, idx + 1)
+        pos = 0
+        while pos < self._length:
+            pos += self._chunk_length(pos, size, needles, window)
+            yield HTMLText._from_tokens(cursor.take(pos))
 
-            if not candidates:
-                cut = min(size, remaining)   # no delimiter in window - hard cut
+    def _chunk_length(self, pos: int, size: int, needles: tuple[str, ...], window: Window) -> int:
+        """Return the length of the :meth:`chunk` piece starting at visible index *pos*.
 
-            elif _greedy:
-                cut = max(candidates)        # rightmost position ≤ size
+        Delimiters are looked up in an index of the whole text, built once
+        per needle set, so choosing a cut is a bisect.
+        """
+        # ── resolve window ────────────────────────────────────────────────
+        win_min, win_max = _resolve_window(window, size)
+        remaining = self._length - pos
 
-            else:
-                unique = sorted(set(candidates))
-                cut    = min(unique, key=lambda x: (abs(x - size), x))
+        # Remainder fits inside the max window — emit it whole.
+        if remaining <= win_max:
+            return remaining
 
-            yield self[pos : pos + cut]
-            pos += cut
+        # Special case: window=0 → always hard cut, ignore delimiters.
+        if not needles or window == 0 or window == (0, 0):
+            return min(size, remaining)
+
+        # ── locate split candidates ───────────────────────────────────────
+        if self._delimiters is None:
+            self._delimiters = {}
+        index = self._delimiters.get(needles)
+        if index is None:
+            index = self._delimiters[needles] = _delimiter_index(self._visible_text(), needles)
+        ends, starts = index
+
+        # occurrences ending in the window; those starting before *pos* do not count
+        lo = bisect_left(ends, pos + win_min)
+        hi = bisect_right(ends, pos + win_max, lo)
+
+        if window is None:
+            # greedy: rightmost position ≤ size
+            for k in range(hi - 1, lo - 1, -1):
+                if starts[k] >= pos:
+                    return ends[k] - pos
+            return min(size, remaining)   # no delimiter in window - hard cut
+
+        # closest to size; shorter wins ties
+        target = pos + size
+        middle = bisect_left(ends, target, lo, hi)
+        below  = next((ends[k] for k in range(middle - 1, lo - 1, -1) if starts[k] >= pos), None)
+        above  = next((ends[k] for k in range(middle, hi) if starts[k] >= pos), None)
+
+        if below is not None and (above is None or target - below <= above - target):
+            return below - pos
+        if above is not None:
+            return above - pos
+        return min(size, remaining)   # no delimiter in window - hard cut
 
     # ------------------------------------------------------------------
     # Search
@@ -0,0 +1,367 @@
+# 
+# Copyright (C) 2026 Romashka
+# 
+# This file is part of Telekit.
+# 
+# Telekit is free software: you can redistribute it and/or modify it 
+# under the terms of the GNU General Public License as published by 
+# the Free Software Foundation, either version 3 of the License, or 
+# (at your option) any later version.
+# 
+# Telekit is distributed in the hope that it will be useful, 
+# but WITHOUT ANY WARRANTY; without even the implied warranty 
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See 
+# the GNU General Public License for more details.
+# 
+# You should have received a copy of the GNU General Public License 
+# along with Telekit. If not, see <https://www.gnu.org/licenses/>.
+# 
+
+"""
+Middlewares run on every raw `telebot.types.Update` **before** it reaches
+any trigger, so no `Handler`, `Chain` or `Sender` is built for updates they reject.
+
+A middleware is a callable ``(update, data) -> bool | Delay | None``:
+
+- ``None`` / ``True`` — pass the update on to the next middleware
+- ``False``           — drop the update
+- ``Delay(seconds)``  — process the update later (remaining middlewares run then)
+
+``data`` is a ``dict`` shared by all middlewares of one update. It is attached to the
+update's payload (message, callback query, ...) and available in handlers as
+``self.update_data`` or anywhere via ``get_data(payload)``.
+
+```
+server = telekit.Server(bot)
+
+@server.middleware
+def maintenance(update, data):
+    if MAINTENANCE and not is_admin(update):
+        return False
+    data["locale"] = load_locale(update)
+```
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Literal, Union
+
+import telebot
+from telebot.types import Update
+
+from ._logger import _library
+from .scheduler import _timers
+
+__all__ = ["Delay", "Middleware", "Throttle", "get_data", "get_payload", "get_origin"]
+
+
+class Delay:
+    """Return value that postpones an update by ``seconds``."""
+
+    __slots__ = ("seconds",)
+
+    def __init__(self, seconds: float) -> None:
+        self.seconds = seconds
+
+    def __repr__(self) -> str:
+        return f"Delay({self.seconds})"
+
+
+Middleware = Callable[[Update, dict[str, Any]], Union[bool, Delay, None]]
+
+# Update fields that carry a payload, most frequent first
+_PAYLOAD_FIELDS: tuple[str, ...] = (
+    "message",
+    "callback_query",
+    "edited_message",
+    "inline_query",
+    "chosen_inline_result",
+    "channel_post",
+    "edited_channel_post",
+    "business_message",
+    "edited_business_message",
+    "my_chat_member",
+    "chat_member",
+    "chat_join_request",
+    "message_reaction",
+    "poll_answer",
+    "shipping_query",
+    "pre_checkout_query",
+    "purchased_paid_media",
+)
+
+_DATA_ATTR: str = "telekit_data"
+
+def get_payload(update: Update) -> Any:
+    """Return the first non-empty payload of ``update`` (message, callback query, ...), or ``None``."""
+    for field in _PAYLOAD_FIELDS:
+        payload = getattr(update, field, None)
+        if payload is not None:
+            return payload
+    return None
+
+def get_origin(update: Update) -> tuple[int | None, int | None]:
+    """
+    Return ``(user_id, chat_id)`` of ``update``; either may be ``None``.
+
+    >>> get_origin(update)
+    (123456789, 123456789)
+    """
+    payload = get_payload(update)
+
+    user = getattr(payload, "from_user", None) or getattr(payload, "user", None)
+    chat = getattr(payload, "chat", None)
+
+    if chat is None:
+        # callback queries carry the chat in their message
+        chat = getattr(getattr(payload, "message", None), "chat", None)
+
+    return getattr(user, "id", None), getattr(chat, "id", None)
+
+def get_data(payload: Any) -> dict[str, Any]:
+    """Return the middleware data attached to a message, callback query or other payload."""
+    return getattr(payload, _DATA_ATTR, None) or {}
+
+
+class _Pipeline:
+    """
+    Internal API class: installs the middleware chain in front of `bot.process_new_updates`.
+    """
+
+    bot: telebot.TeleBot
+    middlewares: list[Middleware] = []
+
+    _process: Callable[[list[Update]], None]
+
+    @classmethod
+    def _init(cls, bot: telebot.TeleBot) -> None:
+        cls.bot = bot
+
+        process_new_updates = bot.process_new_updates
+
+        if getattr(process_new_updates, "_telekit_pipeline", False):
+            return
+
+        def pipeline(updates: list[Update]) -> None:
+            if cls.middlewares:
+                updates = [update for update in updates if cls._run(update, 0)]
+            if updates:
+                process_new_updates(updates)
+
+        pipeline._telekit_pipeline = True # pyright: ignore[reportFunctionMemberAccess]
+        cls._process = process_new_updates
+        bot.process_new_updates = pipeline
+
+    @classmethod
+    def add(cls, middleware: Middleware) -> None:
+        cls.middlewares.append(middleware)
+
+    @classmethod
+    def remove(cls, middleware: Middleware) -> None:
+        if middleware in cls.middlewares:
+            cls.middlewares.remove(middleware)
+
+    @classmethod
+    def _run(cls, update: Update, start: int) -> bool:
+        """Runs middlewares from index ``start``; returns whether the update should be processed now."""
+        payload = get_payload(update)
+        data: dict[str, Any] = getattr(payload, _DATA_ATTR, None) or {}
+        middlewares = cls.middlewares
+
+        for index in range(start, len(middlewares)):
+            try:
+                result = middlewares[index](update, data)
+            except Exception as exception:
+                _library.warning(f"Middleware {middlewares[index]!r} failed, update passed on: {exception}")
+                continue
+
+            if result is False:
+                cls._skip(update)
+                return False
+
+            if isinstance(result, Delay):
+                cls._attach(payload, data)
+                cls._skip(update)
+                _timers.call_later(result.seconds, cls._resume, update, index + 1)
+                return False
+
+        cls._attach(payload, data)
+        return True
+
+    @classmethod
+    def _attach(cls, payload: Any, data: dict[str, Any]) -> None:
+        if data and payload is not None:
+            setattr(payload, _DATA_ATTR, data)
+
+    @classmethod
+    def _resume(cls, update: Update, start: int) -> None:
+        if cls._run(update, start):
+            cls._process([update])
+
+    @classmethod
+    def _skip(cls, update: Update) -> None:
+        # telebot advances the polling offset while processing; skipped updates must not be fetched again
+        if update.update_id > cls.bot.last_update_id:
+            cls.bot.last_update_id = update.update_id
+
+
+# ---------------------------------------------------------------------------------
+# Anti-flood
+# ---------------------------------------------------------------------------------
+
+class _Bucket:
+    __slots__ = ("tokens", "updated", "warned")
+
+    def __init__(self, tokens: float, updated: float) -> None:
+        self.tokens = tokens
+        self.updated = updated
+        self.warned = False
+
+
+class Throttle:
+    """
+    Built-in middleware that limits how often one user can reach the bot in one chat.
+
+    Each `(user_id, chat_id)` pair gets a token bucket: up to ``burst`` updates
+    pass at once, then ``rate`` updates per second. Buckets that have refilled
+    are forgotten, so memory is proportional to the number of currently active users.
+
+    Policies for updates over the limit:
+
+    - ``"drop"``     — ignore them silently
+    - ``"answer"``   — ignore them and reply with ``answer`` once per throttled burst
+      (a toast for button presses)
+    - ``"coalesce"`` — keep only the latest one and process it when a token is available
+
+    ```
+    server.middleware(Throttle(rate=1, burst=5, policy="answer", answer="Slow down!"))
+    ```
+
+    :param rate: Sustained number of updates per second.
+    :param burst: Number of updates that may arrive at once.
+    :param policy: What to do with updates over the limit.
+    :param answer: Text sent to the user with the ``"answer"`` policy.
+    """
+
+    def __init__(
+            self,
+            rate: float = 1,
+            burst: int = 5,
+            *,
+            policy: Literal["drop", "answer", "coalesce"] = "drop",
+            answer: str = "Too many requests. Please slow down."
+        ) -> None:
+        if rate <= 0 or burst < 1:
+            raise ValueError(f"Throttle needs rate > 0 and burst >= 1, got rate={rate}, burst={burst}")
+        if policy not in ("drop", "answer", "coalesce"):
+            raise ValueError(f"Unknown throttle policy: {policy!r}")
+
+        self.rate = rate
+        self.burst = burst
+        self.policy = policy
+        self.answer = answer
+
+        # time for an empty bucket to refill; idle buckets older than that are dropped
+        self._ttl: float = burst / rate
+        self._buckets: OrderedDict[tuple[int, int | None], _Bucket] = OrderedDict()
+        self._pending: dict[tuple[int, int | None], Update] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, update: Update, data: dict[str, Any]) -> bool:
+        user_id, chat_id = get_origin(update)
+
+        if user_id is None:
+            return True
+
+        key = (user_id, chat_id)
+
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+
+            bucket = self._buckets.pop(key, None)
+
+            if bucket is None:
+                bucket = _Bucket(self.burst, now)
+            else:
+                bucket.tokens = min(self.burst, bucket.tokens + (now - bucket.updated) * self.rate)
+                bucket.updated = now
+
+            # most recently used last: expired buckets are always at the front
+            self._buckets[key] = bucket
+
+            if bucket.tokens >= 1:
+                bucket.tokens -= 1
+                bucket.warned = False
+                return True
+
+            wait: float = (1 - bucket.tokens) / self.rate
+            warn: bool = not bucket.warned
+            bucket.warned = True
+
+        if self.policy == "answer" and warn:
+            self._answer(update)
+        elif self.policy == "coalesce":
+            self._coalesce(key, update, wait)
+
+        return False
+
+    def _expire(self, now: float) -> None:
+        expired: list[tuple[int, int | None]] = []
+
+        for key, bucket in self._buckets.items():
+            if now - bucket.updated < self._ttl:
+                break
+            # a coalesced update still needs its bucket
+            if key not in self._pending:
+                expired.append(key)
+
+        for key in expired:
+            del self._buckets[key]
+
+    def _answer(self, update: Update) -> None:
+        bot = _Pipeline.bot
+
+        # a reply must not hold up the updates behind this one
+        if bot.threaded:
+            bot.worker_pool.put(self._send_answer, update)
+        else:
+            self._send_answer(update)
+
+    def _send_answer(self, update: Update) -> None:
+        bot = _Pipeline.bot
+
+        try:
+            if update.callback_query is not None:
+                bot.answer_callback_query(update.callback_query.id, text=self.answer)
+            else:
+                _, chat_id = get_origin(update)
+                if chat_id is not None:
+                    bot.send_message(chat_id, self.answer)
+        except Exception as exception:
+            _library.warning(f"Throttle failed to answer: {exception}")
+
+    def _coalesce(self, key: tuple[int, int | None], update: Update, wait: float) -> None:
+        with self._lock:
+            scheduled = key in self._pending
+            self._pending[key] = update
+
+        if not scheduled:
+            _timers.call_later(wait, self._flush, key)
+
+    def _flush(self, key: tuple[int, int | None]) -> None:
+        with self._lock:
+            update = self._pending.pop(key, None)
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                now = time.monotonic()
+                bucket.tokens = max(0, min(self.burst, bucket.tokens + (now - bucket.updated) * self.rate) - 1)
+                bucket.updated = now
+                bucket.warned = False
+                self._buckets.move_to_end(key)
+
+        if update is None or self not in _Pipeline.middlewares:
+            return
+
+        _Pipeline._resume(update, _Pipeline.middlewares.index(self) + 1)
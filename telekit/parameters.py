@@ -27,6 +27,8 @@ This module defines parameter types for command handlers.
 - If the user **provides an invalid value** (like `"abc"` for an `Int` parameter), then
   the parameter type's `default_value` is used instead.
 
+- `Variadic` collects all remaining arguments, `Keyword` picks up `name=value` arguments.
+
 Usage example:
 
 ```
@@ -34,10 +36,19 @@ Usage example:
     def _(message, value: list=DEFAULT) # default used if user doesn't provide this parameter
         ...
 ```
+
+Command arguments are split by `Signature`, which is built once per command
+and tokenizes the message text in a single pass (quotes and backslash escapes
+work like in a shell). Malformed input never raises: problems are collected
+as error strings and the handler defaults are used instead.
 """
 
+import re
 import typing
 
+MAX_ARGUMENTS_LENGTH: int = 1024
+"""Command arguments longer than this (in characters) are truncated before parsing."""
+
 class Parameter:
     """Base class for parameter type conversion"""
     def __init__(self, func: typing.Callable[[str], typing.Any]):
@@ -151,4 +162,221 @@ class Bool(Parameter):
         Returns:
             bool: True if param_value is in true_values, False otherwise.
         """
-        return param_value.lower() in self.true_values
\ No newline at end of file
+        return param_value.lower() in self.true_values
+
+class Variadic(Parameter):
+    """Parameter type that consumes all remaining positional arguments"""
+    def __init__(self, ptype: Parameter | None = None):
+        """
+        Initialize Variadic parameter type. Must be the last positional parameter.
+
+        ```
+        @cls.on.command("sum", params=[Variadic(Int())])
+        def _(message, *numbers: int)
+            ...
+        ```
+
+        Args:
+            ptype (Parameter | None): Parameter type applied to each argument. Defaults to `Str()`.
+        """
+        self.ptype = ptype or Str()
+
+    def __call__(self, param_value: str):
+        return self.ptype(param_value)
+
+class Keyword(Parameter):
+    """Parameter type for `name=value` arguments, passed to the handler as keyword arguments"""
+    def __init__(self, name: str, ptype: Parameter | None = None):
+        """
+        Initialize Keyword parameter type. Keyword arguments may appear anywhere after the command.
+
+        ```
+        @cls.on.command("top", params=[Str(), Keyword("limit", Int(10))])
+        def _(message, board: str="global", limit: int=10) # /top weekly limit=5
+            ...
+        ```
+
+        Args:
+            name (str): Argument name, both in the message and in the handler signature.
+            ptype (Parameter | None): Parameter type applied to the value. Defaults to `Str()`.
+        """
+        if not name.isidentifier():
+            raise ValueError(f"Keyword name must be a valid identifier, got {name!r}")
+
+        self.name = name
+        self.ptype = ptype or Str()
+
+    def __call__(self, param_value: str):
+        return self.ptype(param_value)
+
+# --------------------------------------------------------
+# Tokenizer
+# --------------------------------------------------------
+
+_COMMAND_RE = re.compile(r"\S*\s*")
+_SPACE_RE   = re.compile(r"\s*")
+_WORD_RE    = re.compile(r"""(?:[^\s"'\\]+|\\.|"(?:[^"\\]|\\.)*"|'[^']*')+""", re.DOTALL)
+_PIECE_RE   = re.compile(r"""\\(.)|"((?:[^"\\]|\\.)*)"|'([^']*)'""", re.DOTALL)
+_DQ_ESCAPE_RE = re.compile(r'\\([\\"])')
+
+def _unquote_piece(match: re.Match) -> str:
+    escaped, double, single = match.groups()
+    if escaped is not None:
+        return escaped
+    if double is not None:
+        return _DQ_ESCAPE_RE.sub(r"\1", double)
+    return single
+
+def _unquote(word: str) -> str:
+    if "\"" not in word and "'" not in word and "\\" not in word:
+        return word
+    return _PIECE_RE.sub(_unquote_piece, word)
+
+def tokenize(text: str, max_tokens: int | None = None) -> tuple[list[str], list[str]]:
+    """
+    Split *text* into shell-like words in a single pass.
+
+    Unlike `shlex.split`, it never raises: an unclosed quote swallows the rest
+    of the text into the last word, a dangling backslash is dropped, and both are
+    reported in the returned error list.
+
+    >>> tokenize('12 "John Smith" it\\'s')
+    (['12', 'John Smith', "it's"], [])
+
+    Args:
+        text (str): Text to split.
+        max_tokens (int | None): Stop after this many words. `None` means no limit.
+
+    Returns:
+        tuple[list[str], list[str]]: Words and parse errors.
+    """
+    tokens: list[str] = []
+    errors: list[str] = []
+    pos = 0
+    n   = len(text)
+
+    while True:
+        pos = _SPACE_RE.match(text, pos).end() # pyright: ignore[reportOptionalMemberAccess]
+        if pos >= n or (max_tokens is not None and len(tokens) >= max_tokens):
+            break
+
+        m    = _WORD_RE.match(text, pos)
+        word = _unquote(m.group()) if m else ""
+        pos  = m.end() if m else pos
+
+        if pos < n and not text[pos].isspace():
+            # The word stopped on an unclosed quote or a trailing backslash
+            if text[pos] == "\\":
+                errors.append(f"no escaped character at position {pos}")
+            else:
+                errors.append(f"no closing quotation for {text[pos]} at position {pos}")
+                word += text[pos + 1:]
+            pos = n
+
+        tokens.append(word)
+
+    return tokens, errors
+
+# --------------------------------------------------------
+# Signature
+# --------------------------------------------------------
+
+class Signature:
+    """
+    Precompiled command parameter list used by `On.command(params=...)`.
+
+    Built once when the trigger is registered; `parse` then turns message text
+    into handler arguments without raising on malformed or hostile input.
+    """
+
+    __slots__ = ("_positional", "_variadic", "_keywords", "_max_tokens", "_max_length")
+
+    def __init__(self, params: typing.Iterable[Parameter], max_length: int = MAX_ARGUMENTS_LENGTH):
+        """
+        Args:
+            params (Iterable[Parameter]): Parameter types in handler order.
+            max_length (int): Maximum length of the argument text, in characters.
+
+        Raises:
+            ValueError: If `Variadic` is not the last positional parameter
+                or a `Keyword` name is used twice.
+        """
+        self._positional: list[Parameter] = []
+        self._variadic: Variadic | None = None
+        self._keywords: dict[str, Keyword] = {}
+        self._max_length = max_length
+
+        for param in params:
+            if isinstance(param, Keyword):
+                if param.name in self._keywords:
+                    raise ValueError(f"Duplicate keyword parameter {param.name!r}")
+                self._keywords[param.name] = param
+            elif self._variadic is not None:
+                raise ValueError("Variadic must be the last positional parameter")
+            elif isinstance(param, Variadic):
+                self._variadic = param
+            else:
+                self._positional.append(param)
+
+        # Without variadic and keyword parameters, extra words are never used
+        if self._variadic is None and not self._keywords:
+            self._max_tokens: int | None = len(self._positional)
+        else:
+            self._max_tokens = None
+
+    def parse(self, text: str | None) -> tuple[list, dict[str, typing.Any], list[str]]:
+        """
+        Convert the text of a command message into handler arguments.
+
+        The first word (the command itself) is skipped. Converting stops at the first
+        positional argument whose parameter type raises, so the handler defaults
+        apply from there on.
+
+        Returns:
+            tuple[list, dict[str, Any], list[str]]: Positional arguments,
+                keyword arguments and parse errors.
+        """
+        args: list = []
+        kwargs: dict[str, typing.Any] = {}
+
+        if not text:
+            return args, kwargs, []
+
+        start = _COMMAND_RE.match(text).end() # pyright: ignore[reportOptionalMemberAccess]
+        arguments = text[start:start + self._max_length]
+        words, errors = tokenize(arguments, self._max_tokens)
+
+        if len(text) - start > self._max_length:
+            errors.append(f"arguments truncated to {self._max_length} characters")
+
+        positional: list[str] = []
+
+        for word in words:
+            if self._keywords:
+                name, eq, value = word.partition("=")
+                if eq and name in self._keywords:
+                    try:
+                        kwargs[name] = self._keywords[name](value)
+                    except Exception as exception:
+                        errors.append(f"{name}: {exception}")
+                    continue
+            positional.append(word)
+
+        count = len(self._positional)
+
+        for ptype, value in zip(self._positional, positional):
+            try:
+                args.append(ptype(value))
+            except Exception as exception:
+                errors.append(f"argument {len(args) + 1}: {exception}")
+                return args, kwargs, errors
+
+        if self._variadic is not None:
+            for value in positional[count:]:
+                try:
+                    args.append(self._variadic(value))
+                except Exception as exception:
+                    errors.append(f"argument {len(args) + 1}: {exception}")
+                    break
+
+        return args, kwargs, errors
@@ -1,6 +1,9 @@
+import heapq
+import itertools
 import threading
+import time
 
-from typing import Callable
+from typing import Any, Callable
 
 # Logging
 from ._logger import logger as _logger
@@ -164,4 +167,59 @@ def every(
         """
         return PeriodicTask(func, total_seconds)
 
-    return decorator
\ No newline at end of file
+    return decorator
+
+
+class _Timers:
+    """
+    One-shot delayed calls, all run by a single daemon thread that sleeps until
+    the earliest deadline of a heap — instead of one `threading.Timer` thread per call.
+
+    Calls run on that thread one after another, so they should be short.
+    """
+
+    def __init__(self) -> None:
+        # (deadline, sequence number, func, args); the number keeps equal deadlines in order
+        self._heap: list[tuple[float, int, Callable, tuple[Any, ...]]] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    def call_later(self, seconds: float, func: Callable, *args: Any) -> None:
+        """Calls ``func(*args)`` on the timer thread in ``seconds``."""
+        deadline: float = time.monotonic() + seconds
+
+        with self._condition:
+            heapq.heappush(self._heap, (deadline, next(self._counter), func, args))
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="telekit/timers", daemon=True)
+                self._thread.start()
+            elif self._heap[0][0] == deadline:
+                # the new call is the earliest one
+                self._condition.notify()
+
+    def _run(self) -> None:
+        heap = self._heap
+
+        while True:
+            with self._condition:
+                while True:
+                    timeout: float | None = heap[0][0] - time.monotonic() if heap else None
+                    if timeout is not None and timeout <= 0:
+                        break
+                    self._condition.wait(timeout)
+
+                _, _, func, args = heapq.heappop(heap)
+
+            try:
+                func(*args)
+            except Exception as exc:  # noqa: BLE001
+                _library.exception(
+                    "Error in delayed call '%s': %s",
+                    getattr(func, "__name__", func),
+                    exc,
+                )
+
+
+_timers = _Timers()
@@ -37,6 +37,8 @@ from telebot.types import (
 
 from telekit.debug import Debug
 from telekit.styles import TextEntity, Escape, Raw, Group, Bold, Italic
+from telekit._buildtext.entities import EntityBuffer, make_fragment, strip_fragment
+from telekit._buildtext.limits import TEXT_LIMIT, CAPTION_LIMIT, visible_text, visible_length, split_text
 from telekit.types import ParseMode, Effect as _Effect, ChatAction as _ChatAction
 from telekit import dices
 from ._logger import logger
@@ -44,7 +46,8 @@ library = logger.library
 
 __all__ = [
     "TempMessageStore",
-    "BaseSender", "Sender"
+    "BaseSender", "Sender",
+    "MessageTooLongError"
 ]
 
 # ---------------------------------------------------------------------------------
@@ -99,8 +102,33 @@ class TempMessageStore:
 class _FallbackToSend(Exception):
     """Raised when editing is not supported — silently falls back to delete + send."""
 
+class MessageTooLongError(ValueError):
+    """Raised before sending a text longer than Telegram allows (see `BaseSender.set_length_policy`)."""
+
+    def __init__(self, length: int, limit: int, advice: str = "Use sender.set_length_policy('split') or 'document' to send it anyway."):
+        self.length = length
+        self.limit = limit
+        super().__init__(
+            f"The {'caption' if limit == CAPTION_LIMIT else 'message text'} is {length} characters long, "
+            f"Telegram allows {limit}. {advice}"
+        )
+
 class BaseSender:
 
+    __slots__ = (
+        "chat_id", "text", "entities", "reply_markup",
+        "is_temporary", "delele_temporaries",
+        "parse_mode", "reply_to_message_id", "edit_message_id", "edit_message",
+        "thread_id", "message_effect_id",
+        "disable_notification", "protect_content", "reply_parameters",
+        "link_preview_options", "show_caption_above_media",
+        "photo", "document", "video", "animation", "audio", "voice", "video_note",
+        "audio_performer", "audio_title", "venue", "media",
+        "_do_remove_text", "_do_remove_attachments",
+        "length_policy",
+        "sent_message",
+    )
+
     bot: TeleBot
 
     Effect: type[_Effect] = _Effect
@@ -116,7 +144,7 @@ class BaseSender:
         """
         cls.bot = bot
 
-    parse_mode: Literal["html", "markdown"] | None
+    parse_mode: Literal["html", "markdown", "entities"] | None
 
     def _get_parse_mode(self):
         match self.parse_mode:
@@ -137,7 +165,7 @@ class BaseSender:
             is_temporary: bool = False,
             delele_temporaries: bool = True,
             
-            parse_mode: Literal["html", "markdown"] | ParseMode | None = "html",
+            parse_mode: Literal["html", "markdown", "entities"] | ParseMode | None = "html",
             reply_to_message_id: int | None = None,
 
             edit_message_id: int | None = None,
@@ -169,6 +197,7 @@ class BaseSender:
         self.chat_id = chat_id
         
         self.text = text
+        self.entities: list[MessageEntity] | None = None
         self.reply_markup = reply_markup
         
         self.is_temporary = is_temporary
@@ -178,6 +207,7 @@ class BaseSender:
         self.reply_to_message_id = reply_to_message_id
 
         self.edit_message_id = edit_message_id
+        self.edit_message: Message | None = None
 
         self.thread_id = thread_id
         self.message_effect_id = effect_id
@@ -202,6 +232,8 @@ class BaseSender:
         self._do_remove_text = True
         self._do_remove_attachments = True
 
+        self.length_policy: Literal["error", "split", "document"] = "error"
+
         self.sent_message: Message | None = None
 
     # --------------------------------------------------------
@@ -457,6 +489,7 @@ class BaseSender:
                 media.parse_mode = self._get_parse_mode()
                 return media
             self.media[0].caption = self.text
+            self.media[0].caption_entities = self._get_entities()
             self.media = list(map(f, self.media))
 
     # --------------------------------------------------------
@@ -490,14 +523,17 @@ class BaseSender:
         """
         self.chat_id = chat_id
 
-    def set_text(self, text: str):
+    def set_text(self, text: str, entities: list[MessageEntity] | None = None):
         """
         Sets the plain text of the message.
         
         :param text: A simple text message. Not sanitized. HTML and Markdown tags are allowed
         :type text: str
+        :param entities: Formatting of the text, sent when the parse mode is `entities`
+        :type entities: list[MessageEntity] | None
         """
         self.text = text
+        self.entities = entities
 
     def set_reply_markup(self, reply_markup):
         """
@@ -517,11 +553,14 @@ class BaseSender:
         """
         self.delele_temporaries = del_temps
 
-    def set_parse_mode(self, parse_mode: Literal["html", "markdown"] | ParseMode | None):
+    def set_parse_mode(self, parse_mode: Literal["html", "markdown", "entities"] | ParseMode | None):
         """
         Sets the parse mode to the message
         
-        :param parse_mode: `html`, `markdown` or `None`.  
+        With `entities`, styled text is sent as plain text with a list of `MessageEntity`
+        instead of markup, so nothing has to be escaped or parsed by Telegram.
+
+        :param parse_mode: `html`, `markdown`, `entities` or `None`.  
         :type parse_mode: str | None
         """
         match parse_mode:
@@ -531,16 +570,36 @@ class BaseSender:
                 self.parse_mode = "html"
             case "markdown":
                 self.parse_mode = "markdown"
+            case "entities":
+                self.parse_mode = "entities"
             case None:
                 self.parse_mode = None
             case _:
                 raise ValueError("Invalid Parse Mode")
 
+    def set_length_policy(self, policy: Literal["error", "split", "document"]):
+        """
+        Sets what happens to a text longer than Telegram allows
+        (4096 characters, 1024 for captions; counted without markup, emoji count twice).
+        The length is checked before anything is sent:
+
+        - `error`    — raise `MessageTooLongError` (default)
+        - `split`    — send the text in several messages; the keyboard goes under the last one
+        - `document` — send the text as a `.txt` file (too long captions are split)
+
+        :param policy: `error`, `split` or `document`.
+        :type policy: str
+        """
+        if policy not in ("error", "split", "document"):
+            raise ValueError(f"Invalid length policy: {policy!r}")
+        self.length_policy = policy
+
     def set_edit_message_id(self, edit_message_id: int | None):
         """
         Edit an existing message by ID.
         """
         self.edit_message_id = edit_message_id
+        self.edit_message = None
 
     def set_edit_message(self, edit_message: Message | None):
         """
@@ -548,10 +607,12 @@ class BaseSender:
         """
         if edit_message is None:
             self.edit_message_id = None
+            self.edit_message = None
             return
 
         if getattr(edit_message, "message_id", None) is not None:
             self.edit_message_id = edit_message.message_id
+            self.edit_message = edit_message
 
     def set_reply_to(self, reply_to: Message | None):
         """
@@ -740,6 +801,7 @@ class BaseSender:
 
     def remove_text(self):
         self.text = ""
+        self.entities = None
 
     def remove_attachments(self):
         """
@@ -768,6 +830,9 @@ class BaseSender:
     # Methods for preparing send and edit message configurations
     # --------------------------------------------------------
 
+    def _get_entities(self) -> list[MessageEntity] | None:
+        return self.entities if self.parse_mode == "entities" else None
+
     def _get_base_params(self) -> dict[str, Any]:
         return {
             "chat_id": self.chat_id,
@@ -862,6 +927,66 @@ class BaseSender:
 
         return params
 
+    # --------------------------------------------------------
+    # Internal methods for checking the message length
+    # --------------------------------------------------------
+
+    def _get_length_limit(self) -> int | None:
+        if self.video_note or self.venue:
+            # sent without the text
+            return None
+        if self.photo or self.document or self.video or self.animation or self.audio or self.voice or self.media:
+            return CAPTION_LIMIT
+        return TEXT_LIMIT
+
+    def _apply_length_policy(self) -> tuple[list[tuple[str, list[MessageEntity] | None]], Any]:
+        """
+        Fits the text into Telegram's limit before anything is sent; the sender itself is left as is.
+        Returns the parts to send (the message first, then the rest if it was split) and the document to attach.
+        """
+        limit: int | None = self._get_length_limit()
+        unchanged = [(self.text, self._get_entities())], self.document
+
+        if limit is None or not self.text:
+            return unchanged
+
+        length: int = visible_length(self.text, self.parse_mode)
+
+        if length <= limit:
+            return unchanged
+
+        if self.length_policy == "error":
+            raise MessageTooLongError(length, limit)
+
+        if self.length_policy == "document" and limit == TEXT_LIMIT:
+            document = io.BytesIO(visible_text(self.text, self.parse_mode).encode("utf-8"))
+            document.name = "message.txt"
+            return [("", None)], document
+
+        try:
+            parts = split_text(self.text, self.parse_mode, TEXT_LIMIT, self._get_entities(), first=limit)
+        except ValueError as exception:
+            # only MarkdownV2 can not be split
+            raise MessageTooLongError(
+                length, limit, "MarkdownV2 can't be split; use the 'html' or 'entities' parse mode, or sender.set_length_policy('document')."
+            ) from exception
+
+        return parts, self.document
+
+    def _send_rest(self, parts: list[tuple[str, list[MessageEntity] | None]], reply_markup: Any) -> Message | None:
+        message: Message | None = None
+        params: dict[str, Any] = self._get_base_params()
+
+        for index, (text, entities) in enumerate(parts):
+            if index == len(parts) - 1 and reply_markup:
+                params["reply_markup"] = reply_markup
+
+            message = self.bot.send_message(text=text, entities=entities, **params)
+            self._handle_is_temp(message)
+
+        self.sent_message = message
+        return message
+
     # --------------------------------------------------------
     # Internal methods for managing temporary messages
     # --------------------------------------------------------
@@ -890,15 +1015,20 @@ class BaseSender:
     # Internal send dispatcher
     # --------------------------------------------------------
 
-    def _edit_or_send(self) -> tuple[Message | None, bool]:
+    def _edit_or_send(self, text: str, entities: list[MessageEntity] | None, document: Any) -> tuple[Message | None, bool]:
         if self.edit_message_id:
 
             try:
-                return self._edit(), True
+                return self._edit(text, entities, document), True
             except _FallbackToSend:
                 # silently delete and resend
                 self._delete_message(self.edit_message_id)
             except Exception as exception:
+                if "message is not modified" in str(exception):
+                    # it already shows what was asked for
+                    self._reset_after_send()
+                    return self.edit_message, True
+
                 _SILENT_EDIT_ERRORS = (
                     "Bad Request: there is no text in the message to edit",
                     "Bad Request: message can't be edited",
@@ -910,25 +1040,25 @@ class BaseSender:
                     )
                 self._delete_message(self.edit_message_id)
         
-        return self._send(), False
+        return self._send(text, entities, document), False
     
     # --------------------------------------------------------
     # Internal methods for sending messages
     # --------------------------------------------------------
 
-    def _send(self) -> Message | None:
+    def _send(self, text: str, entities: list[MessageEntity] | None, document: Any) -> Message | None:
         if self.photo:
-            message = self._send_photo()
-        elif self.document:
-            message = self._send_document()
+            message = self._send_photo(text, entities)
+        elif document:
+            message = self._send_document(document, text, entities)
         elif self.video:
-            message = self._send_video()
+            message = self._send_video(text, entities)
         elif self.animation:
-            message = self._send_animation()
+            message = self._send_animation(text, entities)
         elif self.audio:
-            message = self._send_audio()
+            message = self._send_audio(text, entities)
         elif self.voice:
-            message = self._send_voice()
+            message = self._send_voice(text, entities)
         elif self.video_note:
             message = self._send_video_note()
         elif self.venue:
@@ -936,57 +1066,63 @@ class BaseSender:
         elif self.media:
             message = self._send_media()
         else:
-            message = self._send_text()
+            message = self._send_text(text, entities)
         
         self._reset_after_send()
         self.sent_message = message
 
         return message
         
-    def _send_photo(self) -> Message | None:
+    def _send_photo(self, text: str, entities: list[MessageEntity] | None) -> Message | None:
         return self.bot.send_photo(
             photo=self.photo,
-            caption=self.text,
+            caption=text,
+            caption_entities=entities,
             show_caption_above_media=self.show_caption_above_media,
             **self.get_send_media_params()
         )
     
-    def _send_video(self) -> Message | None:
+    def _send_video(self, text: str, entities: list[MessageEntity] | None) -> Message | None:
         return self.bot.send_video(
             video=self.video,
-            caption=self.text,
+            caption=text,
+            caption_entities=entities,
             show_caption_above_media=self.show_caption_above_media,
             **self.get_send_media_params()
         )
     
-    def _send_animation(self) -> Message | None:
+    def _send_animation(self, text: str, entities: list[MessageEntity] | None) -> Message | None:
         return self.bot.send_animation(
             animation=self.animation,
-            caption=self.text,
+            caption=text,
+            caption_entities=entities,
             show_caption_above_media=self.show_caption_above_media,
             **self.get_send_media_params()
         )
     
-    def _send_document(self) -> Message | None:
+    def _send_document(self, document: Any, text: str, entities: list[MessageEntity] | None) -> Message | None:
         return self.bot.send_document(
-            document=self.document,
-            caption=self.text,
+            document=document,
+            caption=text,
+            caption_entities=entities,
             **self.get_send_media_params()
         )
     
-    def _send_audio(self) -> Message | None:
+    def _send_audio(self, text: str, entities: list[MessageEntity] | None) -> Message | None:
         return self.bot.send_audio(
             audio=self.audio,
-            caption=self.text,
+            caption=text,
+            caption_entities=entities,
             title=self.audio_title,
             performer=self.audio_performer,
             **self.get_send_media_params()
         )
     
-    def _send_voice(self) -> Message | None:
+    def _send_voice(self, text: str, entities: list[MessageEntity] | None) -> Message | None:
         return self.bot.send_voice(
             voice=self.voice,
-            caption=self.text,
+            caption=text,
+            caption_entities=entities,
             **self.get_send_media_params()
         )
     
@@ -1019,9 +1155,10 @@ class BaseSender:
             **self.get_send_media_params(ignore=("parse_mode", "reply_to_message_id"))
         )[0]
     
-    def _send_text(self):
+    def _send_text(self, text: str, entities: list[MessageEntity] | None):
         return self.bot.send_message(
-            text=self.text,
+            text=text,
+            entities=entities,
             **self._get_send_params()
         )
     
@@ -1029,7 +1166,7 @@ class BaseSender:
     # Internal methods for editing messages
     # --------------------------------------------------------
 
-    def _edit(self) -> Message | None:
+    def _edit(self, text: str, entities: list[MessageEntity] | None, document: Any) -> Message | None:
         if not self.edit_message_id:
             raise ValueError("edit_message_id is None: Unable to edit message without a valid message ID.")
 
@@ -1037,15 +1174,15 @@ class BaseSender:
             raise _FallbackToSend("ReplyKeyboardMarkup cannot be edited")
 
         if self.photo:
-            message = self._edit_photo()
-        elif self.document:
-            message = self._edit_document()
+            message = self._edit_photo(text, entities)
+        elif document:
+            message = self._edit_document(document, text, entities)
         elif self.video:
-            message = self._edit_video()
+            message = self._edit_video(text, entities)
         elif self.animation:
-            message = self._edit_animation()
+            message = self._edit_animation(text, entities)
         elif self.audio:
-            message = self._edit_audio()
+            message = self._edit_audio(text, entities)
         elif self.voice:
             message = self._edit_voice()
         elif self.video_note:
@@ -1055,7 +1192,7 @@ class BaseSender:
         elif self.media:
             message = self._edit_media()
         else:
-            message = self._edit_text()
+            message = self._edit_text(text, entities)
 
         self._reset_after_send()
 
@@ -1063,61 +1200,67 @@ class BaseSender:
             self.sent_message = message
             return message
 
-    def _edit_text(self) -> Message | bool:
+    def _edit_text(self, text: str, entities: list[MessageEntity] | None) -> Message | bool:
         configs: dict = self._get_edit_params()
         return self.bot.edit_message_text(
-            text=self.text,
+            text=text,
+            entities=entities,
             parse_mode=self._get_parse_mode(),
             link_preview_options=self.link_preview_options,
             **configs,
         )
 
-    def _edit_document(self) -> Message | bool:
+    def _edit_document(self, document: Any, text: str, entities: list[MessageEntity] | None) -> Message | bool:
         configs: dict = self._get_edit_params()
         media = InputMediaDocument(
-            media=self.document,
-            caption=self.text,
+            media=document,
+            caption=text,
+            caption_entities=entities,
             parse_mode=self._get_parse_mode(),
         )
         return self.bot.edit_message_media(media=media, **configs)
 
-    def _edit_video(self) -> Message | bool:
+    def _edit_video(self, text: str, entities: list[MessageEntity] | None) -> Message | bool:
         configs: dict = self._get_edit_params()
         media = InputMediaVideo(
             media=self.video,
-            caption=self.text,
+            caption=text,
+            caption_entities=entities,
             show_caption_above_media=self.show_caption_above_media,
             parse_mode=self._get_parse_mode(),
         )
         return self.bot.edit_message_media(media=media, **configs)
 
-    def _edit_animation(self) -> Message | bool:
+    def _edit_animation(self, text: str, entities: list[MessageEntity] | None) -> Message | bool:
         configs: dict = self._get_edit_params()
         media = InputMediaAnimation(
             media=self.animation,
-            caption=self.text,
+            caption=text,
+            caption_entities=entities,
             show_caption_above_media=self.show_caption_above_media,
             parse_mode=self._get_parse_mode(),
         )
         return self.bot.edit_message_media(media=media, **configs)
 
-    def _edit_audio(self) -> Message | bool:
+    def _edit_audio(self, text: str, entities: list[MessageEntity] | None) -> Message | bool:
         configs: dict = self._get_edit_params()
         media = InputMediaAudio(
             media=self.audio,
-            caption=self.text,
+            caption=text,
+            caption_entities=entities,
             performer=self.audio_performer,
             title=self.audio_title,
             parse_mode=self._get_parse_mode(),
         )
         return self.bot.edit_message_media(media=media, **configs)
     
-    def _edit_photo(self) -> Message | bool:
+    def _edit_photo(self, text: str, entities: list[MessageEntity] | None) -> Message | bool:
         configs: dict = self._get_edit_params()
 
         media = InputMediaPhoto(
             media=self.photo, 
-            caption=self.text, 
+            caption=text, 
+            caption_entities=entities,
             show_caption_above_media=self.show_caption_above_media,
             parse_mode=self._get_parse_mode()
         )
@@ -1277,12 +1420,31 @@ class BaseSender:
 
         Returns:
             Message | None: The sent or edited message.
+            The last one if the text was split (see `set_length_policy`).
+
+        Raises:
+            MessageTooLongError: If the text is too long and the length policy is `error`.
         """
-        message, edited = self._edit_or_send()
+        parts, document = self._apply_length_policy()
+        (text, entities), *rest = parts
+
+        if not rest:
+            message, edited = self._edit_or_send(text, entities, document)
+            self._handle_temporary(message, edited)
+            return message
+
+        # the keyboard goes under the last part
+        reply_markup = self.reply_markup
+        self.reply_markup = None
+
+        try:
+            message, edited = self._edit_or_send(text, entities, document)
+        finally:
+            self.reply_markup = reply_markup
 
         self._handle_temporary(message, edited)
 
-        return message
+        return self._send_rest(rest, reply_markup) or message
 
     # --------------------------------------------------------
     # Methods for sending chat actions and retrieving message IDs
@@ -1551,6 +1713,8 @@ class BaseSender:
 
 class Sender(BaseSender):
 
+    __slots__ = ("_text", "_title", "_message", "_additional", "_use_italics", "_new_lines")
+
     _text: Group | None
     _title: Bold | None
     _message: Group | None
@@ -1598,7 +1762,7 @@ class Sender(BaseSender):
         if self._additional:
             text = text + self._additional
 
-        super().set_text(text.render(self.parse_mode))
+        self._set_rendered_text(text)
 
     def _compile_alert(self):
         title: Bold | None = self._title
@@ -1616,6 +1780,10 @@ class Sender(BaseSender):
         if self._use_italics and message:
             message = Italic(message)
 
+        if self.parse_mode == "entities":
+            self._compile_alert_entities(title, message)
+            return
+
         text = ""
 
         if title:
@@ -1633,7 +1801,28 @@ class Sender(BaseSender):
         if self._additional is None:
             raise ValueError("Sender._additional is None")
 
-        super().set_text(self._additional.render(self.parse_mode))
+        self._set_rendered_text(self._additional)
+
+    def _compile_alert_entities(self, title: Bold | None, message: TextEntity | None):
+        # same layout as `_compile_alert`, the entities are moved along with the text
+        out = EntityBuffer()
+
+        if title:
+            out.append(strip_fragment(make_fragment(*title.render_entities()), "\n", left=False))
+
+        if self._new_lines and title and message:
+            out.append("\n" * self._new_lines)
+
+        if message:
+            out.append(strip_fragment(make_fragment(*message.render_entities()), "\n", right=False))
+
+        super().set_text(*out.result())
+
+    def _set_rendered_text(self, text: TextEntity):
+        if self.parse_mode == "entities":
+            super().set_text(*text.render_entities())
+        else:
+            super().set_text(text.render(self.parse_mode))
 
     # --------------------------------------------------------
     # Setter methods for configuring alert-styled message properties
@@ -23,6 +23,7 @@ import sys
 from typing import Optional
 
 from . import _init, _state, debug as _debug
+from .middleware import Middleware, _Pipeline
 import telebot
 
 from ._logger import logger
@@ -55,6 +56,27 @@ class Server:
         self._bot = bot
         _init.init(bot)
 
+    def middleware(self, middleware: Middleware) -> Middleware:
+        """
+        Adds a middleware that runs on every raw update before any handler is created.
+        Middlewares run in the order they were added. Can be used as a decorator:
+
+        ```
+        @server.middleware
+        def maintenance(update, data):
+            if MAINTENANCE:
+                return False  # drop the update
+        ```
+
+        See `telekit.middleware` for return values and the `data` dict.
+        """
+        _Pipeline.add(middleware)
+        return middleware
+
+    def remove_middleware(self, middleware: Middleware) -> None:
+        """Removes a middleware previously added with `middleware()`."""
+        _Pipeline.remove(middleware)
+
     def infinity_polling(
             self, 
             *, 
@@ -18,6 +18,7 @@
 # 
 
 from ._buildtext.styles import *
+from ._buildtext.template import Slot, CompiledText, compile
 
 __all__ = [
     "TextEntity",
@@ -28,6 +29,7 @@ __all__ = [
 
     "Group",
     "Stack",
+    "LazyStack",
 
     "Escape",
     "Raw",
@@ -50,6 +52,10 @@ __all__ = [
 
     "EncodeURL",
 
+    # `compile` is left out so that `import *` does not shadow the builtin; use `styles.compile`
+    "Slot",
+    "CompiledText",
+
     "label_cheatsheet"
 ]
 
@@ -1,4 +1,4 @@
 from .track_handoff_origin import TrackHandoffOrigin
-from .paginated_choice import PaginatedChoice
+from .paginated_choice import PaginatedChoice, PageSource, SequencePageSource, VaultPageSource, SQLPageSource
 from .paginated_text import PaginatedText
 from .calendar_pick import CalendarPick
\ No newline at end of file
@@ -44,12 +44,14 @@ from __future__ import annotations
 
 import calendar
 import datetime
+import functools
 import re
 from dataclasses import dataclass, field
 from typing import Callable
 
 import telekit
 from telekit.types import InlineKeyboard
+from telekit.inline_buttons import InlineButton, CallbackButton, StaticButton
 
 __all__ = ["CalendarPick"]
 
@@ -69,36 +71,38 @@ _CAL = calendar.Calendar(firstweekday=0)
 # Number of years shown per page in the decade picker.
 _DECADE_SIZE = 10
 
+# Static buttons hold no per-user state, so cached layouts share them.
+_STATIC = StaticButton()
+_STATIC_TODAY = StaticButton(style="danger")
+
+_WEEKDAY_ROW = tuple((label, _STATIC) for label in _WEEKDAYS)
+
 
 # ---------------------------------------------------------------------------
 # Picker context
 # ---------------------------------------------------------------------------
 
 @dataclass(frozen=True)
-class _Ctx:
+class _Bounds:
     """
-    Immutable snapshot of all picker constraints passed between view renderers.
+    The locking constraints of a picker, without anything user-specific,
+    so that layouts computed for them can be shared between users.
 
     All constraint checks must go through the helpers defined below so that
     no view can accidentally bypass locking rules.
 
-    :param on_date: Callback fired when the user confirms a day.
     :param locked_month: ``(year, month)`` pair that pins the picker to a
         single month; navigation is hidden entirely.
     :param locked_year: Year that pins the picker to a single year; the user
         may choose any month within that year.
     :param min_year: Lower bound of the allowed year range (inclusive).
     :param max_year: Upper bound of the allowed year range (inclusive).
-    :param show_nav_hints: When ``True`` arrow labels include the neighbour
-        value (e.g. ``< Apr`` or ``2026 >``).
     """
 
-    on_date:        Callable[[datetime.date], None]
     locked_month:   tuple[int, int] | None
     locked_year:    int | None
     min_year:       int | None
     max_year:       int | None
-    show_nav_hints: bool = field(default=False)
 
     # ------------------------------------------------------------------
     # Constraint helpers — all locking logic lives here
@@ -135,6 +139,25 @@ class _Ctx:
         return year
 
 
+@dataclass(frozen=True)
+class _Ctx(_Bounds):
+    """
+    Immutable snapshot of all picker constraints passed between view renderers.
+
+    :param on_date: Callback fired when the user confirms a day.
+    :param show_nav_hints: When ``True`` arrow labels include the neighbour
+        value (e.g. ``< Apr`` or ``2026 >``).
+    """
+
+    on_date:        Callable[[datetime.date], None]
+    show_nav_hints: bool = field(default=False)
+
+    @property
+    def bounds(self) -> _Bounds:
+        """The constraints alone, as the key of shared layouts."""
+        return _Bounds(self.locked_month, self.locked_year, self.min_year, self.max_year)
+
+
 # ---------------------------------------------------------------------------
 # Date text parser
 # ---------------------------------------------------------------------------
@@ -219,6 +242,60 @@ def _decade_start(year: int) -> int:
     return (year // _DECADE_SIZE) * _DECADE_SIZE
 
 
+# ---------------------------------------------------------------------------
+# Shared layouts
+# ---------------------------------------------------------------------------
+#
+# The parts of a view that depend only on the period shown and the bounds are
+# computed once for all users; a render adds the callback buttons and today's
+# highlight on top.
+
+@functools.lru_cache(maxsize=512)
+def _month_cells(year: int, month: int) -> tuple[tuple[tuple[str, datetime.date | None], ...], ...]:
+    """
+    Day-grid rows of *(year, month)* as ``(label, date)`` cells, in the week
+    order of :data:`_CAL`. Blank cells have ``date=None`` and distinct labels.
+
+    :param year: Year of the month.
+    :param month: Month (1-12).
+    :returns: One row of seven cells per week.
+    """
+    rows: list[tuple[tuple[str, datetime.date | None], ...]] = []
+    blanks = 0
+    for week in _CAL.monthdayscalendar(year, month):
+        row: list[tuple[str, datetime.date | None]] = []
+        for day in week:
+            if day == 0:
+                blanks += 1
+                row.append((_BLANK * blanks, None))
+            else:
+                row.append((str(day), datetime.date(year, month, day)))
+        rows.append(tuple(row))
+    return tuple(rows)
+
+
+@functools.lru_cache(maxsize=512)
+def _year_cells(year: int, bounds: _Bounds) -> tuple[tuple[int, str, bool], ...]:
+    """
+    The months of *year* as ``(month, name, allowed)`` cells.
+
+    :param year: The year whose months are listed.
+    :param bounds: Constraints deciding which months can be opened.
+    """
+    return tuple((i + 1, name, bounds.month_allowed(year, i + 1)) for i, name in enumerate(_MONTHS))
+
+
+@functools.lru_cache(maxsize=512)
+def _decade_cells(first_year: int, bounds: _Bounds) -> tuple[tuple[int, bool], ...]:
+    """
+    The years of the decade page starting at *first_year* as ``(year, allowed)`` cells.
+
+    :param first_year: First year of the page.
+    :param bounds: Constraints deciding which years can be opened.
+    """
+    return tuple((y, bounds.year_allowed(y)) for y in range(first_year, first_year + _DECADE_SIZE))
+
+
 # ---------------------------------------------------------------------------
 # Trait
 # ---------------------------------------------------------------------------
@@ -381,29 +458,21 @@ class CalendarPick(telekit.Trait):
             else:
                 kb.add_static(year_label)
 
-        # -- Weekday labels row ----------------------------------------------
-        kb.row()
-        for label in _WEEKDAYS:
-            kb.add_static(label)
-
-        # -- Day grid --------------------------------------------------------
-        kb.grid(7)
-        blanks = 0
-        for week in _CAL.monthdayscalendar(year, month):
-            for day in week:
-                if day == 0:
-                    blanks += 1
-                    kb.add_static(_BLANK * blanks)
+        # -- Weekday labels row and day grid ---------------------------------
+        # The shared layout of the month, with today highlighted on top.
+        pass_kwargs = {"ctx": ctx}
+        rows: list[list[tuple[str, InlineButton]]] = [list(_WEEKDAY_ROW)]
+        for week in _month_cells(year, month):
+            row: list[tuple[str, InlineButton]] = []
+            for label, date in week:
+                if date is None:
+                    row.append((label, _STATIC))
+                elif date == today:
+                    row.append((f"·{label}·", CallbackButton(self.__calendar_pick_pick, (date,), pass_kwargs, style="danger")))
                 else:
-                    date = datetime.date(year, month, day)
-                    is_today: bool = date == today
-                    label: str = f"·{day}·" if is_today else str(day)
-                    kb.add_callback(
-                        label, self.__calendar_pick_pick,
-                        pass_args=(date,), pass_kwargs={"ctx": ctx},
-                        style="danger" if is_today else None
-                    )
-        kb.grid_end()
+                    row.append((label, CallbackButton(self.__calendar_pick_pick, (date,), pass_kwargs)))
+            rows.append(row)
+        kb.extend_rows(*rows)
 
         # -- Navigation row --------------------------------------------------
         if not locked:
@@ -541,20 +610,19 @@ class CalendarPick(telekit.Trait):
         # -- Month grid ------------------------------------------------------
         # Current month is highlighted with centre dots when year matches today.
         # Months outside the allowed range become static (unclickable).
-        kb.grid(3)
-        for i, name in enumerate(_MONTHS):
-            m     = i + 1
+        pass_kwargs = {"ctx": ctx}
+        cells: list[tuple[str, InlineButton]] = []
+        for m, name, allowed in _year_cells(year, ctx.bounds):
             is_current = (year == today.year and m == today.month)
             label = f"·{name}·" if is_current else name
-            if ctx.month_allowed(year, m):
-                kb.add_callback(
-                    label, self.__calendar_pick_goto_month,
-                    pass_args=(year, m), pass_kwargs={"ctx": ctx},
-                    style="danger" if is_current else None
-                )
+            if allowed:
+                cells.append((label, CallbackButton(
+                    self.__calendar_pick_goto_month, (year, m), pass_kwargs,
+                    style="danger" if is_current else None,
+                )))
             else:
-                kb.add_static(label, style="danger" if is_current else None)
-        kb.grid_end()
+                cells.append((label, _STATIC_TODAY if is_current else _STATIC))
+        kb.extend_rows(*(cells[i : i + 3] for i in range(0, len(cells), 3)))
 
         # -- Navigation row --------------------------------------------------
         if ctx.locked_year is None:
@@ -678,19 +746,20 @@ class CalendarPick(telekit.Trait):
         kb.add_static(f"{first_year} – {last_year}")
 
         # -- Year grid (2 x 5) -----------------------------------------------
-        kb.grid(2)
-        for y in range(first_year, first_year + _DECADE_SIZE):
+        bounds      = ctx.bounds
+        pass_kwargs = {"ctx": ctx}
+        cells: list[tuple[str, InlineButton]] = []
+        for y, allowed in _decade_cells(first_year, bounds):
             is_current = y == today.year
             label = f"·{y}·" if is_current else str(y)
-            if ctx.year_allowed(y):
-                kb.add_callback(
-                    label, self.__calendar_pick_goto_year,
-                    pass_args=(y,), pass_kwargs={"ctx": ctx},
-                    style="danger" if is_current else None
-                )
+            if allowed:
+                cells.append((label, CallbackButton(
+                    self.__calendar_pick_goto_year, (y,), pass_kwargs,
+                    style="danger" if is_current else None,
+                )))
             else:
-                kb.add_static(label, style="danger" if is_current else None)
-        kb.grid_end()
+                cells.append((label, _STATIC_TODAY if is_current else _STATIC))
+        kb.extend_rows(*(cells[i : i + 2] for i in range(0, len(cells), 2)))
 
         # -- Navigation row --------------------------------------------------
         if ctx.locked_year is None:
@@ -699,7 +768,7 @@ class CalendarPick(telekit.Trait):
 
             # A page is reachable when at least one year on it is allowed.
             def _page_reachable(pf: int) -> bool:
-                return any(ctx.year_allowed(y) for y in range(pf, pf + _DECADE_SIZE))
+                return any(allowed for _, allowed in _decade_cells(pf, bounds))
 
             can_prev = _page_reachable(prev_first)
             can_next = _page_reachable(next_first)
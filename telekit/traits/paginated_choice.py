@@ -1,4 +1,4 @@
-from typing import Callable, Any, Iterable
+from typing import Callable, Any, Iterable, Mapping, Protocol, Sequence, runtime_checkable
 from dataclasses import dataclass
 
 import telekit
@@ -9,6 +9,99 @@ from telekit.utils import compose_keyboard
 class _NavButton:
     start_index: int
 
+@runtime_checkable
+class PageSource[T](Protocol):
+    """
+    Where :meth:`PaginatedChoice.paginated_choice` takes its choices from, one page at a time.
+
+    Only the items of the page on screen are loaded, so a page flip costs
+    ``page_size`` items however many choices there are.
+    """
+
+    def count(self) -> int:
+        """Number of choices."""
+        ...
+
+    def fetch(self, offset: int, limit: int) -> Sequence[tuple[str, T]]:
+        """At most ``limit`` ``(label, value)`` pairs, skipping the first ``offset``."""
+        ...
+
+class SequencePageSource[T]:
+    """
+    :class:`PageSource` over a sequence (labelled with ``str(item)``)
+    or a mapping of labels to values. The sequence is not copied.
+    """
+
+    def __init__(self, items: Sequence[T] | Mapping[str, T]) -> None:
+        if isinstance(items, Mapping):
+            self._labels: Sequence[str] | None = list(items.keys())
+            self._items: Sequence[T] = list(items.values())
+        else:
+            self._labels = None
+            self._items = items
+
+    def count(self) -> int:
+        return len(self._items)
+
+    def fetch(self, offset: int, limit: int) -> list[tuple[str, T]]:
+        values = self._items[offset : offset + limit]
+        if self._labels is None:
+            return [(str(value), value) for value in values]
+        return list(zip(self._labels[offset : offset + limit], values))
+
+class VaultPageSource:
+    """
+    :class:`PageSource` over the items of a :class:`telekit.Vault`,
+    labelled with their keys, in the order of ``Vault.all()``.
+    """
+
+    def __init__(self, vault: telekit.Vault) -> None:
+        self._vault = vault
+
+    def count(self) -> int:
+        return self._vault.length()
+
+    def fetch(self, offset: int, limit: int) -> list[tuple[str, Any]]:
+        return [(str(key), value) for key, value in self._vault.page(offset, limit).items()]
+
+class SQLPageSource:
+    """
+    :class:`PageSource` over the rows of a SQL query, read with ``LIMIT`` and ``OFFSET``.
+
+    The query selects the label and then the value; a query with a single column
+    uses it as the value, labelled with ``str(value)``. Give it an ``ORDER BY``
+    so the pages do not shift between clicks.
+
+    Example::
+
+        source = SQLPageSource(connection, "SELECT name, id FROM products ORDER BY name")
+    """
+
+    def __init__(self, connection: Any, query: str, parameters: Sequence[Any] = ()) -> None:
+        """
+        :param connection: A DB-API connection, e.g. ``sqlite3.Connection``.
+        :param query: ``SELECT`` query without ``LIMIT``/``OFFSET``.
+        :param parameters: Parameters of the query.
+        """
+        self._connection = connection
+        self._query = query.strip().rstrip(";")
+        self._parameters = tuple(parameters)
+
+    def _rows(self, query: str) -> list[Any]:
+        cursor = self._connection.cursor()
+        try:
+            cursor.execute(query, self._parameters)
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+
+    def count(self) -> int:
+        return self._rows(f"SELECT COUNT(*) FROM ({self._query}) AS page_source")[0][0]
+
+    def fetch(self, offset: int, limit: int) -> list[tuple[str, Any]]:
+        rows = self._rows(f"{self._query} LIMIT {int(limit)} OFFSET {int(offset)}")
+        return [(str(row[0]), row[0]) if len(row) == 1 else (str(row[0]), row[1]) for row in rows]
+
 class PaginatedChoice(telekit.Trait):
     """
     A trait that adds a paginated inline keyboard to any handler.
@@ -63,7 +156,7 @@ class PaginatedChoice(telekit.Trait):
     PAGINATED_CHOICE_NEXT_LABEL: str = "Next »"
     PAGINATED_CHOICE_PAGE_LABEL: str | None = "{page} / {pages}"  # use .format(page=..., pages=...)
 
-    def paginated_choice[T](self, choices: dict[str, T] | Iterable[T], on_choice: Callable[[T], Any], on_update: Callable[[], Any] | None = None, row_width: int = 1, page_size: int = 10) -> None:
+    def paginated_choice[T](self, choices: PageSource[T] | dict[str, T] | Iterable[T], on_choice: Callable[[T], Any], on_update: Callable[[], Any] | None = None, row_width: int = 1, page_size: int = 10) -> None:
         """
         Display a paginated inline keyboard for choosing from a list of items.
 
@@ -72,8 +165,9 @@ class PaginatedChoice(telekit.Trait):
         ``on_choice`` is called immediately without rendering a keyboard.
 
         :param choices: Items to display. Accepts a ``dict[str, T]`` (label: value),
-                        or any ``Iterable[T]``.
-        :type choices: ``dict[str, T] | Iterable[T]``
+                        any ``Iterable[T]``, or a :class:`PageSource` that loads
+                        one page at a time (e.g. :class:`SQLPageSource`).
+        :type choices: ``PageSource[T] | dict[str, T] | Iterable[T]``
         :param on_choice: Callback invoked with the selected value.
         :type on_choice: ``Callable[[T], Any]``
         :param on_update: Optional callback invoked before each page render.
@@ -93,28 +187,31 @@ class PaginatedChoice(telekit.Trait):
                 row_width=5,
             )
         """
-        if isinstance(choices, dict):
-            _choices: dict[str, T] = choices.copy() # pyright: ignore[reportAssignmentType]
+        if isinstance(choices, PageSource):
+            source: PageSource[T] = choices
+        elif isinstance(choices, dict):
+            source = SequencePageSource(choices) # pyright: ignore[reportArgumentType]
         else:
-            _choices: dict[str, T] = {str(c): c for c in choices}
+            source = SequencePageSource({str(c): c for c in choices})
 
-        if len(_choices) == 1:
-            on_choice(next(iter(_choices.values())))
+        # counted once: the pages stay put while the user flips them
+        total = source.count()
+
+        if total == 1:
+            on_choice(source.fetch(0, 1)[0][1])
             return
         
-        self._paginated_choice(0, _choices, on_choice, on_update, row_width, page_size)
+        self._paginated_choice(0, source, total, on_choice, on_update, row_width, page_size)
 
-    def _paginated_choice[T](self, start: int, choices: dict[str, T], on_choice: Callable[[T], Any], on_update: Callable[[], Any] | None, row_width: int, page_size: int) -> None:
+    def _paginated_choice[T](self, start: int, source: PageSource[T], total: int, on_choice: Callable[[T], Any], on_update: Callable[[], Any] | None, row_width: int, page_size: int) -> None:
         if on_update is not None:
             on_update()
 
-        total = len(choices)
-
         page  = start // page_size + 1
         pages = (total + page_size - 1) // page_size
 
         # choices
-        page_items = list(choices.items())[start : start + page_size]
+        page_items = source.fetch(start, page_size)
 
         # navigation row
         has_back = start - page_size >= 0
@@ -134,7 +231,7 @@ class PaginatedChoice(telekit.Trait):
 
         def _on_choice(choice: T | _NavButton):
             if isinstance(choice, _NavButton):
-                self._paginated_choice(choice.start_index, choices, on_choice, on_update, row_width, page_size)
+                self._paginated_choice(choice.start_index, source, total, on_choice, on_update, row_width, page_size)
             else:
                 on_choice(choice)
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Callable, Any, Iterable
 
@@ -7,8 +9,10 @@ import telekit
 from telekit.utils import compose_keyboard
 from telekit.html_text import HTMLText
 from telekit.styles import Raw
+from telekit._buildtext.entities import utf16_len
+from telekit._buildtext.limits import TEXT_LIMIT, visible_text, split_html, HTMLSplitter
 
-_TG_MAX_CHARS    = 4096
+_TG_MAX_CHARS    = TEXT_LIMIT
 _ELLIPSIS_TOP    = ""
 _ELLIPSIS_BOTTOM = "…"
 
@@ -51,11 +55,20 @@ class _ShiftWindow:
     delta: int   # -10 or +10
 
 
+def _html_len(text: str) -> int:
+    """Visible length of an HTML string as Telegram counts it (UTF-16 code units, tags excluded)."""
+    return utf16_len(visible_text(text, "html"))
+
+
 def _sender_text_len(sender: Any) -> int:
-    """Return `len(sender._title + sender._additional)` safely."""
-    title = Raw(sender._title     ).html
-    end   = Raw(sender._additional).html
-    return len(title) + len(end) + 2 # "\n\n" separator
+    """Visible length of `sender._title + sender._additional`."""
+    title = getattr(sender, "_title", None)
+    end   = getattr(sender, "_additional", None)
+    return (
+        (_html_len(Raw(title).html) if title is not None else 0)
+        + (_html_len(Raw(end).html) if end is not None else 0)
+        + 2 # "\n\n" separator
+    )
 
 
 def _effective_chunk(raw_chunk: int, sender: Any) -> int:
@@ -64,23 +77,105 @@ def _effective_chunk(raw_chunk: int, sender: Any) -> int:
     return max(1, min(raw_chunk, _TG_MAX_CHARS - prefix))
 
 
-def _split_text(text: str, cfg: _TextPaginationConfig, chunk: int) -> list[str]:
-    """Split plain HTML text into pages using HTMLText.chunk."""
-    worst_overhead = (
-        len(cfg.header) + len(cfg.footer)
-        + (len(_ELLIPSIS_TOP) + 1 + len(_ELLIPSIS_BOTTOM) + 1)
-        if cfg.show_ellipsis else
-        len(cfg.header) + len(cfg.footer)
-    )
-    effective = max(1, chunk - worst_overhead)
+def _worst_overhead(cfg: _TextPaginationConfig) -> int:
+    """Visible length of header, footer and ellipsis cues around a page."""
+    overhead = _html_len(cfg.header) + _html_len(cfg.footer)
+    if cfg.show_ellipsis:
+        overhead += utf16_len(_ELLIPSIS_TOP) + 1 + utf16_len(_ELLIPSIS_BOTTOM) + 1
+    return overhead
+
+
+class _Pages:
+    """
+    Pages of a text, split only as far as the pages visited so far need:
+    a user reading the first pages of a huge text never waits for the rest.
+    """
+
+    def __init__(self, pages: list[str] | None = None, splitter: HTMLSplitter | None = None) -> None:
+        self._pages: list[str] = [] if pages is None else pages
+        self._splitter = splitter
+        self._lock = threading.Lock()
+
+    def get(self, index: int) -> str | None:
+        """Page ``index``, or ``None`` past the last page."""
+        with self._lock:
+            while len(self._pages) <= index and self._splitter is not None:
+                try:
+                    self._pages.append(next(self._splitter).strip())
+                except StopIteration:
+                    pass
+                if self._splitter.done:
+                    # the split text is not needed any more
+                    self._splitter = None
+
+            return self._pages[index] if index < len(self._pages) else None
+
+    def count(self) -> tuple[int, bool]:
+        """Number of pages and whether it is exact, not estimated from the pages split so far."""
+        with self._lock:
+            known = len(self._pages)
+            if self._splitter is None:
+                return known, True
+            progress = self._splitter.progress
+            return max(known + 1, round(known / progress) if progress else 0), False
+
+
+class _PageCache:
+    """
+    Pages of the texts shown lately, shared by all users: the same article opened
+    by many users is split once and its pages are kept once.
+    Least recently used texts are dropped past ``limit`` characters of text.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self._size: int = 0
+        self._entries: OrderedDict[tuple[str, int, int], _Pages] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[str, int, int]) -> _Pages | None:
+        with self._lock:
+            pages = self._entries.get(key)
+            if pages is not None:
+                self._entries.move_to_end(key)
+            return pages
+
+    def put(self, key: tuple[str, int, int], pages: _Pages) -> None:
+        size = len(key[0])
+        if size > self.limit:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = pages
+            self._size += size
+            while self._size > self.limit:
+                old, _ = self._entries.popitem(last=False)
+                self._size -= len(old[0])
+
+
+_PAGE_CACHE = _PageCache(8_000_000)
+
+
+def _split_text(text: str, cfg: _TextPaginationConfig, chunk: int) -> _Pages:
+    """Split plain HTML text into pages of at most *chunk* visible UTF-16 code units, lazily."""
+    effective = max(1, chunk - _worst_overhead(cfg))
     window: int | tuple[int, int] = cfg.window if cfg.window > 0 else 0
 
-    pages = list(HTMLText(text).chunk(
+    key = (text, effective, window)
+    pages = _PAGE_CACHE.get(key)
+    if pages is not None:
+        return pages
+
+    pages = _Pages(splitter=HTMLSplitter(
+        text,
         effective,
         split_at=(",", ".", "!", "?", "\n", " "),
         window=window,
     ))
-    return [str(p).strip() for p in pages]
+    _PAGE_CACHE.put(key, pages)
+    return pages
 
 
 def _split_items(
@@ -92,36 +187,40 @@ def _split_items(
     Validate each item fits in a page (with worst-case header/footer/ellipsis).
     Items that are too long are split further using the same window rules.
     """
-    worst_overhead = (
-        len(cfg.header) + len(cfg.footer)
-        + (len(_ELLIPSIS_TOP) + 1 + len(_ELLIPSIS_BOTTOM) + 1)
-        if cfg.show_ellipsis else
-        len(cfg.header) + len(cfg.footer)
-    )
-    max_item = max(1, chunk - worst_overhead)
+    max_item = max(1, chunk - _worst_overhead(cfg))
 
     window: int | tuple[int, int] = cfg.window if cfg.window > 0 else 0
 
     result: list[str] = []
     for item in items:
-        if len(HTMLText(item)) <= max_item:
+        if _html_len(item) <= max_item:
             result.append(item)
         else:
-            sub = HTMLText(item).chunk(
+            sub = split_html(
+                item,
                 max_item,
                 split_at=(",", ".", "!", "?", "\n", " "),
                 window=window,
             )
-            result.extend(str(p).strip() for p in sub)
+            result.extend(p.strip() for p in sub)
     return result
 
 
 def _hard_truncate(text: str, max_visible: int) -> str:
-    """Remove trailing visible chars until len(HTMLText(text)) <= max_visible."""
-    h = HTMLText(text)
-    if len(h) <= max_visible:
+    """Remove trailing visible chars until the visible length of *text* is <= max_visible."""
+    length = _html_len(text)
+    if length <= max_visible:
         return text
-    return str(h[:max_visible])
+
+    h    = HTMLText(text)
+    size = min(len(h), max_visible)
+    while True:
+        piece  = str(h[:size])
+        length = _html_len(piece)
+        if length <= max_visible or size == 0:
+            return piece
+        # every character takes one or two code units
+        size = max(0, min(size - 1, size * max_visible // length))
 
 
 class PaginatedText(telekit.Trait):
@@ -145,6 +244,8 @@ class PaginatedText(telekit.Trait):
         * - ``PAGINATED_TEXT_PAGE_LABEL``
           - Template for the page indicator (``{page}`` / ``{pages}``).
             ``None`` hides it.  Default: ``{page} / {pages}``.
+            A long text is split as it is read, so ``{pages}`` is an
+            estimate such as ``~12`` until the last page is split.
         * - ``PAGINATED_TEXT_TOO_LONG``
           - Message shown in place of an item that is too long to display
             **and** ``allow_split=False``.  ``None`` falls back to truncation.
@@ -180,7 +281,8 @@ class PaginatedText(telekit.Trait):
 
         :param text: Full HTML string **or** ``Iterable[str]`` of items
             (one item = one page candidate).
-        :param chunk: Target characters per chunk *before* overhead.
+        :param chunk: Target characters per chunk *before* overhead, counted as Telegram
+            does (visible UTF-16 code units, tags excluded).
             Clamped to ``min(chunk, TG_LIMIT - len(sender._title + sender._additional))``.
         :param window: Allowed shortening window for smart splits.
             ``0`` → exact hard cut.  ``N > 0`` → may be up to N chars shorter.
@@ -223,34 +325,33 @@ class PaginatedText(telekit.Trait):
         )
 
         # ── build page list ───────────────────────────────────────────────
+        pages: _Pages
         if isinstance(text, str):
+            # shared with every user viewing the same text
             pages = _split_text(text, cfg, eff_chunk)
         else:
             raw_items = list(text)
             if allow_split:
-                pages = _split_items(raw_items, cfg, eff_chunk)
+                pages = _Pages(_split_items(raw_items, cfg, eff_chunk))
             else:
                 # Replace oversized items
-                worst_overhead = (
-                    len(header) + len(footer)
-                    + (len(_ELLIPSIS_TOP) + 1 + len(_ELLIPSIS_BOTTOM) + 1)
-                    if show_ellipsis else len(header) + len(footer)
-                )
-                max_item = max(1, eff_chunk - worst_overhead)
-                pages = []
+                max_item = max(1, eff_chunk - _worst_overhead(cfg))
+                replaced: list[str] = []
                 for item in raw_items:
-                    if len(HTMLText(item)) <= max_item:
-                        pages.append(item)
+                    if _html_len(item) <= max_item:
+                        replaced.append(item)
                     elif cfg.too_long_label is not None:
-                        pages.append(cfg.too_long_label)
+                        replaced.append(cfg.too_long_label)
                     else:
-                        pages.append(_hard_truncate(item, max_item))
+                        replaced.append(_hard_truncate(item, max_item))
+                pages = _Pages(replaced)
 
-        if not pages:
+        first = pages.get(0)
+        if first is None:
             return
 
-        if len(pages) == 1:
-            body = header + pages[0] + footer
+        if pages.get(1) is None:
+            body = header + first + footer
             sender.set_message(Raw(body))
             if on_update is not None:
                 on_update()
@@ -266,18 +367,25 @@ class PaginatedText(telekit.Trait):
     def _paginated_text_render(
         self,
         page_index: int,
-        pages:      list[str],
+        pages:      _Pages,
         cfg:        _TextPaginationConfig,
         on_update:  Callable[[], Any] | None,
     ) -> None:
         if on_update is not None:
             on_update()
 
-        total = len(pages)
-        page  = page_index + 1
+        page_text = pages.get(page_index)
+        if page_text is None:
+            # picked from an estimated page count that turned out too high
+            page_index = pages.count()[0] - 1
+            page_text  = pages.get(page_index) or ""
+
+        page = page_index + 1
 
         has_back = page_index > 0
-        has_next = page_index < total - 1
+        has_next = pages.get(page_index + 1) is not None
+
+        total, exact = pages.count()
 
         # ── ellipsis cues ─────────────────────────────────────────────────
         top_ell    = (_ELLIPSIS_TOP    + "\n") if has_back and cfg.show_ellipsis else ""
@@ -288,10 +396,10 @@ class PaginatedText(telekit.Trait):
         sender      = self.chain.sender
         prefix_len  = _sender_text_len(sender)
         max_visible = _TG_MAX_CHARS - prefix_len
-        overhead    = len(cfg.header) + len(cfg.footer) + len(top_ell) + len(bottom_ell)
+        overhead    = _html_len(cfg.header) + _html_len(cfg.footer) + utf16_len(top_ell) + utf16_len(bottom_ell)
         chunk_budget = max(0, max_visible - overhead)
 
-        chunk_text = _hard_truncate(pages[page_index], chunk_budget)
+        chunk_text = _hard_truncate(page_text, chunk_budget)
 
         body = cfg.header + top_ell + chunk_text + bottom_ell + cfg.footer
         self.chain.sender.set_message(Raw(body))
@@ -303,7 +411,7 @@ class PaginatedText(telekit.Trait):
             nav[cfg.back_label] = _NavButton(page_index - 1)
 
         if cfg.page_label:
-            nav[cfg.page_label.format(page=page, pages=total)] = _PageViewButton()
+            nav[cfg.page_label.format(page=page, pages=total if exact else f"~{total}")] = _PageViewButton()
 
         if has_next:
             nav[cfg.next_label] = _NavButton(page_index + 1)
@@ -327,7 +435,7 @@ class PaginatedText(telekit.Trait):
     def _paginated_text_page_picker(
         self,
         current_index:       int,
-        pages:               list[str],
+        pages:               _Pages,
         cfg:                 _TextPaginationConfig,
         on_update:           Callable[[], Any] | None,
         current_page_index:  int | None = None,
@@ -336,7 +444,7 @@ class PaginatedText(telekit.Trait):
         if current_page_index is None:
             current_page_index = current_index
 
-        total = len(pages)
+        total, _ = pages.count()
 
         # Determine the start of the current window of 10
         window_start = (current_index // 10) * 10
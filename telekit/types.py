@@ -96,6 +96,7 @@ __all__ = [
 class ParseMode(str, Enum):
     HTML = "html"
     MARKDOWN = "markdown"
+    ENTITIES = "entities"
 
 class Effect(Enum):
     """
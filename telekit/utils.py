@@ -6,6 +6,7 @@ from urllib.parse import urlencode, quote
 from typing import Literal, Any, Iterable
 
 from .html_text import HTMLText
+from ._buildtext.escaping import escape_markdown_chars
 
 ROOT_DIR = Path(__file__).resolve().parent  # telekit/
 
@@ -496,6 +497,17 @@ class CyclicList:
 import re
 
 
+# characters that can not start markup in `TelegramMarkdownV2Sanitizer._parse`
+_PLAIN_RUN_RE = re.compile(r"[^\\`\[|_*~>]+")
+
+_LINK_RE = re.compile(r'\[((?:[^\[\]\\]|\\.)*)\]\(((?:[^()\\]|\\.)*)\)')
+
+# characters `_find_closing` has to look at, per closing token
+_CLOSING_STOPS: dict[str, re.Pattern[str]] = {
+    token: re.compile("[\\\\`" + re.escape(token[0]) + "]")
+    for token in ("||", "__", "**", "*", "_", "~")
+}
+
 class TelegramMarkdownV2Sanitizer:
     """
     Soft parser/sanitizer for Telegram MarkdownV2.
@@ -507,6 +519,10 @@ class TelegramMarkdownV2Sanitizer:
 
     If a matching closing token is not found, the character is
     treated as plain text and escaped.
+
+    Runs in linear time: nested content is parsed in place (by index bounds,
+    without copying it), and every search for a closing token continues from
+    where earlier searches for the same token stopped (see `_find_closing`).
     """
 
     # Characters that MarkdownV2 requires to be escaped in plain text
@@ -518,52 +534,74 @@ class TelegramMarkdownV2Sanitizer:
     # ---------- helper methods ----------
 
     def _escape_literal(self, ch: str) -> str:
-        if ch == '\\':
-            return '\\\\'
-        if ch in self.ESCAPE_SPECIAL:
-            return '\\' + ch
-        return ch
+        return escape_markdown_chars(ch)
 
     def _escape_plain_run(self, s: str) -> str:
-        return ''.join(self._escape_literal(c) for c in s)
+        return escape_markdown_chars(s)
 
     def _escape_code(self, s: str) -> str:
         # Inside code/pre only backslash and backtick need escaping
         return s.replace('\\', '\\\\').replace('`', '\\`')
 
-    def _find_closing(self, s: str, start: int, token: str) -> int:
+    def _find_closing(self, s: str, start: int, token: str, end: int | None = None, memo: dict[int, int] | None = None) -> int:
         """
-        Finds the nearest UNescaped occurrence of token, skipping
+        Finds the nearest UNescaped occurrence of token before `end`, skipping
         escape sequences and inline/block code spans (their content
         is considered "foreign territory" and cannot close an outer tag).
+
+        `memo` maps the positions a search stepped on to its result. A later search
+        for the same token and `end` that steps on one of them has the same result,
+        so the searches of one `_parse` call visit every position at most once.
         """
+        n = len(s) if end is None else end
+        stops = _CLOSING_STOPS.get(token) or re.compile("[\\\\`" + re.escape(token[0]) + "]")
+        visited: list[int] = []
+        result = -1
         i = start
-        n = len(s)
-        tlen = len(token)
+
         while i < n:
+            if memo is not None:
+                known = memo.get(i)
+                if known is not None:
+                    result = known
+                    break
+                visited.append(i)
+
             c = s[i]
             if c == '\\' and i + 1 < n:
                 i += 2
-                continue
-            if s[i:i + 3] == '```':
-                end = s.find('```', i + 3)
-                i = end + 3 if end != -1 else n
-                continue
-            if c == '`':
-                end = s.find('`', i + 1)
-                i = end + 1 if end != -1 else n
-                continue
-            if s[i:i + tlen] == token:
-                return i
-            i += 1
-        return -1
+            elif s.startswith('```', i, n):
+                end_code = s.find('```', i + 3, n)
+                i = end_code + 3 if end_code != -1 else n
+            elif c == '`':
+                end_code = s.find('`', i + 1, n)
+                i = end_code + 1 if end_code != -1 else n
+            elif s.startswith(token, i, n):
+                result = i
+                break
+            else:
+                # jump to the next character that may matter
+                stop = stops.search(s, i + 1, n)
+                i = stop.start() if stop is not None else n
+
+        if memo is not None:
+            for position in visited:
+                memo[position] = result
+
+        return result
 
     # ---------- main parser ----------
 
-    def _parse(self, s: str) -> str:
-        out = []
-        i = 0
-        n = len(s)
+    def _parse(self, s: str, start: int = 0, end: int | None = None) -> str:
+        out: list[str] = []
+        self._parse_into(out, s, start, len(s) if end is None else end)
+        return ''.join(out)
+
+    def _parse_into(self, out: list[str], s: str, i: int, n: int) -> None:
+        """Sanitizes `s[i:n]` into `out`, as if it was the whole text."""
+        start = i
+        # token -> memo of `_find_closing` for this range
+        memos: dict[str, dict[int, int]] = {}
 
         while i < n:
             c = s[i]
@@ -580,8 +618,8 @@ class TelegramMarkdownV2Sanitizer:
                 continue
 
             # 2. Code block ```...```
-            if s[i:i + 3] == '```':
-                end = s.find('```', i + 3)
+            if s.startswith('```', i, n):
+                end = s.find('```', i + 3, n)
                 if end != -1 and end > i + 3:
                     inner = s[i + 3:end]
                     out.append('```' + self._escape_code(inner) + '```')
@@ -593,7 +631,7 @@ class TelegramMarkdownV2Sanitizer:
 
             # 3. Inline code `...`
             if c == '`':
-                end = s.find('`', i + 1)
+                end = s.find('`', i + 1, n)
                 if end != -1 and end > i + 1:
                     inner = s[i + 1:end]
                     out.append('`' + self._escape_code(inner) + '`')
@@ -605,97 +643,60 @@ class TelegramMarkdownV2Sanitizer:
 
             # 4. Link [text](url)
             if c == '[':
-                m = re.match(r'\[((?:[^\[\]\\]|\\.)*)\]\(((?:[^()\\]|\\.)*)\)', s[i:])
+                m = _LINK_RE.match(s, i, n)
                 if m:
-                    inner_text = self._parse(m.group(1))
+                    out.append('[')
+                    self._parse_into(out, s, m.start(1), m.end(1))
                     url = m.group(2).replace('\\', '\\\\').replace(')', '\\)')
-                    out.append('[' + inner_text + '](' + url + ')')
-                    i += m.end()
-                    continue
-                out.append(self._escape_literal(c))
-                i += 1
-                continue
-
-            # 5. Spoiler ||...||
-            if s[i:i + 2] == '||':
-                close = self._find_closing(s, i + 2, '||')
-                if close != -1 and close > i + 2:
-                    out.append('||' + self._parse(s[i + 2:close]) + '||')
-                    i = close + 2
-                    continue
-                out.append(self._escape_literal('|'))
-                i += 1
-                continue
-
-            # 6. Underline __...__
-            if s[i:i + 2] == '__':
-                close = self._find_closing(s, i + 2, '__')
-                if close != -1 and close > i + 2:
-                    out.append('__' + self._parse(s[i + 2:close]) + '__')
-                    i = close + 2
-                    continue
-                out.append(self._escape_literal('_'))
-                i += 1
-                continue
-
-            # 7. Legacy **bold** (from markdown, if not adapted) -> single *
-            if s[i:i + 2] == '**':
-                close = self._find_closing(s, i + 2, '**')
-                if close != -1 and close > i + 2:
-                    out.append('*' + self._parse(s[i + 2:close]) + '*')
-                    i = close + 2
-                    continue
-                out.append(self._escape_literal('*'))
-                i += 1
-                continue
-
-            # 8. Bold *...*
-            if c == '*':
-                close = self._find_closing(s, i + 1, '*')
-                if close != -1 and close > i + 1:
-                    out.append('*' + self._parse(s[i + 1:close]) + '*')
-                    i = close + 1
+                    out.append('](' + url + ')')
+                    i = m.end()
                     continue
                 out.append(self._escape_literal(c))
                 i += 1
                 continue
 
-            # 9. Italic _..._
-            if c == '_':
-                close = self._find_closing(s, i + 1, '_')
-                if close != -1 and close > i + 1:
-                    out.append('_' + self._parse(s[i + 1:close]) + '_')
-                    i = close + 1
-                    continue
-                out.append(self._escape_literal(c))
-                i += 1
-                continue
-
-            # 10. Strikethrough ~...~
-            if c == '~':
-                close = self._find_closing(s, i + 1, '~')
-                if close != -1 and close > i + 1:
-                    out.append('~' + self._parse(s[i + 1:close]) + '~')
-                    i = close + 1
-                    continue
+            # 5-10. Spoiler ||...||, underline __...__, legacy **bold** (-> single *),
+            #       bold *...*, italic _..._, strikethrough ~...~
+            if c in '|_*~':
+                # a failed double token is a literal, it is not tried as a single one
+                token = c + c if c != '~' and s.startswith(c + c, i, n) else c
+                if token != '|':
+                    memo = memos.get(token)
+                    if memo is None:
+                        memo = memos[token] = {}
+                    close = self._find_closing(s, i + len(token), token, n, memo)
+                    if close != -1 and close > i + len(token):
+                        marker = '*' if token == '**' else token
+                        out.append(marker)
+                        self._parse_into(out, s, i + len(token), close)
+                        out.append(marker)
+                        i = close + len(token)
+                        continue
                 out.append(self._escape_literal(c))
                 i += 1
                 continue
 
             # 11. Quote > (only at the start of a line)
-            if c == '>' and (i == 0 or s[i - 1] == '\n'):
-                end = s.find('\n', i)
+            if c == '>' and (i == start or s[i - 1] == '\n'):
+                end = s.find('\n', i, n)
                 end = end if end != -1 else n
-                out.append('>' + self._parse(s[i + 1:end]))
+                # the content of a quote starts a line too: ">>x" is a quote in a quote
+                j = i + 1
+                while j < end and s[j] == '>':
+                    j += 1
+                out.append('>' * (j - i))
+                self._parse_into(out, s, j, end)
                 i = end
                 continue
 
-            # 12. Regular character
-            out.append(self._escape_literal(c))
-            i += 1
-
-        return ''.join(out)
-
+            # 12. Regular characters, up to the next one that may start markup
+            run = _PLAIN_RUN_RE.match(s, i, n)
+            if run is None:
+                out.append(self._escape_literal(c))
+                i += 1
+            else:
+                out.append(self._escape_plain_run(run.group()))
+                i = run.end()
 
 def sanitize_markdown(text: str) -> str:
     """Backward-compatible wrapper function."""
@@ -0,0 +1,108 @@
+"""
+Deterministic corpus of random ``TextEntity`` trees.
+
+The trees mix every style, separators that are entities themselves,
+disabled and non-escaping nodes, ``TextBuilder`` parts and ``+``
+concatenations, so the golden files under ``tests/golden`` pin down the
+rendered output of the whole formatter.
+
+Regenerate the golden files (only when an output change is intended)::
+
+    PYTHONPATH=. python tests/formatter_corpus.py
+"""
+
+import random
+from pathlib import Path
+
+from telekit.styles import *
+from telekit._text_builder import TextBuilder
+
+GOLDEN_DIR = Path(__file__).resolve().parent / "golden"
+PARSE_MODES = {"html": "html", "markdown": "markdown", "none": None}
+SIZE = 500
+SEED = 1
+
+WORDS = [
+    "hi", "<b>x</b>", "a_b*c", "line\nnext", "1.5!", "emoji😀", "[x](y)",
+    "\\*", "&amp;", "`code`", "", "tab\t", "q'\"", ">quote", "a\\b",
+]
+
+def _leaf(r: random.Random):
+    return r.choice(WORDS) if r.random() < 0.8 else r.randint(-5, 500)
+
+def _node(r: random.Random, depth: int):
+    if depth <= 0 or r.random() < 0.3:
+        return _leaf(r)
+
+    kids = [_node(r, depth - 1) for _ in range(r.randint(0, 4))]
+    kw = dict(escape=r.random() < 0.8, enabled=r.random() < 0.85)
+    sep = r.choice(["", " ", "\n", ", "]) if r.random() < 0.7 else Bold("|")
+
+    match r.randrange(17):
+        case 0: return Bold(*kids, sep=sep, **kw)
+        case 1: return Italic(*kids, sep=sep, **kw)
+        case 2: return Underline(*kids, sep=sep, **kw)
+        case 3: return Strikethrough(*kids, sep=sep, **kw)
+        case 4: return Code(*kids, sep=sep, **kw)
+        case 5: return Language(*kids, lang="js", sep=sep, **kw)
+        case 6: return Spoiler(*kids, sep=sep, **kw)
+        case 7:
+            expandable = r.random() < 0.5
+            end = r.choice(["\n", "", "!"])
+            return Quote(*kids, expandable=expandable, end=end, sep=sep, **kw)
+        case 8: return Escape(*kids, sep=sep)
+        case 9: return Raw(*kids, sep=sep)
+        case 10: return Link(*kids, url="https://e.com/?a=1&b=2", sep=sep, **kw)
+        case 11: return Mention(*kids, user_id=42, sep=sep, **kw)
+        case 12:
+            start = r.choice(["{{index}}. ", "• ", "<{{index}}>"])
+            end = r.choice(["", ".", Italic("e")])
+            return Stack(*kids, start=start, sep=sep, end=end, **kw)
+        case 13: return Group(*kids, sep=sep, **kw)
+        case 14: return EncodeURL(*[k for k in kids if not isinstance(k, TextEntity)])
+        case 15:
+            builder = TextBuilder(sep=r.choice(["", "\n"]))
+            for kid in kids:
+                if isinstance(kid, TextEntity):
+                    builder.add(kid)
+                else:
+                    builder.add_bold(str(kid))
+            builder.newln()
+            return builder
+
+    a, b = _node(r, depth - 1), _node(r, depth - 1)
+    if isinstance(a, TextEntity) or isinstance(b, TextEntity):
+        try:
+            return a + b
+        except TypeError:
+            return Group(a, b)
+    return Group(a, b)
+
+def corpus(size: int = SIZE, seed: int = SEED) -> list[TextEntity]:
+    """Build ``size`` random trees; the same seed always gives the same trees."""
+    r = random.Random(seed)
+    trees = []
+    for _ in range(size):
+        tree = _node(r, r.randint(1, 6))
+        trees.append(tree if isinstance(tree, TextEntity) else Group(tree))
+    return trees
+
+def render_line(tree: TextEntity, parse_mode: str | None) -> str:
+    """One golden line: the ``repr`` of the output, or the error it raised."""
+    try:
+        return repr(tree.render(parse_mode))
+    except Exception as e:
+        return f"ERR {type(e).__name__}: {e}"
+
+def golden_path(name: str) -> Path:
+    return GOLDEN_DIR / f"formatter.{name}.txt"
+
+def main() -> None:
+    GOLDEN_DIR.mkdir(exist_ok=True)
+    trees = corpus()
+    for name, parse_mode in PARSE_MODES.items():
+        lines = [render_line(tree, parse_mode) for tree in trees]
+        golden_path(name).write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""
+The MarkdownV2 sanitizer as it was before it became linear-time.
+
+It rescans the rest of the text for every opening token, so it is
+quadratic and recurses once per nesting level, but its output is the
+reference: ``test_markdown_sanitizer.py`` fuzzes the current sanitizer
+against it. Test-only; do not import it from ``telekit``.
+"""
+
+import re
+
+from telekit._buildtext.escaping import escape_markdown_chars
+
+# characters that can not start markup in `OldTelegramMarkdownV2Sanitizer._parse`
+_PLAIN_RUN_RE = re.compile(r"[^\\`\[|_*~>]+")
+
+class OldTelegramMarkdownV2Sanitizer:
+    """
+    Soft parser/sanitizer for Telegram MarkdownV2.
+
+    Idea: scan the text left to right, recognize valid (i.e. correctly
+    CLOSED) markup tags (*bold*, _italic_, __underline__,
+    ~strike~, ||spoiler||, `code`, ```pre```, [text](url), >quote),
+    recursively sanitize their content and leave the markup unescaped.
+
+    If a matching closing token is not found, the character is
+    treated as plain text and escaped.
+    """
+
+    # Characters that MarkdownV2 requires to be escaped in plain text
+    ESCAPE_SPECIAL = r'_*[]()~`>#+-=|{}.!'
+
+    def sanitize(self, text: str) -> str:
+        return self._parse(text)
+
+    # ---------- helper methods ----------
+
+    def _escape_literal(self, ch: str) -> str:
+        return escape_markdown_chars(ch)
+
+    def _escape_plain_run(self, s: str) -> str:
+        return escape_markdown_chars(s)
+
+    def _escape_code(self, s: str) -> str:
+        # Inside code/pre only backslash and backtick need escaping
+        return s.replace('\\', '\\\\').replace('`', '\\`')
+
+    def _find_closing(self, s: str, start: int, token: str) -> int:
+        """
+        Finds the nearest UNescaped occurrence of token, skipping
+        escape sequences and inline/block code spans (their content
+        is considered "foreign territory" and cannot close an outer tag).
+        """
+        i = start
+        n = len(s)
+        tlen = len(token)
+        while i < n:
+            c = s[i]
+            if c == '\\' and i + 1 < n:
+                i += 2
+                continue
+            if s[i:i + 3] == '```':
+                end = s.find('```', i + 3)
+                i = end + 3 if end != -1 else n
+                continue
+            if c == '`':
+                end = s.find('`', i + 1)
+                i = end + 1 if end != -1 else n
+                continue
+            if s[i:i + tlen] == token:
+                return i
+            i += 1
+        return -1
+
+    # ---------- main parser ----------
+
+    def _parse(self, s: str) -> str:
+        out = []
+        i = 0
+        n = len(s)
+
+        while i < n:
+            c = s[i]
+
+            # 1. Already escaped character - leave as is
+            if c == '\\':
+                if i + 1 < n and (s[i + 1] in self.ESCAPE_SPECIAL or s[i + 1] == '\\'):
+                    out.append('\\' + s[i + 1])
+                    i += 2
+                else:
+                    # "bare" backslash at the end of the string or before a non-special char
+                    out.append('\\\\')
+                    i += 1
+                continue
+
+            # 2. Code block ```...```
+            if s[i:i + 3] == '```':
+                end = s.find('```', i + 3)
+                if end != -1 and end > i + 3:
+                    inner = s[i + 3:end]
+                    out.append('```' + self._escape_code(inner) + '```')
+                    i = end + 3
+                    continue
+                out.append(self._escape_literal(c))
+                i += 1
+                continue
+
+            # 3. Inline code `...`
+            if c == '`':
+                end = s.find('`', i + 1)
+                if end != -1 and end > i + 1:
+                    inner = s[i + 1:end]
+                    out.append('`' + self._escape_code(inner) + '`')
+                    i = end + 1
+                    continue
+                out.append(self._escape_literal(c))
+                i += 1
+                continue
+
+            # 4. Link [text](url)
+            if c == '[':
+                m = re.match(r'\[((?:[^\[\]\\]|\\.)*)\]\(((?:[^()\\]|\\.)*)\)', s[i:])
+                if m:
+                    inner_text = self._parse(m.group(1))
+                    url = m.group(2).replace('\\', '\\\\').replace(')', '\\)')
+                    out.append('[' + inner_text + '](' + url + ')')
+                    i += m.end()
+                    continue
+                out.append(self._escape_literal(c))
+                i += 1
+                continue
+
+            # 5. Spoiler ||...||
+            if s[i:i + 2] == '||':
+                close = self._find_closing(s, i + 2, '||')
+                if close != -1 and close > i + 2:
+                    out.append('||' + self._parse(s[i + 2:close]) + '||')
+                    i = close + 2
+                    continue
+                out.append(self._escape_literal('|'))
+                i += 1
+                continue
+
+            # 6. Underline __...__
+            if s[i:i + 2] == '__':
+                close = self._find_closing(s, i + 2, '__')
+                if close != -1 and close > i + 2:
+                    out.append('__' + self._parse(s[i + 2:close]) + '__')
+                    i = close + 2
+                    continue
+                out.append(self._escape_literal('_'))
+                i += 1
+                continue
+
+            # 7. Legacy **bold** (from markdown, if not adapted) -> single *
+            if s[i:i + 2] == '**':
+                close = self._find_closing(s, i + 2, '**')
+                if close != -1 and close > i + 2:
+                    out.append('*' + self._parse(s[i + 2:close]) + '*')
+                    i = close + 2
+                    continue
+                out.append(self._escape_literal('*'))
+                i += 1
+                continue
+
+            # 8. Bold *...*
+            if c == '*':
+                close = self._find_closing(s, i + 1, '*')
+                if close != -1 and close > i + 1:
+                    out.append('*' + self._parse(s[i + 1:close]) + '*')
+                    i = close + 1
+                    continue
+                out.append(self._escape_literal(c))
+                i += 1
+                continue
+
+            # 9. Italic _..._
+            if c == '_':
+                close = self._find_closing(s, i + 1, '_')
+                if close != -1 and close > i + 1:
+                    out.append('_' + self._parse(s[i + 1:close]) + '_')
+                    i = close + 1
+                    continue
+                out.append(self._escape_literal(c))
+                i += 1
+                continue
+
+            # 10. Strikethrough ~...~
+            if c == '~':
+                close = self._find_closing(s, i + 1, '~')
+                if close != -1 and close > i + 1:
+                    out.append('~' + self._parse(s[i + 1:close]) + '~')
+                    i = close + 1
+                    continue
+                out.append(self._escape_literal(c))
+                i += 1
+                continue
+
+            # 11. Quote > (only at the start of a line)
+            if c == '>' and (i == 0 or s[i - 1] == '\n'):
+                end = s.find('\n', i)
+                end = end if end != -1 else n
+                out.append('>' + self._parse(s[i + 1:end]))
+                i = end
+                continue
+
+            # 12. Regular characters, up to the next one that may start markup
+            run = _PLAIN_RUN_RE.match(s, i)
+            if run is None:
+                out.append(self._escape_literal(c))
+                i += 1
+            else:
+                out.append(self._escape_plain_run(run.group()))
+                i = run.end()
+
+        return ''.join(out)
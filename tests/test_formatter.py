@@ -0,0 +1,66 @@
+import pytest
+
+from formatter_corpus import PARSE_MODES, corpus, golden_path, render_line
+from telekit.styles import *
+
+TREES = corpus()
+
+@pytest.mark.parametrize("name", PARSE_MODES)
+def test_golden_output(name: str):
+    parse_mode = PARSE_MODES[name]
+    expected = golden_path(name).read_text(encoding="utf-8").splitlines()
+    assert len(expected) == len(TREES)
+
+    for i, (tree, line) in enumerate(zip(TREES, expected)):
+        assert render_line(tree, parse_mode) == line, f"tree #{i}"
+
+@pytest.mark.parametrize("name", PARSE_MODES)
+def test_golden_output_is_stable_across_renders(name: str):
+    # rendering twice goes through the memoized path for frozen subtrees
+    parse_mode = PARSE_MODES[name]
+    expected = golden_path(name).read_text(encoding="utf-8").splitlines()
+
+    for i, (tree, line) in enumerate(zip(TREES, expected)):
+        render_line(tree, parse_mode)
+        assert render_line(tree, parse_mode) == line, f"tree #{i}"
+
+def test_shared_subtree_renders_the_same_everywhere():
+    shared = Bold("a<b>", Italic("c_d"))
+    message = Group(shared, Quote(shared), Stack(shared, shared), sep="\n")
+
+    assert message.render("html") == (
+        "<b>a&lt;b&gt;<i>c_d</i></b>\n"
+        "<blockquote><b>a&lt;b&gt;<i>c_d</i></b></blockquote>\n"
+        "\n\n"
+        "1. <b>a&lt;b&gt;<i>c_d</i></b>\n"
+        "2. <b>a&lt;b&gt;<i>c_d</i></b>\n"
+    )
+
+def test_frozen_tree_is_rendered_once(monkeypatch: pytest.MonkeyPatch):
+    writes: list[str] = []
+    write_entity = Bold._write_entity
+
+    def counting(self, out, parse_mode):
+        writes.append(parse_mode)
+        write_entity(self, out, parse_mode)
+
+    monkeypatch.setattr(Bold, "_write_entity", counting)
+    tree = Group(Bold("a"), Italic("b"))
+
+    for _ in range(4):
+        hash(tree)
+    assert writes == ["html"]
+
+def test_output_of_mutable_leaves_is_not_kept():
+    class Counter:
+        value = 0
+
+        def __str__(self) -> str:
+            return str(self.value)
+
+    counter = Counter()
+    tree = Group(Bold(counter))
+
+    assert tree.html == "<b>0</b>"
+    counter.value = 1
+    assert tree.html == "<b>1</b>"
@@ -0,0 +1,39 @@
+import random
+
+import pytest
+
+from markdown_sanitizer_oracle import OldTelegramMarkdownV2Sanitizer
+from telekit.utils import TelegramMarkdownV2Sanitizer, sanitize_markdown
+
+# markup tokens are over-represented so that most inputs nest and interleave
+ALPHABET = list("ab \n\\`*_~|[]()>!.#") + ["```", "**", "__", "||", "\\\\", "[a](b)", "😀"]
+
+def random_texts(seed: int, count: int, max_tokens: int):
+    r = random.Random(seed)
+    for _ in range(count):
+        yield "".join(r.choice(ALPHABET) for _ in range(r.randint(0, max_tokens)))
+
+@pytest.mark.parametrize("seed", range(4))
+def test_matches_old_sanitizer(seed: int):
+    old, new = OldTelegramMarkdownV2Sanitizer(), TelegramMarkdownV2Sanitizer()
+    for text in random_texts(seed, 2000, 300):
+        assert new.sanitize(text) == old.sanitize(text), text
+
+@pytest.mark.parametrize("text, expected", [
+    ("*bold* and _italic_", "*bold* and _italic_"),
+    ("*unclosed", "\\*unclosed"),
+    ("a.b!", "a\\.b\\!"),
+    ("`x*y`", "`x*y`"),
+    ("[text](https://e.com)", "[text](https://e.com)"),
+])
+def test_known_outputs(text: str, expected: str):
+    assert sanitize_markdown(text) == expected
+
+@pytest.mark.parametrize("unit, closing", [
+    ("*a _b ~c ||", "|| ~ _ *"),
+    ("[a", "](b)"),
+    ("`a ```b ", "``` `"),
+])
+def test_matches_old_sanitizer_on_deep_nesting(unit: str, closing: str):
+    text = unit * 300 + "x" + closing * 300
+    assert sanitize_markdown(text) == OldTelegramMarkdownV2Sanitizer().sanitize(text)